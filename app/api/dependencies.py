@@ -9,8 +9,11 @@ from sqlalchemy import select
 from sqlalchemy.orm import Session
 
 from app.core.jwt_handler import decode_access_token
+from app.core.principal_cache import principal_cache
 from app.db.session import get_db
 from app.models.auth.user import User
+from app.schemas.user import Principal
+from app.services.workspace_service import ensure_workspace_role
 
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/auth/login")
 
@@ -18,9 +21,15 @@ oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/auth/login")
 def get_current_user(
     db: Session = Depends(get_db),
     token: str = Depends(oauth2_scheme),
-) -> User:
+) -> Principal:
     """Returns the current authenticated user."""
 
+    return authenticate_token(db, token)
+
+
+def authenticate_token(db: Session, token: str) -> Principal:
+    """Resolve an access token to an active user, or raise a 401."""
+
     credential_exception = HTTPException(
         status_code=status.HTTP_401_UNAUTHORIZED,
         detail="Could not verify credentials.",
@@ -37,10 +46,37 @@ def get_current_user(
     except JWTError as error:
         raise credential_exception from error
 
-    stmt = select(User).where(User.id == UUID(sub))
+    user_id = UUID(sub)
+
+    principal = principal_cache.get(user_id)
+    if principal is not None:
+        return principal
+
+    epoch = principal_cache.epoch
+
+    stmt = select(User).where(User.id == user_id)
     user = db.execute(stmt).scalars().first()
 
     if user is None or not user.is_active:
         raise credential_exception
 
-    return user
+    principal = Principal.model_validate(user)
+    principal_cache.set(principal, epoch)
+
+    return principal
+
+
+def require_workspace_role(minimum: str):
+    """Build a dependency resolving the caller role in the path workspace.
+
+    The role comes from the role cache, so a warm check costs no query.
+    """
+
+    def dependency(
+        workspace_id: UUID,
+        db: Session = Depends(get_db),
+        current_user: Principal = Depends(get_current_user),
+    ) -> str:
+        return ensure_workspace_role(db, current_user.id, workspace_id, minimum)
+
+    return dependency
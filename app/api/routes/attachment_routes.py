@@ -0,0 +1,102 @@
+"""Import necessary libraries for endpoints creation."""
+
+from uuid import UUID
+
+from fastapi import APIRouter, Depends, Query, Request, status
+from sqlalchemy.orm import Session
+from starlette.concurrency import run_in_threadpool
+
+from app.api.dependencies import get_current_user
+from app.core.storage import (
+    StorageBackend,
+    check_declared_size,
+    get_storage,
+    object_response,
+    save_stream,
+)
+from app.db.session import get_db
+from app.schemas.attachment import AttachmentOut
+from app.schemas.user import Principal
+from app.services.attachment_service import (
+    check_upload_access,
+    create_attachment,
+    get_attachment_for_user,
+    list_attachments,
+)
+
+router = APIRouter(tags=["attachments"])
+
+
+@router.post(
+    "/tasks/{task_id}/attachments",
+    response_model=AttachmentOut,
+    status_code=status.HTTP_201_CREATED,
+)
+async def upload(
+    task_id: UUID,
+    request: Request,
+    filename: str = Query(min_length=1, max_length=255),
+    db: Session = Depends(get_db),
+    current_user: Principal = Depends(get_current_user),
+    storage: StorageBackend = Depends(get_storage),
+):
+    """Upload the request body as a file attached to a task, streaming it."""
+
+    check_declared_size(request.headers.get("content-length"))
+
+    await run_in_threadpool(check_upload_access, db, current_user.id, task_id)
+    stored = await save_stream(storage, request.stream())
+
+    return await run_in_threadpool(
+        create_attachment,
+        db,
+        current_user.id,
+        task_id,
+        filename,
+        request.headers.get("content-type"),
+        stored,
+    )
+
+
+@router.get("/tasks/{task_id}/attachments", response_model=list[AttachmentOut])
+def list_all(
+    task_id: UUID,
+    db: Session = Depends(get_db),
+    current_user: Principal = Depends(get_current_user),
+):
+    """List the attachments of a task."""
+
+    return list_attachments(db, current_user.id, task_id)
+
+
+@router.get("/attachments/{attachment_id}", response_model=AttachmentOut)
+def get_one(
+    attachment_id: UUID,
+    db: Session = Depends(get_db),
+    current_user: Principal = Depends(get_current_user),
+):
+    """Get attachment metadata."""
+
+    return get_attachment_for_user(db, current_user.id, attachment_id)
+
+
+@router.get("/attachments/{attachment_id}/content")
+def download(
+    attachment_id: UUID,
+    request: Request,
+    db: Session = Depends(get_db),
+    current_user: Principal = Depends(get_current_user),
+    storage: StorageBackend = Depends(get_storage),
+):
+    """Download an attachment, supporting Range and ETag revalidation."""
+
+    attachment = get_attachment_for_user(db, current_user.id, attachment_id)
+
+    return object_response(
+        storage,
+        request,
+        attachment.storage_key,
+        attachment.size_bytes,
+        attachment.content_type,
+        attachment.filename,
+    )
@@ -1,34 +1,56 @@
 """Import necessary libraries for endpoints creation."""
 
-from fastapi import APIRouter, Depends, status
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Depends, Request, Response, status
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.api.dependencies import get_current_user
-from app.db.session import get_db
-from app.models.auth.user import User
-from app.schemas.user import Token, UserCreate, UserLogin, UserOut
+from app.core.conditional import Validators, conditional_response, weak_etag
+from app.core.rate_limit import rate_limiter
+from app.db.session import get_async_db
+from app.schemas.user import Principal, Token, UserCreate, UserLogin, UserOut
 from app.services.auth_service import login_user, register_user
 
 router = APIRouter(tags=["auth"])
 
+auth_rate_limit = rate_limiter.limit()
 
-@router.post("/register", response_model=UserOut, status_code=status.HTTP_201_CREATED)
-def register(payload: UserCreate, db: Session = Depends(get_db)):
+
+@router.post(
+    "/register",
+    response_model=UserOut,
+    status_code=status.HTTP_201_CREATED,
+    dependencies=[Depends(auth_rate_limit)],
+)
+async def register(payload: UserCreate, db: AsyncSession = Depends(get_async_db)):
     """Register user."""
 
-    user = register_user(db, payload)
-    return user
+    user = await register_user(db, payload)
+    return UserOut.from_row(user)
 
 
-@router.post("/login", response_model=Token)
-def login(payload: UserLogin, db: Session = Depends(get_db)):
+@router.post("/login", response_model=Token, dependencies=[Depends(auth_rate_limit)])
+async def login(payload: UserLogin, db: AsyncSession = Depends(get_async_db)):
     """Log In user."""
 
-    return login_user(db, payload.email, payload.password)
+    return await login_user(db, payload.email, payload.password)
 
 
 @router.get("/me", response_model=UserOut)
-def me(current_user: User = Depends(get_current_user)):
-    """Uses dependency to get the current user."""
+def me(
+    request: Request,
+    response: Response,
+    current_user: Principal = Depends(get_current_user),
+):
+    """Uses dependency to get the current user, or 304 when unchanged."""
+
+    validators = Validators(
+        etag=weak_etag(
+            "user", current_user.id, current_user.email, current_user.username
+        ),
+        last_modified=current_user.updated_at,
+    )
+    not_modified = conditional_response(request, response, validators)
+    if not_modified is not None:
+        return not_modified
 
     return current_user
@@ -0,0 +1,75 @@
+"""Import necessary libraries for endpoints creation."""
+
+from uuid import UUID
+
+from fastapi import APIRouter, Depends, Query, Request, Response, status
+from sqlalchemy.orm import Session
+
+from app.api.dependencies import get_current_user
+from app.core.conditional import conditional_response, has_preconditions
+from app.db.session import get_db
+from app.schemas.comment import CommentCreate, CommentOut, CommentPage, CommentUpdate
+from app.schemas.user import Principal
+from app.services.comment_service import (
+    create_comment,
+    get_comment_list_validators,
+    get_comment_page_validators,
+    list_comments,
+    update_comment,
+)
+
+router = APIRouter(tags=["comments"])
+
+
+@router.get("/tasks/{task_id}/comments", response_model=CommentPage)
+def list_all(
+    task_id: UUID,
+    request: Request,
+    response: Response,
+    cursor: str | None = None,
+    limit: int = Query(default=50, ge=1, le=200),
+    db: Session = Depends(get_db),
+    current_user: Principal = Depends(get_current_user),
+):
+    """List the comments of a task with keyset pagination, or answer 304."""
+
+    if has_preconditions(request):
+        validators = get_comment_list_validators(
+            db, current_user.id, task_id, cursor=cursor, limit=limit
+        )
+        not_modified = conditional_response(request, response, validators)
+        if not_modified is not None:
+            return not_modified
+
+    page = list_comments(db, current_user.id, task_id, cursor=cursor, limit=limit)
+    response.headers.update(get_comment_page_validators(task_id, page).headers)
+
+    return page
+
+
+@router.post(
+    "/tasks/{task_id}/comments",
+    response_model=CommentOut,
+    status_code=status.HTTP_201_CREATED,
+)
+def create(
+    task_id: UUID,
+    payload: CommentCreate,
+    db: Session = Depends(get_db),
+    current_user: Principal = Depends(get_current_user),
+):
+    """Post comment."""
+
+    return create_comment(db, current_user.id, task_id, payload)
+
+
+@router.patch("/comments/{comment_id}", response_model=CommentOut)
+def update(
+    comment_id: UUID,
+    payload: CommentUpdate,
+    db: Session = Depends(get_db),
+    current_user: Principal = Depends(get_current_user),
+):
+    """Edit comment."""
+
+    return update_comment(db, current_user.id, comment_id, payload)
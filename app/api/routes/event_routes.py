@@ -0,0 +1,180 @@
+"""Import necessary libraries for endpoints creation."""
+
+import asyncio
+from collections.abc import Awaitable, Callable
+from uuid import UUID
+
+from fastapi import (
+    APIRouter,
+    Depends,
+    HTTPException,
+    WebSocket,
+    WebSocketDisconnect,
+    status,
+)
+from fastapi.responses import StreamingResponse
+from sqlalchemy.orm import Session
+from starlette.concurrency import run_in_threadpool
+
+from app.api.dependencies import (
+    authenticate_token,
+    get_current_user,
+    require_workspace_role,
+)
+from app.core.domain_errors import DomainError
+from app.core.events import (
+    AccessRevoked,
+    SlowConsumer,
+    encode_batch,
+    event_hub,
+    sse_stream,
+    watch,
+)
+from app.core.role_cache import role_cache
+from app.db.session import get_db
+from app.schemas.user import Principal
+from app.services.workspace_service import ensure_workspace_role
+
+router = APIRouter(tags=["events"])
+
+# Helpers
+
+
+def access_checker(
+    db: Session, user_id: UUID, workspace_id: UUID
+) -> Callable[[bool], Awaitable[bool]]:
+    """Build the membership re-check of a stream, on the session of the stream.
+
+    After a membership change, possibly made on another worker, the cached
+    roles of the workspace are skipped. The session is released after every
+    check.
+    """
+
+    def check(membership_changed: bool) -> bool:
+        if membership_changed:
+            role_cache.invalidate_workspace(workspace_id)
+
+        try:
+            ensure_workspace_role(db, user_id, workspace_id)
+        except DomainError:
+            return False
+        finally:
+            db.rollback()
+
+        return True
+
+    async def check_access(membership_changed: bool) -> bool:
+        return await run_in_threadpool(check, membership_changed)
+
+    return check_access
+
+
+async def forward_changes(
+    websocket: WebSocket,
+    workspace_id: UUID,
+    check_access: Callable[[bool], Awaitable[bool]],
+) -> None:
+    """Send the change batches of a workspace until the subscriber is dropped."""
+
+    with event_hub.subscribe(workspace_id) as subscription:
+        try:
+            async for batch in watch(subscription, check_access):
+                if not batch:
+                    await websocket.send_text('{"type":"ping"}')
+                    continue
+
+                await websocket.send_text(
+                    '{"type":"changes","events":' + encode_batch(batch).decode() + "}"
+                )
+        except SlowConsumer:
+            await websocket.send_text('{"type":"resync"}')
+            await websocket.close(code=status.WS_1013_TRY_AGAIN_LATER)
+        except AccessRevoked:
+            await websocket.send_text('{"type":"revoked"}')
+            await websocket.close(code=status.WS_1008_POLICY_VIOLATION)
+
+
+async def wait_disconnect(websocket: WebSocket) -> None:
+    """Return once the client closed the socket, ignoring what it sends."""
+
+    while (await websocket.receive())["type"] != "websocket.disconnect":
+        pass
+
+
+# Endpoints
+
+
+@router.get("/{workspace_id}/events")
+async def stream_events(
+    workspace_id: UUID,
+    db: Session = Depends(get_db),
+    current_user: Principal = Depends(get_current_user),
+    _role: str = Depends(require_workspace_role("viewer")),
+):
+    """Stream the task and comment changes of a workspace as Server-Sent Events.
+
+    Each message is a coalesced batch, a `resync` event tells a client that
+    fell behind to refetch instead. Membership is checked again while the
+    stream is open, a `revoked` event ends it once the caller was removed.
+    """
+
+    await run_in_threadpool(db.rollback)
+    check_access = access_checker(db, current_user.id, workspace_id)
+
+    async def events():
+        with event_hub.subscribe(workspace_id) as subscription:
+            async for chunk in sse_stream(subscription, check_access):
+                yield chunk
+
+    return StreamingResponse(
+        events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+@router.websocket("/{workspace_id}/events/ws")
+async def events_socket(
+    websocket: WebSocket,
+    workspace_id: UUID,
+    token: str,
+    db: Session = Depends(get_db),
+):
+    """Push the task and comment changes of a workspace over a WebSocket.
+
+    Browsers cannot set headers on WebSockets, so the access token comes as
+    the `token` query parameter.
+    """
+
+    try:
+        principal = await run_in_threadpool(authenticate_token, db, token)
+        await run_in_threadpool(ensure_workspace_role, db, principal.id, workspace_id)
+    except (HTTPException, DomainError):
+        await websocket.close(code=status.WS_1008_POLICY_VIOLATION)
+        return
+    finally:
+        await run_in_threadpool(db.rollback)
+
+    await websocket.accept()
+
+    tasks = [
+        asyncio.create_task(
+            forward_changes(
+                websocket,
+                workspace_id,
+                access_checker(db, principal.id, workspace_id),
+            )
+        ),
+        asyncio.create_task(wait_disconnect(websocket)),
+    ]
+
+    try:
+        done, _ = await asyncio.wait(tasks, return_when=asyncio.FIRST_COMPLETED)
+    finally:
+        for task in tasks:
+            task.cancel()
+
+    for task in done:
+        error = task.exception()
+        if error is not None and not isinstance(error, WebSocketDisconnect):
+            raise error
@@ -1,10 +1,11 @@
 """Import necessary libraries for endpoints creation."""
 
 from fastapi import APIRouter, Depends
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.config import settings
-from app.db.session import get_db
+from app.core.rate_limit import rate_limiter
+from app.db.session import get_async_db
 from app.schemas.password_reset import (
     ForgotPasswordRequest,
     ResetPasswordRequest,
@@ -16,14 +17,16 @@ from app.services.password_reset_service import (
     verify_reset_code_service,
 )
 
-router = APIRouter(tags=["auth"])
+router = APIRouter(tags=["auth"], dependencies=[Depends(rate_limiter.limit())])
 
 
 @router.post("/forgot-password")
-def forgot_password(payload: ForgotPasswordRequest, db: Session = Depends(get_db)):
+async def forgot_password(
+    payload: ForgotPasswordRequest, db: AsyncSession = Depends(get_async_db)
+):
     """Send password reset code."""
 
-    code = request_password_reset(db, payload)
+    code = await request_password_reset(db, payload)
 
     if settings.ENVIRONMENT == "development":
         return {"message": "Reset code sent", "debug_code": code}
@@ -32,16 +35,20 @@ def forgot_password(payload: ForgotPasswordRequest, db: Session = Depends(get_db
 
 
 @router.post("/verify-reset-code")
-def verify_reset_code(payload: VerifyResetCodeRequest, db: Session = Depends(get_db)):
+async def verify_reset_code(
+    payload: VerifyResetCodeRequest, db: AsyncSession = Depends(get_async_db)
+):
     """Verify password reset code."""
 
-    verify_reset_code_service(db, payload)
+    await verify_reset_code_service(db, payload)
     return {"message": "Code is valid."}
 
 
 @router.post("/reset-password")
-def reset_password(payload: ResetPasswordRequest, db: Session = Depends(get_db)):
+async def reset_password(
+    payload: ResetPasswordRequest, db: AsyncSession = Depends(get_async_db)
+):
     """Reset user password."""
 
-    reset_password_service(db, payload)
+    await reset_password_service(db, payload)
     return {"message": "Password updated successfully"}
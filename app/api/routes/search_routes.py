@@ -0,0 +1,37 @@
+"""Import necessary libraries for endpoints creation."""
+
+from uuid import UUID
+
+from fastapi import APIRouter, Depends, Query
+from sqlalchemy.orm import Session
+
+from app.api.dependencies import get_current_user
+from app.db.session import get_db
+from app.schemas.search import SearchPage
+from app.schemas.user import Principal
+from app.services.search_service import search
+
+router = APIRouter(tags=["search"])
+
+
+@router.get("", response_model=SearchPage)
+def search_workspace(
+    workspace_id: UUID,
+    q: str = Query(min_length=1, max_length=200),
+    cursor: str | None = None,
+    limit: int = Query(default=20, ge=1, le=100),
+    highlight: bool = True,
+    db: Session = Depends(get_db),
+    current_user: Principal = Depends(get_current_user),
+):
+    """Search the tasks and comments of a workspace, best matches first."""
+
+    return search(
+        db,
+        current_user.id,
+        workspace_id,
+        q,
+        cursor=cursor,
+        limit=limit,
+        highlight=highlight,
+    )
@@ -0,0 +1,204 @@
+"""Import necessary libraries for endpoints creation."""
+
+from datetime import date
+from uuid import UUID
+
+from fastapi import APIRouter, Depends, Query, Request, Response, status
+from sqlalchemy.orm import Session
+
+from app.api.dependencies import get_current_user
+from app.core.conditional import conditional_response, has_preconditions
+from app.db.session import get_db
+from app.schemas.task import (
+    CalendarEntry,
+    TaskBulkRequest,
+    TaskBulkResult,
+    TaskCounts,
+    TaskCreate,
+    TaskOut,
+    TaskPage,
+    TaskStatus,
+    TaskTreeNode,
+    TaskUpdate,
+)
+from app.schemas.user import Principal
+from app.services.task_bulk_service import run_bulk_operations
+from app.services.task_count_service import get_task_counts_for_user
+from app.services.task_service import (
+    MAX_TREE_DEPTH,
+    create_task,
+    delete_task,
+    get_task_ancestors,
+    get_task_for_user,
+    get_task_list_validators,
+    get_task_page_validators,
+    get_task_tree,
+    get_task_validators,
+    list_calendar,
+    list_tasks,
+    task_out,
+    update_task,
+)
+
+router = APIRouter(tags=["tasks"])
+
+MAX_TAG_FILTERS = 20
+
+
+@router.post("", response_model=TaskOut, status_code=status.HTTP_201_CREATED)
+def create(
+    payload: TaskCreate,
+    db: Session = Depends(get_db),
+    current_user: Principal = Depends(get_current_user),
+):
+    """Create task."""
+
+    return task_out(create_task(db, current_user.id, payload), date.today())
+
+
+@router.post("/bulk", response_model=TaskBulkResult)
+def bulk(
+    payload: TaskBulkRequest,
+    db: Session = Depends(get_db),
+    current_user: Principal = Depends(get_current_user),
+):
+    """Apply a batch of task creates, updates, status changes and moves."""
+
+    return run_bulk_operations(db, current_user.id, payload)
+
+
+@router.get("", response_model=TaskPage)
+def list_all(
+    request: Request,
+    response: Response,
+    project_id: UUID | None = None,
+    assignee_id: UUID | None = None,
+    task_status: TaskStatus | None = Query(default=None, alias="status"),
+    tags_all: list[UUID] = Query(default=[], max_length=MAX_TAG_FILTERS),
+    tags_any: list[UUID] = Query(default=[], max_length=MAX_TAG_FILTERS),
+    tags_none: list[UUID] = Query(default=[], max_length=MAX_TAG_FILTERS),
+    cursor: str | None = None,
+    limit: int = Query(default=50, ge=1, le=200),
+    db: Session = Depends(get_db),
+    current_user: Principal = Depends(get_current_user),
+):
+    """List tasks with keyset pagination, filtered by tags with AND/OR/NOT.
+
+    Answers 304 to a client holding the current page without loading it.
+    Unconditional requests tag the loaded page, with no extra query.
+    """
+
+    filters = {
+        "project_id": project_id,
+        "assignee_id": assignee_id,
+        "status": task_status,
+        "tags_all": tags_all,
+        "tags_any": tags_any,
+        "tags_none": tags_none,
+        "cursor": cursor,
+        "limit": limit,
+    }
+
+    if has_preconditions(request):
+        validators = get_task_list_validators(db, current_user.id, **filters)
+        not_modified = conditional_response(request, response, validators)
+        if not_modified is not None:
+            return not_modified
+
+    page = list_tasks(db, current_user.id, **filters)
+    response.headers.update(get_task_page_validators(page).headers)
+
+    return page
+
+
+@router.get("/counts", response_model=TaskCounts)
+def counts(
+    project_id: UUID | None = None,
+    db: Session = Depends(get_db),
+    current_user: Principal = Depends(get_current_user),
+):
+    """Count live tasks per status in a project, or assigned to the caller."""
+
+    return get_task_counts_for_user(db, current_user.id, project_id)
+
+
+@router.get("/calendar", response_model=list[CalendarEntry])
+def calendar(
+    start: date,
+    end: date,
+    project_id: UUID | None = None,
+    db: Session = Depends(get_db),
+    current_user: Principal = Depends(get_current_user),
+):
+    """List task due dates and recurrences within a bounded date window."""
+
+    return list_calendar(db, current_user.id, start, end, project_id=project_id)
+
+
+@router.get("/{task_id}", response_model=TaskOut)
+def read(
+    task_id: UUID,
+    request: Request,
+    response: Response,
+    db: Session = Depends(get_db),
+    current_user: Principal = Depends(get_current_user),
+):
+    """Get task, or 304 when the client copy is still current."""
+
+    validators = get_task_validators(db, current_user.id, task_id)
+    not_modified = conditional_response(request, response, validators)
+    if not_modified is not None:
+        return not_modified
+
+    return task_out(get_task_for_user(db, current_user.id, task_id), date.today())
+
+
+@router.get("/{task_id}/tree", response_model=TaskTreeNode)
+def read_tree(
+    task_id: UUID,
+    depth: int = Query(default=10, ge=0, le=MAX_TREE_DEPTH),
+    rollup: bool = False,
+    db: Session = Depends(get_db),
+    current_user: Principal = Depends(get_current_user),
+):
+    """Get task with its subtasks nested up to `depth` levels."""
+
+    return get_task_tree(db, current_user.id, task_id, max_depth=depth, rollup=rollup)
+
+
+@router.get("/{task_id}/ancestors", response_model=list[TaskOut])
+def read_ancestors(
+    task_id: UUID,
+    db: Session = Depends(get_db),
+    current_user: Principal = Depends(get_current_user),
+):
+    """Get the ancestors of a task, root first."""
+
+    today = date.today()
+    return [
+        task_out(task, today)
+        for task in get_task_ancestors(db, current_user.id, task_id)
+    ]
+
+
+@router.patch("/{task_id}", response_model=TaskOut)
+def update(
+    task_id: UUID,
+    payload: TaskUpdate,
+    db: Session = Depends(get_db),
+    current_user: Principal = Depends(get_current_user),
+):
+    """Update task."""
+
+    return task_out(update_task(db, current_user.id, task_id, payload), date.today())
+
+
+@router.delete("/{task_id}", status_code=status.HTTP_204_NO_CONTENT)
+def delete(
+    task_id: UUID,
+    db: Session = Depends(get_db),
+    current_user: Principal = Depends(get_current_user),
+):
+    """Delete task."""
+
+    delete_task(db, current_user.id, task_id)
@@ -0,0 +1,55 @@
+"""Import necessary libraries for endpoints creation."""
+
+from uuid import UUID
+
+from fastapi import APIRouter, Depends, status
+from sqlalchemy.orm import Session
+
+from app.api.dependencies import require_workspace_role
+from app.db.session import get_db
+from app.schemas.workspace import MemberRoleUpdate, WorkspaceMemberOut
+from app.services.workspace_service import (
+    list_workspace_members,
+    remove_workspace_member,
+    set_workspace_member,
+)
+
+router = APIRouter(tags=["workspaces"])
+
+
+@router.get("/{workspace_id}/members", response_model=list[WorkspaceMemberOut])
+def list_members(
+    workspace_id: UUID,
+    db: Session = Depends(get_db),
+    _role: str = Depends(require_workspace_role("viewer")),
+):
+    """List the members of a workspace."""
+
+    return list_workspace_members(db, workspace_id)
+
+
+@router.put("/{workspace_id}/members/{user_id}", response_model=WorkspaceMemberOut)
+def set_member(
+    workspace_id: UUID,
+    user_id: UUID,
+    payload: MemberRoleUpdate,
+    db: Session = Depends(get_db),
+    role: str = Depends(require_workspace_role("admin")),
+):
+    """Add a member to a workspace or change their role."""
+
+    return set_workspace_member(db, role, workspace_id, user_id, payload)
+
+
+@router.delete(
+    "/{workspace_id}/members/{user_id}", status_code=status.HTTP_204_NO_CONTENT
+)
+def remove_member(
+    workspace_id: UUID,
+    user_id: UUID,
+    db: Session = Depends(get_db),
+    role: str = Depends(require_workspace_role("admin")),
+):
+    """Remove a member from a workspace."""
+
+    remove_workspace_member(db, role, workspace_id, user_id)
@@ -0,0 +1,17 @@
+"""Import necessary libraries for UTC time helpers."""
+
+from datetime import datetime, timezone
+
+
+def utc_now() -> datetime:
+    """Return the current UTC time."""
+
+    return datetime.now(timezone.utc)
+
+
+def normalize_utc(dt: datetime) -> datetime:
+    """Ensure DB datetime is timezone-aware UTC, SQLite returns naive ones."""
+
+    if dt.tzinfo is None:
+        return dt.replace(tzinfo=timezone.utc)
+    return dt.astimezone(timezone.utc)
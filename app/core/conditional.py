@@ -0,0 +1,112 @@
+"""Import necessary libraries for conditional GET responses."""
+
+import hashlib
+from collections.abc import Iterable
+from dataclasses import dataclass
+from datetime import datetime
+from email.utils import format_datetime, parsedate_to_datetime
+
+from starlette.requests import Request
+from starlette.responses import Response
+
+from app.core.clock import normalize_utc
+
+CACHE_CONTROL = "private, no-cache"
+
+
+@dataclass(frozen=True)
+class Validators:
+    """ETag and Last-Modified of a resource, computed before loading it."""
+
+    etag: str
+    last_modified: datetime | None = None
+
+    @property
+    def headers(self) -> dict[str, str]:
+        headers = {"ETag": self.etag, "Cache-Control": CACHE_CONTROL}
+        if self.last_modified is not None:
+            headers["Last-Modified"] = format_datetime(
+                normalize_utc(self.last_modified), usegmt=True
+            )
+        return headers
+
+
+# Helpers
+
+
+def weak_etag(*parts) -> str:
+    """Weak ETag hashing the parts a representation is derived from."""
+
+    digest = hashlib.blake2b(
+        "|".join(map(str, parts)).encode(), digest_size=16
+    ).hexdigest()
+    return f'W/"{digest}"'
+
+
+def page_etag(kind: str, rows: Iterable[tuple], *parts) -> str:
+    """Weak ETag of one page of a collection, from the versions of its rows.
+
+    Timestamps are normalized, so rows read from the database and from the
+    serialized page give the same tag.
+    """
+
+    versions = [
+        tuple(
+            normalize_utc(value) if isinstance(value, datetime) else value
+            for value in row
+        )
+        for row in rows
+    ]
+    return weak_etag(kind, *parts, versions)
+
+
+def etag_matches(header: str, etag: str) -> bool:
+    """Tell whether an If-None-Match header matches an ETag, weakly."""
+
+    tags = [tag.strip().removeprefix("W/") for tag in header.split(",")]
+    return "*" in tags or etag.removeprefix("W/") in tags
+
+
+def has_preconditions(request: Request) -> bool:
+    """Tell whether a request carries If-None-Match or If-Modified-Since."""
+
+    return "if-none-match" in request.headers or "if-modified-since" in request.headers
+
+
+def is_not_modified(request: Request, validators: Validators) -> bool:
+    """Evaluate If-None-Match, or else If-Modified-Since, against validators."""
+
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None:
+        return etag_matches(if_none_match, validators.etag)
+
+    if_modified_since = request.headers.get("if-modified-since")
+    if if_modified_since is None or validators.last_modified is None:
+        return False
+
+    try:
+        since = parsedate_to_datetime(if_modified_since)
+    except (TypeError, ValueError):
+        return False
+
+    last_modified = normalize_utc(validators.last_modified).replace(microsecond=0)
+    return last_modified <= normalize_utc(since)
+
+
+# Responses
+
+
+def conditional_response(
+    request: Request, response: Response, validators: Validators
+) -> Response | None:
+    """Return a 304 for a fresh client copy, else add validators to `response`.
+
+    Routes compute the validators with a cheap query first, and only load
+    and serialize the resource when this returns None.
+    """
+
+    if is_not_modified(request, validators):
+        return Response(status_code=304, headers=validators.headers)
+
+    response.headers.update(validators.headers)
+    return None
@@ -1,5 +1,7 @@
 """Import the necessary libraries for the project configuration."""
 
+from typing import Literal
+
 from pydantic import Field
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
@@ -17,11 +19,64 @@ class Settings(BaseSettings):
 
     # Database
     DATABASE_URL: str
+    ASYNC_DATABASE_URL: str | None = Field(default=None)
+    QUERY_N_PLUS_ONE_THRESHOLD: int = Field(default=5)
 
     # Authentication / JWT
     JWT_SECRET_KEY: str
     JWT_ALGORITHM: str = Field(default="HS256")
     ACCESS_TOKEN_EXPIRE_MINUTES: int = Field(default=60)
+    PRINCIPAL_CACHE_MAX_SIZE: int = Field(default=10_000)
+    PRINCIPAL_CACHE_TTL_SECONDS: float = Field(default=60)
+    ROLE_CACHE_MAX_SIZE: int = Field(default=50_000)
+    ROLE_CACHE_TTL_SECONDS: float = Field(default=60)
+
+    # Rate limiting
+    RATE_LIMIT_ENABLED: bool = Field(default=True)
+    RATE_LIMIT_PER_IP: int = Field(default=60)
+    RATE_LIMIT_PER_EMAIL: int = Field(default=10)
+    RATE_LIMIT_WINDOW_SECONDS: float = Field(default=60)
+
+    # Password reset
+    RESET_CODE_SECRET_KEY: str | None = Field(default=None)
+    RESET_CODE_MAX_ATTEMPTS: int = Field(default=5)
+    RESET_CODE_EXPIRE_MINUTES: int = Field(default=10)
+    RESET_TOKEN_SWEEP_INTERVAL_SECONDS: float = Field(default=300)
+    RESET_TOKEN_SWEEP_BATCH_SIZE: int = Field(default=1_000)
+
+    # Task counters
+    TASK_COUNT_RECONCILE_INTERVAL_SECONDS: float = Field(default=3600)
+
+    # Soft deleted task purge
+    TASK_PURGE_INTERVAL_SECONDS: float = Field(default=3600)
+    TASK_PURGE_RETENTION_DAYS: float = Field(default=30)
+    TASK_PURGE_BATCH_SIZE: int = Field(default=500)
+    TASK_PURGE_PAUSE_SECONDS: float = Field(default=0.5)
+    TASK_PURGE_MAX_BATCHES: int = Field(default=200)
+
+    # Change feed
+    EVENT_BACKEND: Literal["local", "postgres"] = Field(default="local")
+    EVENT_MAX_PENDING: int = Field(default=1_000)
+    EVENT_HEARTBEAT_SECONDS: float = Field(default=15)
+    EVENT_ACCESS_CHECK_SECONDS: float = Field(default=60)
+    EVENT_RECONNECT_BASE_SECONDS: float = Field(default=1)
+    EVENT_RECONNECT_MAX_SECONDS: float = Field(default=30)
+
+    # Reminders
+    REMINDER_BATCH_SIZE: int = Field(default=100)
+    REMINDER_POLL_INTERVAL_SECONDS: float = Field(default=5)
+    REMINDER_MAX_ATTEMPTS: int = Field(default=5)
+    REMINDER_RETRY_BASE_SECONDS: float = Field(default=60)
+    REMINDER_RETRY_MAX_SECONDS: float = Field(default=3600)
+
+    # Attachments
+    STORAGE_ROOT: str = Field(default="storage")
+    ATTACHMENT_MAX_SIZE_BYTES: int = Field(default=2 * 1024**3)
+
+    # Password hashing
+    HASHING_EXECUTOR: str = Field(default="process")
+    HASHING_MAX_WORKERS: int = Field(default=0)
+    HASHING_MAX_PENDING: int = Field(default=64)
 
 
 settings = Settings()
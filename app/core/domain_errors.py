@@ -21,5 +21,45 @@ class NotFound(DomainError):
     """Used when a resource is not found."""
 
 
+class PermissionDenied(DomainError):
+    """Used when the user is not allowed to act on a resource."""
+
+
 class InvalidCode(DomainError):
     """Used when entering incorrect code in password reset."""
+
+
+class InvalidCursor(DomainError):
+    """Used when a pagination cursor cannot be decoded."""
+
+
+class InvalidTask(DomainError):
+    """Used when a task change breaks the task rules."""
+
+
+class ServiceBusy(DomainError):
+    """Used when a bounded worker queue is full."""
+
+
+class PayloadTooLarge(DomainError):
+    """Used when an upload exceeds the maximum size."""
+
+
+class InvalidContentLength(DomainError):
+    """Used when an upload declares a malformed Content-Length."""
+
+
+class RangeNotSatisfiable(DomainError):
+    """Used when a requested byte range is outside of the file."""
+
+    def __init__(self, size: int) -> None:
+        super().__init__(size)
+        self.size = size
+
+
+class RateLimited(DomainError):
+    """Used when a client exceeds the rate limit of an endpoint."""
+
+    def __init__(self, retry_after: float) -> None:
+        super().__init__(retry_after)
+        self.retry_after = retry_after
@@ -0,0 +1,478 @@
+"""Import necessary libraries for the workspace change feed."""
+
+import asyncio
+import logging
+import threading
+from collections import OrderedDict
+from collections.abc import AsyncIterator, Awaitable, Callable, Iterator
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass
+from typing import Protocol
+from uuid import UUID
+
+import asyncpg
+import orjson
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+NOTIFY_CHANNEL = "workspace_changes"
+NOTIFY_MAX_BYTES = 7900
+
+
+@dataclass(frozen=True)
+class ChangeEvent:
+    """A task, comment, tag or member of a workspace was created, updated or deleted."""
+
+    workspace_id: UUID
+    kind: str
+    action: str
+    id: UUID
+    task_id: UUID | None = None
+
+    @property
+    def key(self) -> tuple[str, UUID]:
+        return self.kind, self.id
+
+    def to_json(self) -> bytes:
+        return orjson.dumps(asdict(self))
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "ChangeEvent":
+        return cls(
+            workspace_id=UUID(data["workspace_id"]),
+            kind=data["kind"],
+            action=data["action"],
+            id=UUID(data["id"]),
+            task_id=UUID(data["task_id"]) if data["task_id"] else None,
+        )
+
+
+class SlowConsumer(Exception):
+    """Raised to a subscriber that fell too far behind and was dropped."""
+
+
+class AccessRevoked(Exception):
+    """Raised to a subscriber that is no longer a member of its workspace."""
+
+
+class Subscription:
+    """Bounded, coalescing queue of the changes of one workspace.
+
+    Events for the same object replace each other, so a subscriber only
+    sees the latest change of every object. A subscriber with `max_pending`
+    distinct objects waiting is dropped and told to resync instead.
+    """
+
+    def __init__(self, workspace_id: UUID, max_pending: int) -> None:
+        self.workspace_id = workspace_id
+        self.max_pending = max_pending
+        self.dropped = False
+
+        self._pending: OrderedDict[tuple[str, UUID], ChangeEvent] = OrderedDict()
+        self._ready = asyncio.Event()
+
+    def push(self, event: ChangeEvent) -> None:
+        """Queue an event, on the event loop."""
+
+        if self.dropped:
+            return
+
+        if event.key in self._pending:
+            del self._pending[event.key]
+        elif len(self._pending) >= self.max_pending:
+            self.drop()
+            return
+
+        self._pending[event.key] = event
+        self._ready.set()
+
+    def drop(self) -> None:
+        """Forget the pending changes and tell the subscriber to resync."""
+
+        self.dropped = True
+        self._pending.clear()
+        self._ready.set()
+
+    async def next_batch(self) -> list[ChangeEvent]:
+        """Wait for changes and take every pending one, oldest first."""
+
+        await self._ready.wait()
+        self._ready.clear()
+
+        if self.dropped:
+            raise SlowConsumer()
+
+        batch = list(self._pending.values())
+        self._pending.clear()
+        return batch
+
+
+# Backends
+
+
+class EventBackend(Protocol):
+    """Transport sharing change events between the workers of the app."""
+
+    async def start(
+        self,
+        deliver: Callable[[ChangeEvent], None],
+        resync: Callable[[], None],
+    ) -> None:
+        """Start calling `deliver`, on the event loop, for every event.
+
+        `resync` is called when events may have been lost, e.g. after the
+        transport reconnected.
+        """
+
+    async def stop(self) -> None:
+        """Stop delivering events."""
+
+    async def publish(self, events: list[ChangeEvent]) -> None:
+        """Send the events of one transaction to every worker, this one included."""
+
+
+class LocalEventBackend:
+    """Single process backend, and local stand-in for a shared one."""
+
+    def __init__(self) -> None:
+        self._deliver: Callable[[ChangeEvent], None] | None = None
+
+    async def start(
+        self,
+        deliver: Callable[[ChangeEvent], None],
+        resync: Callable[[], None],
+    ) -> None:
+        self._deliver = deliver
+
+    async def stop(self) -> None:
+        self._deliver = None
+
+    async def publish(self, events: list[ChangeEvent]) -> None:
+        if self._deliver is not None:
+            for event in events:
+                self._deliver(event)
+
+
+class PostgresEventBackend:
+    """Cross-worker backend over PostgreSQL LISTEN/NOTIFY.
+
+    A lost listener connection is reopened with exponential backoff, then
+    subscribers are told to resync, as the notifications sent meanwhile are
+    gone. Events published while disconnected are dropped the same way.
+
+    The events of a publish call go out as JSON lists in one statement, one
+    notification per list, each list kept under the NOTIFY payload limit.
+    """
+
+    def __init__(
+        self,
+        dsn: str,
+        channel: str = NOTIFY_CHANNEL,
+        retry_base_seconds: float = settings.EVENT_RECONNECT_BASE_SECONDS,
+        retry_max_seconds: float = settings.EVENT_RECONNECT_MAX_SECONDS,
+        connect: Callable[[str], Awaitable] = asyncpg.connect,
+    ) -> None:
+        self.dsn = dsn
+        self.channel = channel
+        self.retry_base_seconds = retry_base_seconds
+        self.retry_max_seconds = retry_max_seconds
+
+        self._connect = connect
+        self._connection = None
+        self._deliver: Callable[[ChangeEvent], None] | None = None
+        self._resync: Callable[[], None] | None = None
+        self._reconnecting: asyncio.Task | None = None
+        self._stopped = True
+        self._lock = asyncio.Lock()
+
+    async def start(
+        self,
+        deliver: Callable[[ChangeEvent], None],
+        resync: Callable[[], None],
+    ) -> None:
+        self._deliver = deliver
+        self._resync = resync
+        self._stopped = False
+        await self._listen()
+
+    async def stop(self) -> None:
+        self._stopped = True
+
+        if self._reconnecting is not None:
+            self._reconnecting.cancel()
+            self._reconnecting = None
+
+        connection, self._connection = self._connection, None
+        if connection is not None:
+            await connection.close()
+
+    async def publish(self, events: list[ChangeEvent]) -> None:
+        connection = self._connection
+        if connection is None or connection.is_closed():
+            self._reconnect_soon()
+            raise ConnectionError("Change feed is disconnected, events dropped.")
+
+        async with self._lock:
+            await connection.execute(
+                "SELECT pg_notify($1, payload) FROM unnest($2::text[]) AS payload",
+                self.channel,
+                notify_payloads(events),
+            )
+
+    def _listener(self, connection, pid, channel, payload) -> None:
+        for data in orjson.loads(payload):
+            self._deliver(ChangeEvent.from_dict(data))
+
+    def _terminated(self, connection) -> None:
+        if connection is self._connection:
+            self._connection = None
+            self._reconnect_soon()
+
+    async def _listen(self) -> None:
+        """Open a connection and listen on the channel."""
+
+        connection = await self._connect(self.dsn)
+
+        try:
+            await connection.add_listener(self.channel, self._listener)
+        except BaseException:
+            await connection.close()
+            raise
+
+        connection.add_termination_listener(self._terminated)
+        self._connection = connection
+
+    def _reconnect_soon(self) -> None:
+        """Start reconnecting, unless stopped or already reconnecting."""
+
+        if self._stopped or (
+            self._reconnecting is not None and not self._reconnecting.done()
+        ):
+            return
+
+        self._reconnecting = asyncio.get_running_loop().create_task(self._reconnect())
+
+    async def _reconnect(self) -> None:
+        """Listen again with exponential backoff, then ask for a resync."""
+
+        delay = self.retry_base_seconds
+
+        while not self._stopped:
+            try:
+                await self._listen()
+            except Exception as error:
+                logger.warning(
+                    "Change feed reconnect failed, retrying in %.1fs: %s", delay, error
+                )
+                await asyncio.sleep(delay)
+                delay = min(max(delay * 2, 0.1), self.retry_max_seconds)
+            else:
+                logger.info("Change feed reconnected, subscribers resync.")
+                self._resync()
+                return
+
+
+def notify_payloads(
+    events: list[ChangeEvent], max_bytes: int = NOTIFY_MAX_BYTES
+) -> list[str]:
+    """Pack events into JSON lists of at most `max_bytes` each."""
+
+    payloads: list[str] = []
+    chunk: list[bytes] = []
+    size = 2
+
+    for event in events:
+        encoded = event.to_json()
+
+        if chunk and size + len(encoded) + 1 > max_bytes:
+            payloads.append(b"[" + b",".join(chunk) + b"]")
+            chunk, size = [], 2
+
+        chunk.append(encoded)
+        size += len(encoded) + 1
+
+    if chunk:
+        payloads.append(b"[" + b",".join(chunk) + b"]")
+
+    return [payload.decode() for payload in payloads]
+
+
+# Hub
+
+
+class EventHub:
+    """In-process pub/sub of workspace changes, fanned out to subscriptions.
+
+    Services publish from any thread once their transaction committed. The
+    backend carries events to every worker, and each worker hands them to
+    its own subscribers on its event loop.
+    """
+
+    def __init__(
+        self, backend: EventBackend, max_pending: int = settings.EVENT_MAX_PENDING
+    ) -> None:
+        self.backend = backend
+        self.max_pending = max_pending
+
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._subscriptions: dict[UUID, set[Subscription]] = {}
+        self._lock = threading.Lock()
+
+    def use(self, backend: EventBackend) -> None:
+        """Swap the transport, before the hub starts."""
+
+        self.backend = backend
+
+    async def start(self) -> None:
+        """Bind the hub to the running loop and start the backend."""
+
+        self._loop = asyncio.get_running_loop()
+        await self.backend.start(self.deliver, self.resync)
+
+    async def stop(self) -> None:
+        """Stop the backend, publishing becomes a no-op."""
+
+        self._loop = None
+        await self.backend.stop()
+
+    def publish(self, events: list[ChangeEvent]) -> None:
+        """Hand the events of one transaction to the backend, without waiting.
+
+        Safe from any thread, the batch is sent to the other workers at once.
+        """
+
+        loop = self._loop
+        if not events or loop is None or loop.is_closed():
+            return
+
+        future = asyncio.run_coroutine_threadsafe(self.backend.publish(events), loop)
+        future.add_done_callback(log_failure)
+
+    def deliver(self, event: ChangeEvent) -> None:
+        """Fan an event out to the subscribers of its workspace, on the loop."""
+
+        with self._lock:
+            subscriptions = list(self._subscriptions.get(event.workspace_id, ()))
+
+        for subscription in subscriptions:
+            subscription.push(event)
+
+    def resync(self) -> None:
+        """Drop every subscription, on the loop, after events may have been lost."""
+
+        with self._lock:
+            subscriptions = [
+                subscription
+                for workspace_subscriptions in self._subscriptions.values()
+                for subscription in workspace_subscriptions
+            ]
+
+        for subscription in subscriptions:
+            subscription.drop()
+
+    @contextmanager
+    def subscribe(self, workspace_id: UUID) -> Iterator[Subscription]:
+        """Subscribe to the changes of a workspace for the `with` block."""
+
+        subscription = Subscription(workspace_id, self.max_pending)
+
+        with self._lock:
+            self._subscriptions.setdefault(workspace_id, set()).add(subscription)
+
+        try:
+            yield subscription
+        finally:
+            with self._lock:
+                subscriptions = self._subscriptions[workspace_id]
+                subscriptions.discard(subscription)
+                if not subscriptions:
+                    del self._subscriptions[workspace_id]
+
+    def subscriber_count(self, workspace_id: UUID) -> int:
+        """Number of live subscriptions to a workspace."""
+
+        with self._lock:
+            return len(self._subscriptions.get(workspace_id, ()))
+
+
+def log_failure(future) -> None:
+    """Log events the backend failed to publish."""
+
+    if not future.cancelled() and future.exception() is not None:
+        logger.error("Change event publish failed.", exc_info=future.exception())
+
+
+# Streams
+
+
+def encode_batch(batch: list[ChangeEvent]) -> bytes:
+    """JSON list of the client facing fields of a batch of events."""
+
+    return orjson.dumps(
+        [
+            {
+                "kind": event.kind,
+                "action": event.action,
+                "id": event.id,
+                "task_id": event.task_id,
+            }
+            for event in batch
+        ]
+    )
+
+
+async def watch(
+    subscription: Subscription,
+    check_access: Callable[[bool], Awaitable[bool]] | None = None,
+    heartbeat_seconds: float = settings.EVENT_HEARTBEAT_SECONDS,
+    check_seconds: float = settings.EVENT_ACCESS_CHECK_SECONDS,
+) -> AsyncIterator[list[ChangeEvent]]:
+    """Yield the change batches of a subscription, an empty one per heartbeat.
+
+    `check_access` runs every `check_seconds` and, told to skip cached
+    roles, after membership changes of the workspace. AccessRevoked is raised
+    once it fails, SlowConsumer when the subscription was dropped.
+    """
+
+    loop = asyncio.get_running_loop()
+    checked_at = loop.time()
+
+    while True:
+        try:
+            batch = await asyncio.wait_for(subscription.next_batch(), heartbeat_seconds)
+        except TimeoutError:
+            batch = []
+
+        membership_changed = any(event.kind == "member" for event in batch)
+        due = loop.time() - checked_at >= check_seconds
+
+        if check_access is not None and (membership_changed or due):
+            if not await check_access(membership_changed):
+                raise AccessRevoked()
+            checked_at = loop.time()
+
+        yield batch
+
+
+async def sse_stream(
+    subscription: Subscription,
+    check_access: Callable[[bool], Awaitable[bool]] | None = None,
+    heartbeat_seconds: float = settings.EVENT_HEARTBEAT_SECONDS,
+) -> AsyncIterator[bytes]:
+    """Server-Sent Events of a subscription, with heartbeat comments."""
+
+    try:
+        async for batch in watch(subscription, check_access, heartbeat_seconds):
+            if batch:
+                yield b"event: changes\ndata: " + encode_batch(batch) + b"\n\n"
+            else:
+                yield b": ping\n\n"
+    except SlowConsumer:
+        yield b"event: resync\ndata: {}\n\n"
+    except AccessRevoked:
+        yield b"event: revoked\ndata: {}\n\n"
+
+
+event_hub = EventHub(LocalEventBackend())
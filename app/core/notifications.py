@@ -0,0 +1,63 @@
+"""Import necessary libraries for reminder delivery channels."""
+
+import logging
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Protocol
+from uuid import UUID
+
+logger = logging.getLogger(__name__)
+
+REMINDER_CHANNELS = ("inapp", "email", "push")
+
+
+@dataclass(frozen=True)
+class ReminderMessage:
+    """What a channel needs to deliver one reminder."""
+
+    id: UUID
+    task_id: UUID
+    channel: str
+    remind_at: datetime
+    attempts: int = 0
+
+
+# Backends
+
+
+class ReminderChannel(Protocol):
+    """Delivery strategy for one reminder channel."""
+
+    async def send(self, message: ReminderMessage) -> None:
+        """Deliver a reminder, raising when it could not be delivered."""
+
+
+class InMemoryChannel:
+    """Local stand-in for a channel, keeping what it was asked to deliver."""
+
+    def __init__(self) -> None:
+        self.sent: list[ReminderMessage] = []
+
+    async def send(self, message: ReminderMessage) -> None:
+        self.sent.append(message)
+
+
+class LoggingChannel:
+    """Local stand-in for a channel, logging every delivery."""
+
+    def __init__(self, name: str) -> None:
+        self.name = name
+
+    async def send(self, message: ReminderMessage) -> None:
+        logger.info(
+            "Reminder %s for task %s sent through %s.",
+            message.id,
+            message.task_id,
+            self.name,
+        )
+
+
+def default_channels() -> dict[str, ReminderChannel]:
+    """Return the channels used when none are configured."""
+
+    return {name: LoggingChannel(name) for name in REMINDER_CHANNELS}
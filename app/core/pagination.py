@@ -0,0 +1,44 @@
+"""Import necessary libraries for keyset pagination cursors."""
+
+import base64
+import json
+from datetime import datetime
+from uuid import UUID
+
+from app.core.domain_errors import InvalidCursor
+
+
+def encode_cursor(created_at: datetime, row_id: UUID) -> str:
+    """Encode the sort key of the last row of a page as an opaque cursor."""
+
+    raw = json.dumps([created_at.isoformat(), str(row_id)]).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> tuple[datetime, UUID]:
+    """Decode a cursor built by encode_cursor."""
+
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        created_at, row_id = json.loads(base64.urlsafe_b64decode(padded))
+        return datetime.fromisoformat(created_at), UUID(row_id)
+    except (TypeError, ValueError) as error:
+        raise InvalidCursor() from error
+
+
+def encode_rank_cursor(rank: float, row_id: UUID) -> str:
+    """Encode the rank and id of the last row of a ranked page as a cursor."""
+
+    raw = json.dumps([rank, str(row_id)]).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_rank_cursor(cursor: str) -> tuple[float, UUID]:
+    """Decode a cursor built by encode_rank_cursor."""
+
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        rank, row_id = json.loads(base64.urlsafe_b64decode(padded))
+        return float(rank), UUID(row_id)
+    except (TypeError, ValueError) as error:
+        raise InvalidCursor() from error
@@ -0,0 +1,96 @@
+"""Import necessary libraries for the authenticated principal cache."""
+
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable
+from uuid import UUID
+
+from app.core.config import settings
+from app.schemas.user import Principal
+
+
+class PrincipalCache:
+    """Per-process TTL/LRU cache of active users keyed by id."""
+
+    def __init__(
+        self,
+        max_size: int,
+        ttl_seconds: float,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.max_size = max_size
+        self.ttl_seconds = ttl_seconds
+        self.hits = 0
+        self.misses = 0
+
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[UUID, tuple[float, Principal]] = OrderedDict()
+        self._epoch = 0
+
+    @property
+    def epoch(self) -> int:
+        """Counter bumped by every invalidation, used to drop stale loads."""
+
+        return self._epoch
+
+    def get(self, user_id: UUID) -> Principal | None:
+        """Return the cached principal, or None when missing or expired."""
+
+        with self._lock:
+            entry = self._entries.get(user_id)
+
+            if entry is None or entry[0] <= self._clock():
+                if entry is not None:
+                    del self._entries[user_id]
+                self.misses += 1
+                return None
+
+            self._entries.move_to_end(user_id)
+            self.hits += 1
+            return entry[1]
+
+    def set(self, principal: Principal, epoch: int | None = None) -> None:
+        """Store a principal unless it was invalidated since `epoch`."""
+
+        if self.max_size <= 0 or self.ttl_seconds <= 0:
+            return
+
+        with self._lock:
+            if epoch is not None and epoch != self._epoch:
+                return
+
+            self._entries[principal.id] = (
+                self._clock() + self.ttl_seconds,
+                principal,
+            )
+            self._entries.move_to_end(principal.id)
+
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, user_id: UUID) -> None:
+        """Drop a user from the cache after their state changed."""
+
+        with self._lock:
+            self._entries.pop(user_id, None)
+            self._epoch += 1
+
+    def clear(self) -> None:
+        """Drop every entry and reset the counters."""
+
+        with self._lock:
+            self._entries.clear()
+            self._epoch += 1
+            self.hits = 0
+            self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+principal_cache = PrincipalCache(
+    max_size=settings.PRINCIPAL_CACHE_MAX_SIZE,
+    ttl_seconds=settings.PRINCIPAL_CACHE_TTL_SECONDS,
+)
@@ -0,0 +1,192 @@
+"""Import necessary libraries for auth endpoints rate limiting."""
+
+import json
+import time
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable
+from typing import Protocol
+
+from fastapi import Request
+
+from app.core.config import settings
+from app.core.domain_errors import RateLimited
+
+# Backends
+
+
+class RateLimitBackend(Protocol):
+    """Storage strategy deciding whether a key may spend one more hit."""
+
+    async def hit(self, key: str, limit: int, window_seconds: float) -> float:
+        """Record a hit and return 0, or the seconds to wait when limited."""
+
+
+class InMemoryRateLimitBackend:
+    """Per-process token bucket.
+
+    `hit` never awaits, so on the event loop each call runs to completion
+    without interleaving and needs no lock. Buckets keep their own limit and
+    rate and are kept in least recently used order. Over `max_keys` they are
+    pruned down to `prune_ratio` of it, refilled buckets first, so pruning
+    runs once every many new keys.
+    """
+
+    def __init__(
+        self,
+        max_keys: int = 100_000,
+        clock: Callable[[], float] = time.monotonic,
+        prune_ratio: float = 0.9,
+    ) -> None:
+        self.max_keys = max_keys
+        self.prune_ratio = prune_ratio
+        self._clock = clock
+        # key -> (tokens, updated_at, limit, rate)
+        self._buckets: OrderedDict[str, tuple[float, float, int, float]] = OrderedDict()
+
+    async def hit(self, key: str, limit: int, window_seconds: float) -> float:
+        now = self._clock()
+        rate = limit / window_seconds
+
+        bucket = self._buckets.pop(key, None)
+        tokens, updated_at = (float(limit), now) if bucket is None else bucket[:2]
+        tokens = min(float(limit), tokens + (now - updated_at) * rate)
+
+        if tokens < 1:
+            self._buckets[key] = (tokens, now, limit, rate)
+            return (1 - tokens) / rate
+
+        self._buckets[key] = (tokens - 1, now, limit, rate)
+
+        if len(self._buckets) > self.max_keys:
+            self._prune(now)
+
+        return 0
+
+    def _prune(self, now: float) -> None:
+        """Forget refilled buckets, then the least recently used ones."""
+
+        target = int(self.max_keys * self.prune_ratio)
+
+        for key, (tokens, updated_at, limit, rate) in list(self._buckets.items()):
+            if tokens + (now - updated_at) * rate >= limit:
+                del self._buckets[key]
+
+        while len(self._buckets) > target:
+            self._buckets.popitem(last=False)
+
+
+class SharedStore(Protocol):
+    """Minimal counter store shared between workers (Redis-like)."""
+
+    async def incr(self, key: str, ttl_seconds: float) -> int:
+        """Increment a counter, setting its TTL when it is created."""
+
+    async def get(self, key: str) -> int:
+        """Return a counter, or 0 when it does not exist."""
+
+
+class FakeSharedStore:
+    """In-process stand-in for a shared counter store."""
+
+    def __init__(self, clock: Callable[[], float] = time.monotonic) -> None:
+        self._clock = clock
+        self._counters: dict[str, tuple[int, float]] = {}
+
+    async def incr(self, key: str, ttl_seconds: float) -> int:
+        now = self._clock()
+        value, expires_at = self._counters.get(key, (0, now + ttl_seconds))
+
+        if expires_at <= now:
+            value, expires_at = 0, now + ttl_seconds
+
+        self._counters[key] = (value + 1, expires_at)
+        return value + 1
+
+    async def get(self, key: str) -> int:
+        value, expires_at = self._counters.get(key, (0, 0.0))
+        return value if expires_at > self._clock() else 0
+
+
+class SharedStoreRateLimitBackend:
+    """Sliding window counter kept in a store shared between workers."""
+
+    def __init__(
+        self, store: SharedStore, clock: Callable[[], float] = time.time
+    ) -> None:
+        self.store = store
+        self._clock = clock
+
+    async def hit(self, key: str, limit: int, window_seconds: float) -> float:
+        now = self._clock()
+        window = int(now // window_seconds)
+        elapsed = (now % window_seconds) / window_seconds
+
+        previous = await self.store.get(f"{key}:{window - 1}")
+        current = await self.store.incr(f"{key}:{window}", 2 * window_seconds)
+
+        if previous * (1 - elapsed) + current > limit:
+            return window_seconds * (1 - elapsed)
+
+        return 0
+
+
+# Limiter
+
+
+def get_client_ip(request: Request) -> str:
+    """Return the address of the client sending the request."""
+
+    return request.client.host if request.client else "unknown"
+
+
+async def get_request_email(request: Request) -> str | None:
+    """Return the normalized email of a JSON body, if any."""
+
+    try:
+        body = json.loads(await request.body() or b"{}")
+    except ValueError:
+        return None
+
+    email = body.get("email") if isinstance(body, dict) else None
+    return email.strip().lower() if isinstance(email, str) else None
+
+
+class RateLimiter:
+    """Builds route dependencies that throttle by client IP and email."""
+
+    def __init__(self, backend: RateLimitBackend) -> None:
+        self.backend = backend
+
+    def use(self, backend: RateLimitBackend) -> None:
+        """Swap the storage backend, e.g. for a shared store."""
+
+        self.backend = backend
+
+    def limit(
+        self,
+        per_ip: int = settings.RATE_LIMIT_PER_IP,
+        per_email: int = settings.RATE_LIMIT_PER_EMAIL,
+        window_seconds: float = settings.RATE_LIMIT_WINDOW_SECONDS,
+    ) -> Callable[[Request], Awaitable[None]]:
+        """Return a dependency enforcing the limits on every route it guards."""
+
+        async def dependency(request: Request) -> None:
+            if not settings.RATE_LIMIT_ENABLED:
+                return
+
+            scope = request.url.path
+            checks = [(f"{scope}:ip:{get_client_ip(request)}", per_ip)]
+
+            email = await get_request_email(request)
+            if email:
+                checks.append((f"{scope}:email:{email}", per_email))
+
+            for key, limit in checks:
+                retry_after = await self.backend.hit(key, limit, window_seconds)
+                if retry_after:
+                    raise RateLimited(retry_after)
+
+        return dependency
+
+
+rate_limiter = RateLimiter(InMemoryRateLimitBackend())
@@ -0,0 +1,292 @@
+"""Import necessary libraries for recurrence rule expansion.
+
+Supports the RRULE subset tasks need, on dates:
+FREQ=DAILY|WEEKLY|MONTHLY|YEARLY with INTERVAL, COUNT or UNTIL, BYDAY
+(ordinals such as 2TU or -1FR on MONTHLY only) and BYMONTHDAY (MONTHLY).
+"""
+
+import calendar
+import re
+from collections.abc import Iterator
+from dataclasses import dataclass
+from datetime import date, datetime, timedelta
+from functools import lru_cache
+from itertools import islice
+
+FREQUENCIES = ("DAILY", "WEEKLY", "MONTHLY", "YEARLY")
+WEEKDAYS = ("MO", "TU", "WE", "TH", "FR", "SA", "SU")
+MAX_INTERVAL = 1000
+MAX_COUNT = 1000
+MAX_EMPTY_PERIODS = 1000
+
+BYDAY_PATTERN = re.compile(r"([+-]?\d{1,2})?(MO|TU|WE|TH|FR|SA|SU)")
+
+
+class RecurrenceError(ValueError):
+    """Raised for recurrence rules outside of the supported subset."""
+
+
+@dataclass(frozen=True)
+class RecurrenceRule:
+    """A parsed recurrence rule."""
+
+    freq: str
+    interval: int = 1
+    count: int | None = None
+    until: date | None = None
+    by_weekday: tuple[tuple[int | None, int], ...] = ()
+    by_month_day: tuple[int, ...] = ()
+
+
+# Parsing
+
+
+def parse_int(name: str, value: str, high: int, signed: bool = False) -> int:
+    """Parse an integer rule part between 1 and `high`, or -high and -1."""
+
+    try:
+        number = int(value)
+    except ValueError as error:
+        raise RecurrenceError(f"{name} must be an integer.") from error
+
+    if not 1 <= abs(number) <= high or (number < 0 and not signed):
+        raise RecurrenceError(f"{name} is out of range.")
+
+    return number
+
+
+def parse_until(value: str) -> date:
+    """Parse an UNTIL date, date-times are truncated to their date."""
+
+    try:
+        return datetime.strptime(value[:8], "%Y%m%d").date()
+    except ValueError as error:
+        raise RecurrenceError("UNTIL must be a YYYYMMDD date.") from error
+
+
+def parse_by_weekday(value: str, freq: str) -> tuple[tuple[int | None, int], ...]:
+    """Parse BYDAY into (ordinal, weekday) pairs."""
+
+    days = []
+
+    for token in value.split(","):
+        match = BYDAY_PATTERN.fullmatch(token)
+        if match is None:
+            raise RecurrenceError(f"Invalid BYDAY value {token!r}.")
+
+        ordinal = match.group(1)
+        if ordinal is not None:
+            if freq != "MONTHLY":
+                raise RecurrenceError("BYDAY ordinals need FREQ=MONTHLY.")
+            ordinal = parse_int("BYDAY ordinal", ordinal, 5, signed=True)
+
+        days.append((ordinal, WEEKDAYS.index(match.group(2))))
+
+    return tuple(sorted(set(days), key=lambda day: (day[1], day[0] or 0)))
+
+
+def parse_rule(text: str) -> RecurrenceRule:
+    """Parse an RRULE string of the supported subset."""
+
+    parts: dict[str, str] = {}
+
+    for part in text.strip().removeprefix("RRULE:").split(";"):
+        name, separator, value = part.partition("=")
+        name = name.strip().upper()
+        if not separator or not value or name in parts:
+            raise RecurrenceError(f"Invalid rule part {part!r}.")
+        parts[name] = value.strip().upper()
+
+    freq = parts.pop("FREQ", None)
+    if freq not in FREQUENCIES:
+        raise RecurrenceError(f"FREQ must be one of {', '.join(FREQUENCIES)}.")
+
+    rule = {"freq": freq}
+
+    if "INTERVAL" in parts:
+        rule["interval"] = parse_int("INTERVAL", parts.pop("INTERVAL"), MAX_INTERVAL)
+
+    if "COUNT" in parts and "UNTIL" in parts:
+        raise RecurrenceError("COUNT and UNTIL cannot be combined.")
+
+    if "COUNT" in parts:
+        rule["count"] = parse_int("COUNT", parts.pop("COUNT"), MAX_COUNT)
+
+    if "UNTIL" in parts:
+        rule["until"] = parse_until(parts.pop("UNTIL"))
+
+    if "BYDAY" in parts:
+        if freq not in ("DAILY", "WEEKLY", "MONTHLY"):
+            raise RecurrenceError("BYDAY needs FREQ=DAILY, WEEKLY or MONTHLY.")
+        rule["by_weekday"] = parse_by_weekday(parts.pop("BYDAY"), freq)
+
+    if "BYMONTHDAY" in parts:
+        if freq != "MONTHLY":
+            raise RecurrenceError("BYMONTHDAY needs FREQ=MONTHLY.")
+        rule["by_month_day"] = tuple(
+            sorted(
+                {
+                    parse_int("BYMONTHDAY", value, 31, signed=True)
+                    for value in parts.pop("BYMONTHDAY").split(",")
+                }
+            )
+        )
+
+    if parts:
+        raise RecurrenceError(f"Unsupported rule parts: {', '.join(sorted(parts))}.")
+
+    return RecurrenceRule(**rule)
+
+
+@lru_cache(maxsize=4096)
+def compile_rule(text: str) -> RecurrenceRule:
+    """Parse a rule once, later calls with the same text hit the cache."""
+
+    return parse_rule(text)
+
+
+# Expansion
+
+
+def add_months(day: date, months: int) -> tuple[int, int]:
+    """Year and month `months` after the month of `day`."""
+
+    index = day.year * 12 + day.month - 1 + months
+    return index // 12, index % 12 + 1
+
+
+def month_candidates(rule: RecurrenceRule, dtstart: date, year: int, month: int):
+    """Occurrence dates of a monthly rule within one month.
+
+    With both BYMONTHDAY and BYDAY a day must match both, as in RFC 5545.
+    """
+
+    last_day = calendar.monthrange(year, month)[1]
+    month_days: set[int] = set()
+    weekday_days: set[int] = set()
+
+    for month_day in rule.by_month_day:
+        day = month_day if month_day > 0 else last_day + month_day + 1
+        if 1 <= day <= last_day:
+            month_days.add(day)
+
+    for ordinal, weekday in rule.by_weekday:
+        first = (weekday - date(year, month, 1).weekday()) % 7 + 1
+        matches = list(range(first, last_day + 1, 7))
+
+        if ordinal is None:
+            weekday_days.update(matches)
+        elif abs(ordinal) <= len(matches):
+            weekday_days.add(matches[ordinal - 1 if ordinal > 0 else ordinal])
+
+    if rule.by_month_day and rule.by_weekday:
+        days = month_days & weekday_days
+    elif rule.by_month_day or rule.by_weekday:
+        days = month_days | weekday_days
+    elif dtstart.day <= last_day:
+        days = {dtstart.day}
+    else:
+        days = set()
+
+    return [date(year, month, day) for day in sorted(days)]
+
+
+def period_candidates(rule: RecurrenceRule, dtstart: date, period: int) -> list[date]:
+    """Occurrence dates of the `period`-th period of a rule, in order."""
+
+    step = period * rule.interval
+    weekdays = {weekday for _, weekday in rule.by_weekday}
+
+    if rule.freq == "DAILY":
+        day = dtstart + timedelta(days=step)
+        return [day] if not weekdays or day.weekday() in weekdays else []
+
+    if rule.freq == "WEEKLY":
+        week = dtstart - timedelta(days=dtstart.weekday()) + timedelta(weeks=step)
+        days = sorted(weekdays) if weekdays else [dtstart.weekday()]
+        return [week + timedelta(days=weekday) for weekday in days]
+
+    if rule.freq == "MONTHLY":
+        return month_candidates(rule, dtstart, *add_months(dtstart, step))
+
+    year = dtstart.year + step
+    if dtstart.month == 2 and dtstart.day == 29 and not calendar.isleap(year):
+        return []
+    return [dtstart.replace(year=year)]
+
+
+def first_period(rule: RecurrenceRule, dtstart: date, after: date) -> int:
+    """Index of the period containing `after`, to skip the periods before it."""
+
+    if rule.freq == "DAILY":
+        distance = (after - dtstart).days
+    elif rule.freq == "WEEKLY":
+        distance = (after - dtstart + timedelta(days=dtstart.weekday())).days // 7
+    elif rule.freq == "MONTHLY":
+        distance = (after.year - dtstart.year) * 12 + after.month - dtstart.month
+    else:
+        distance = after.year - dtstart.year
+
+    return max(distance // rule.interval, 0)
+
+
+def iter_occurrences(
+    rule: RecurrenceRule, dtstart: date, after: date | None = None
+) -> Iterator[date]:
+    """Lazily yield the occurrences of a rule from `dtstart`, or from `after`.
+
+    Without COUNT the periods before `after` are skipped arithmetically, so
+    the cost does not grow with the distance from `dtstart`. Rules matching
+    nothing for MAX_EMPTY_PERIODS periods in a row stop, and so do rules
+    running past the last representable date.
+    """
+
+    period = 0
+    if after is not None and rule.count is None:
+        period = first_period(rule, dtstart, after)
+
+    emitted = 0
+    empty_periods = 0
+
+    while empty_periods < MAX_EMPTY_PERIODS:
+        try:
+            candidates = period_candidates(rule, dtstart, period)
+        except (OverflowError, ValueError):
+            return
+
+        candidates = [day for day in candidates if day >= dtstart]
+        empty_periods = 0 if candidates else empty_periods + 1
+
+        for day in candidates:
+            if rule.until is not None and day > rule.until:
+                return
+
+            emitted += 1
+            if after is None or day >= after:
+                yield day
+            if rule.count is not None and emitted >= rule.count:
+                return
+
+        period += 1
+
+
+def occurrences_between(
+    rule: RecurrenceRule, dtstart: date, start: date, end: date, limit: int
+) -> list[date]:
+    """At most `limit` occurrences within [start, end]."""
+
+    occurrences = []
+
+    for day in iter_occurrences(rule, dtstart, after=start):
+        if day > end or len(occurrences) >= limit:
+            break
+        occurrences.append(day)
+
+    return occurrences
+
+
+@lru_cache(maxsize=4096)
+def next_occurrences(text: str, dtstart: date, after: date, n: int) -> tuple[date, ...]:
+    """The next `n` occurrences on or after `after`, cached per day."""
+
+    return tuple(islice(iter_occurrences(compile_rule(text), dtstart, after), n))
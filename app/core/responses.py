@@ -0,0 +1,17 @@
+"""Import necessary libraries for fast JSON responses."""
+
+from typing import Any
+
+import orjson
+from fastapi.responses import JSONResponse
+
+
+class FastJSONResponse(JSONResponse):
+    """JSON response rendered by orjson instead of the json module.
+
+    FastAPI hands it content already dumped by the response model, so this
+    only replaces the final encoding step, several times faster for lists.
+    """
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS)
@@ -0,0 +1,129 @@
+"""Import necessary libraries for the workspace role cache."""
+
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Iterable
+from uuid import UUID
+
+from app.core.config import settings
+
+MISSING = object()
+
+
+class RoleCache:
+    """Per-process TTL/LRU cache of (user, workspace) -> role.
+
+    Every workspace has a version bumped by membership changes. Entries
+    remember the version they were loaded at and are ignored once it moved,
+    and loads started before a change are not stored at all. A None role,
+    meaning "not a member", is cached like any other.
+    """
+
+    def __init__(
+        self,
+        max_size: int,
+        ttl_seconds: float,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.max_size = max_size
+        self.ttl_seconds = ttl_seconds
+        self.hits = 0
+        self.misses = 0
+
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[tuple[UUID, UUID], tuple[float, int, str | None]] = (
+            OrderedDict()
+        )
+        self._versions: dict[UUID, int] = {}
+
+    def versions(self, workspace_ids: Iterable[UUID]) -> dict[UUID, int]:
+        """Current membership versions of many workspaces."""
+
+        with self._lock:
+            return {
+                workspace_id: self._versions.get(workspace_id, 0)
+                for workspace_id in workspace_ids
+            }
+
+    def get_many(
+        self, user_id: UUID, workspace_ids: Iterable[UUID]
+    ) -> tuple[dict[UUID, str | None], list[UUID]]:
+        """Split workspaces into cached roles and ids that must be loaded."""
+
+        found: dict[UUID, str | None] = {}
+        missing: list[UUID] = []
+        now = self._clock()
+
+        with self._lock:
+            for workspace_id in workspace_ids:
+                key = (user_id, workspace_id)
+                entry = self._entries.get(key, MISSING)
+
+                if entry is MISSING:
+                    missing.append(workspace_id)
+                    continue
+
+                expires_at, version, role = entry
+                if expires_at <= now or version != self._versions.get(workspace_id, 0):
+                    del self._entries[key]
+                    missing.append(workspace_id)
+                    continue
+
+                self._entries.move_to_end(key)
+                found[workspace_id] = role
+
+            self.hits += len(found)
+            self.misses += len(missing)
+
+        return found, missing
+
+    def set_many(
+        self,
+        user_id: UUID,
+        roles: dict[UUID, str | None],
+        versions: dict[UUID, int],
+    ) -> None:
+        """Store loaded roles, skipping workspaces changed since `versions`."""
+
+        if self.max_size <= 0 or self.ttl_seconds <= 0:
+            return
+
+        expires_at = self._clock() + self.ttl_seconds
+
+        with self._lock:
+            for workspace_id, role in roles.items():
+                version = versions[workspace_id]
+                if version != self._versions.get(workspace_id, 0):
+                    continue
+
+                key = (user_id, workspace_id)
+                self._entries[key] = (expires_at, version, role)
+                self._entries.move_to_end(key)
+
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def invalidate_workspace(self, workspace_id: UUID) -> None:
+        """Outdate every cached role of a workspace after a membership change."""
+
+        with self._lock:
+            self._versions[workspace_id] = self._versions.get(workspace_id, 0) + 1
+
+    def clear(self) -> None:
+        """Drop every entry and reset the counters."""
+
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+role_cache = RoleCache(
+    max_size=settings.ROLE_CACHE_MAX_SIZE,
+    ttl_seconds=settings.ROLE_CACHE_TTL_SECONDS,
+)
@@ -1,7 +1,20 @@
 """Import necessary libraries for password hashing."""
 
+import asyncio
+import hashlib
+import hmac
+import os
+import threading
+from collections.abc import Callable
+from concurrent.futures import Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any
+from uuid import UUID
+
 from passlib.context import CryptContext
 
+from app.core.config import settings
+from app.core.domain_errors import ServiceBusy
+
 pwd_context = CryptContext(
     schemes=["argon2"],
     deprecated="auto",
@@ -20,13 +33,136 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
     return pwd_context.verify(plain_password, hashed_password)
 
 
-def hash_reset_code(code: str) -> str:
-    """Hash a plain code using bcrypt."""
+# Reset codes
+
+RESET_CODE_SCHEME = "hmac-sha256$"
+
+
+def get_reset_code_key() -> bytes:
+    """Return the server secret used to key reset code hashes."""
+
+    if settings.RESET_CODE_SECRET_KEY:
+        return settings.RESET_CODE_SECRET_KEY.encode()
+
+    return hmac.new(
+        settings.JWT_SECRET_KEY.encode(), b"donee-reset-code", hashlib.sha256
+    ).digest()
+
+
+def is_legacy_reset_code_hash(hashed_code: str) -> bool:
+    """Tell whether a stored reset code hash predates the keyed scheme."""
+
+    return not hashed_code.startswith(RESET_CODE_SCHEME)
+
+
+def hash_reset_code(code: str, user_id: UUID) -> str:
+    """Hash a plain code with a keyed HMAC bound to the user."""
 
-    return pwd_context.hash(code)
+    digest = hmac.new(
+        get_reset_code_key(), f"{user_id}:{code}".encode(), hashlib.sha256
+    ).hexdigest()
 
+    return f"{RESET_CODE_SCHEME}{digest}"
 
-def verify_reset_code(plain_code: str, hashed_code: str) -> bool:
+
+def verify_reset_code(plain_code: str, hashed_code: str, user_id: UUID) -> bool:
     """Verify a plain reset code against its hashed version."""
 
-    return pwd_context.verify(plain_code, hashed_code)
+    if is_legacy_reset_code_hash(hashed_code):
+        return pwd_context.verify(plain_code, hashed_code)
+
+    return hmac.compare_digest(hash_reset_code(plain_code, user_id), hashed_code)
+
+
+# Hashing executor
+
+
+class HashingExecutor:
+    """Bounded worker pool that keeps Argon2 off the request threads."""
+
+    def __init__(self, kind: str, max_workers: int, max_pending: int) -> None:
+        if kind not in ("process", "thread"):
+            raise ValueError(f"Unknown hashing executor kind: {kind!r}")
+
+        self.kind = kind
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.max_pending = max_pending
+
+        self._slots = threading.BoundedSemaphore(max_pending)
+        self._lock = threading.Lock()
+        self._pool: Executor | None = None
+
+    def _get_pool(self) -> Executor:
+        """Create the underlying pool on first use."""
+
+        with self._lock:
+            if self._pool is None:
+                if self.kind == "process":
+                    self._pool = ProcessPoolExecutor(max_workers=self.max_workers)
+                else:
+                    self._pool = ThreadPoolExecutor(
+                        max_workers=self.max_workers,
+                        thread_name_prefix="hashing",
+                    )
+            return self._pool
+
+    def submit(self, fn: Callable[..., Any], *args: Any) -> Future:
+        """Queue a hashing job or raise ServiceBusy when the queue is full."""
+
+        if not self._slots.acquire(blocking=False):
+            raise ServiceBusy()
+
+        try:
+            future = self._get_pool().submit(fn, *args)
+        except BaseException:
+            self._slots.release()
+            raise
+
+        future.add_done_callback(lambda _: self._slots.release())
+        return future
+
+    async def run(self, fn: Callable[..., Any], *args: Any) -> Any:
+        """Await a hashing job without blocking the event loop."""
+
+        return await asyncio.wrap_future(self.submit(fn, *args))
+
+    def shutdown(self) -> None:
+        """Stop the workers; the pool is recreated on the next submit."""
+
+        with self._lock:
+            pool, self._pool = self._pool, None
+
+        if pool is not None:
+            pool.shutdown(wait=True, cancel_futures=True)
+
+
+hashing_executor = HashingExecutor(
+    kind=settings.HASHING_EXECUTOR,
+    max_workers=settings.HASHING_MAX_WORKERS,
+    max_pending=settings.HASHING_MAX_PENDING,
+)
+
+
+async def hash_password_async(password: str) -> str:
+    """Hash a plain password on the hashing executor."""
+
+    return await hashing_executor.run(hash_password, password)
+
+
+async def verify_password_async(plain_password: str, hashed_password: str) -> bool:
+    """Verify a plain password on the hashing executor."""
+
+    return await hashing_executor.run(verify_password, plain_password, hashed_password)
+
+
+async def verify_reset_code_async(
+    plain_code: str, hashed_code: str, user_id: UUID
+) -> bool:
+    """Verify a reset code, sending only legacy Argon2 hashes to the executor."""
+
+    if is_legacy_reset_code_hash(hashed_code):
+        return await hashing_executor.run(
+            verify_reset_code, plain_code, hashed_code, user_id
+        )
+
+    return verify_reset_code(plain_code, hashed_code, user_id)
@@ -0,0 +1,290 @@
+"""Import necessary libraries for content-addressed file storage."""
+
+import hashlib
+import os
+import tempfile
+from collections.abc import AsyncIterator
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Protocol
+from urllib.parse import quote
+
+from starlette.concurrency import run_in_threadpool
+from starlette.requests import Request
+from starlette.responses import FileResponse, Response, StreamingResponse
+
+from app.core.conditional import etag_matches
+from app.core.config import settings
+from app.core.domain_errors import (
+    InvalidContentLength,
+    PayloadTooLarge,
+    RangeNotSatisfiable,
+)
+
+CHUNK_SIZE = 1024 * 1024
+
+
+@dataclass(frozen=True)
+class StoredObject:
+    """A stored blob, addressed by the SHA-256 of its content."""
+
+    sha256: str
+    size: int
+
+    @property
+    def key(self) -> str:
+        return f"{self.sha256[:2]}/{self.sha256[2:4]}/{self.sha256}"
+
+    @property
+    def etag(self) -> str:
+        return object_etag(self.key)
+
+
+# Backends
+
+
+class StorageBackend(Protocol):
+    """Blob store that keeps objects under content-addressed keys."""
+
+    staging_dir: Path
+
+    async def exists(self, key: str) -> bool:
+        """Tell whether an object is already stored."""
+
+    async def store(self, key: str, staged_path: Path) -> None:
+        """Move a staged local file under `key`, taking ownership of it."""
+
+    def local_path(self, key: str) -> Path | None:
+        """Return a path the object can be served from, or None."""
+
+    def iter_range(self, key: str, start: int, end: int) -> AsyncIterator[bytes]:
+        """Stream the bytes [start, end) of an object in chunks."""
+
+
+class LocalStorage:
+    """Filesystem backend, objects are served straight from their files."""
+
+    def __init__(self, root: str | Path) -> None:
+        self.root = Path(root)
+        self.staging_dir = self.root / "tmp"
+
+    def path(self, key: str) -> Path:
+        return self.root / "objects" / key
+
+    async def exists(self, key: str) -> bool:
+        return await run_in_threadpool(self.path(key).exists)
+
+    async def store(self, key: str, staged_path: Path) -> None:
+        def move() -> None:
+            target = self.path(key)
+            target.parent.mkdir(parents=True, exist_ok=True)
+            os.replace(staged_path, target)
+
+        await run_in_threadpool(move)
+
+    def local_path(self, key: str) -> Path | None:
+        return self.path(key)
+
+    async def iter_range(self, key: str, start: int, end: int) -> AsyncIterator[bytes]:
+        with open(self.path(key), "rb") as file:
+            await run_in_threadpool(file.seek, start)
+            remaining = end - start
+
+            while remaining > 0:
+                chunk = await run_in_threadpool(file.read, min(CHUNK_SIZE, remaining))
+                if not chunk:
+                    return
+                remaining -= len(chunk)
+                yield chunk
+
+
+class InMemoryObjectStore:
+    """In-process stand-in for a remote object store."""
+
+    def __init__(self) -> None:
+        self.staging_dir = Path(tempfile.gettempdir())
+        self.objects: dict[str, bytes] = {}
+
+    async def exists(self, key: str) -> bool:
+        return key in self.objects
+
+    async def store(self, key: str, staged_path: Path) -> None:
+        self.objects[key] = staged_path.read_bytes()
+        staged_path.unlink()
+
+    def local_path(self, key: str) -> Path | None:
+        return None
+
+    async def iter_range(self, key: str, start: int, end: int) -> AsyncIterator[bytes]:
+        data = self.objects[key]
+
+        for offset in range(start, end, CHUNK_SIZE):
+            yield data[offset : min(offset + CHUNK_SIZE, end)]
+
+
+# Helpers
+
+
+def object_etag(key: str) -> str:
+    """Strong ETag of an object, its content hash."""
+
+    return f'"{key.rsplit("/", 1)[-1]}"'
+
+
+def write_chunk(file, digest, chunk: bytes) -> None:
+    """Hash and write one chunk, run off the event loop."""
+
+    digest.update(chunk)
+    file.write(chunk)
+
+
+def check_declared_size(
+    header: str | None, max_size: int = settings.ATTACHMENT_MAX_SIZE_BYTES
+) -> None:
+    """Reject an upload whose Content-Length is malformed or over the limit."""
+
+    if header is None:
+        return
+
+    if not header.isascii() or not header.isdigit():
+        raise InvalidContentLength()
+
+    if int(header) > max_size:
+        raise PayloadTooLarge()
+
+
+async def save_stream(
+    storage: StorageBackend,
+    chunks: AsyncIterator[bytes],
+    max_size: int = settings.ATTACHMENT_MAX_SIZE_BYTES,
+) -> StoredObject:
+    """Stream an upload to a staging file, then store it once per content.
+
+    Only one chunk is held in memory at a time. When an object with the same
+    hash already exists the staged copy is dropped instead of stored.
+    """
+
+    digest = hashlib.sha256()
+    size = 0
+    storage.staging_dir.mkdir(parents=True, exist_ok=True)
+    file = tempfile.NamedTemporaryFile(dir=storage.staging_dir, delete=False)
+    staged_path = Path(file.name)
+
+    try:
+        with file:
+            async for chunk in chunks:
+                size += len(chunk)
+                if size > max_size:
+                    raise PayloadTooLarge()
+                await run_in_threadpool(write_chunk, file, digest, chunk)
+
+        stored = StoredObject(sha256=digest.hexdigest(), size=size)
+
+        if await storage.exists(stored.key):
+            staged_path.unlink()
+        else:
+            await storage.store(stored.key, staged_path)
+
+    except BaseException:
+        staged_path.unlink(missing_ok=True)
+        raise
+
+    return stored
+
+
+def parse_range(header: str, size: int) -> tuple[int, int] | None:
+    """Parse a single `bytes=` range into [start, end), None to send it all.
+
+    Multiple ranges are answered with the whole object, as HTTP allows.
+    """
+
+    units, _, spec = header.partition("=")
+
+    if units.strip() != "bytes" or "," in spec:
+        return None
+
+    first, _, last = spec.strip().partition("-")
+
+    try:
+        if first:
+            start = int(first)
+            end = int(last) + 1 if last else size
+        else:
+            start = max(size - int(last), 0)
+            end = size
+    except ValueError:
+        return None
+
+    if start >= size or start >= end:
+        raise RangeNotSatisfiable(size)
+
+    return start, min(end, size)
+
+
+def content_disposition(filename: str) -> str:
+    """Content-Disposition header offering the file for download."""
+
+    quoted = quote(filename)
+    if quoted != filename:
+        return f"attachment; filename*=utf-8''{quoted}"
+    return f'attachment; filename="{filename}"'
+
+
+def object_response(
+    storage: StorageBackend,
+    request: Request,
+    key: str,
+    size: int,
+    media_type: str | None,
+    filename: str,
+) -> Response:
+    """Serve an object honouring If-None-Match, Range and If-Range.
+
+    Local files go through FileResponse, which handles ranges itself and
+    uses the server zero-copy `pathsend` extension when available. Other
+    backends stream the requested range chunk by chunk.
+    """
+
+    etag = object_etag(key)
+    if_none_match = request.headers.get("if-none-match")
+
+    if if_none_match is not None and etag_matches(if_none_match, etag):
+        return Response(status_code=304, headers={"ETag": etag})
+
+    path = storage.local_path(key)
+    if path is not None:
+        return FileResponse(
+            path, media_type=media_type, filename=filename, headers={"ETag": etag}
+        )
+
+    headers = {
+        "ETag": etag,
+        "Accept-Ranges": "bytes",
+        "Content-Disposition": content_disposition(filename),
+    }
+    byte_range = None
+
+    if "range" in request.headers and request.headers.get("if-range", etag) == etag:
+        byte_range = parse_range(request.headers["range"], size)
+
+    start, end = byte_range or (0, size)
+    headers["Content-Length"] = str(end - start)
+
+    if byte_range is not None:
+        headers["Content-Range"] = f"bytes {start}-{end - 1}/{size}"
+
+    return StreamingResponse(
+        storage.iter_range(key, start, end),
+        status_code=206 if byte_range is not None else 200,
+        media_type=media_type,
+        headers=headers,
+    )
+
+
+storage = LocalStorage(settings.STORAGE_ROOT)
+
+
+def get_storage() -> StorageBackend:
+    """Return the configured storage backend."""
+
+    return storage
@@ -1,5 +1,18 @@
 """Import necessary libraries for models and migration."""
 
+from sqlalchemy.ext.compiler import compiles
 from sqlalchemy.orm import declarative_base
+from sqlalchemy.sql import functions
 
 Base = declarative_base()
+
+
+@compiles(functions.now, "sqlite")
+def sqlite_now(element, compiler, **kw) -> str:
+    """Render now() with microseconds on SQLite.
+
+    CURRENT_TIMESTAMP stores whole seconds in a different text format than
+    the one SQLAlchemy binds, which breaks (created_at, id) keyset cursors.
+    """
+
+    return "STRFTIME('%Y-%m-%d %H:%M:%f000', 'now')"
@@ -0,0 +1,34 @@
+"""Import necessary libraries for dialect specific statements."""
+
+from typing import Any
+
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.exc import IntegrityError
+
+INSERTS = {
+    "postgresql": pg_insert,
+    "sqlite": sqlite_insert,
+}
+
+
+def dialect_insert(dialect_name: str, table: Any):
+    """Return an INSERT supporting ON CONFLICT for the given dialect."""
+
+    try:
+        return INSERTS[dialect_name](table)
+    except KeyError as error:
+        raise NotImplementedError(
+            f"Upserts are not supported on {dialect_name!r}."
+        ) from error
+
+
+def is_unique_violation(error: IntegrityError, constraint: str, column: str) -> bool:
+    """Tell whether an IntegrityError was raised by a given unique constraint.
+
+    PostgreSQL and SQLite expression indexes report the constraint name,
+    other SQLite unique constraints the table.column pair.
+    """
+
+    message = str(error.orig)
+    return constraint in message or f"UNIQUE constraint failed: {column}" in message
@@ -0,0 +1,32 @@
+"""Import every model so the mappers and the metadata are complete."""
+
+from app.db import search_index  # noqa: F401
+from app.db.base import Base
+from app.models.auth.password_reset import PasswordResetToken
+from app.models.auth.user import User
+from app.models.project.project import Project
+from app.models.tag.tag import Tag
+from app.models.task.attachment import Attachment
+from app.models.task.comment import Comment
+from app.models.task.reminder import Reminder
+from app.models.task.task import Task
+from app.models.task.task_status_count import TaskStatusCount
+from app.models.task.task_tag import TaskTag
+from app.models.workspace.workspace import Workspace
+from app.models.workspace.workspace_member import WorkspaceMember
+
+__all__ = [
+    "Attachment",
+    "Base",
+    "Comment",
+    "PasswordResetToken",
+    "Project",
+    "Reminder",
+    "Tag",
+    "Task",
+    "TaskStatusCount",
+    "TaskTag",
+    "User",
+    "Workspace",
+    "WorkspaceMember",
+]
@@ -0,0 +1,169 @@
+"""Import necessary libraries for SQL statement instrumentation."""
+
+import logging
+import time
+from collections import Counter
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+
+from sqlalchemy import Engine, event
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class QueryStats:
+    """Statements sent while tracking, with their total time and shapes.
+
+    The shape of a statement is its SQL text, parameters left as
+    placeholders, so the lazy loads of an N+1 share one shape.
+    """
+
+    count: int = 0
+    seconds: float = 0.0
+    shapes: Counter = field(default_factory=Counter)
+
+    def record(self, statement: str, seconds: float) -> None:
+        self.count += 1
+        self.seconds += seconds
+        self.shapes[statement] += 1
+
+    def suspects(
+        self, threshold: int = settings.QUERY_N_PLUS_ONE_THRESHOLD
+    ) -> list[tuple[str, int]]:
+        """Shapes sent at least `threshold` times, most repeated first."""
+
+        return [
+            (statement, count)
+            for statement, count in self.shapes.most_common()
+            if count >= threshold
+        ]
+
+
+class QueryBudgetExceeded(AssertionError):
+    """Raised when a block sends more statements than its budget."""
+
+
+# Statements of the current request, set by the middleware.
+_request_stats: ContextVar[QueryStats | None] = ContextVar(
+    "request_query_stats", default=None
+)
+
+# Process wide observers, for tests and benchmarks driving other threads.
+_observers: list[QueryStats] = []
+
+# Helpers
+
+
+def before_cursor_execute(conn, cursor, statement, parameters, context, many):
+    conn.info.setdefault("query_start", []).append(time.perf_counter())
+
+
+def after_cursor_execute(conn, cursor, statement, parameters, context, many):
+    seconds = time.perf_counter() - conn.info["query_start"].pop()
+
+    stats = _request_stats.get()
+    if stats is not None:
+        stats.record(statement, seconds)
+
+    for observer in _observers:
+        observer.record(statement, seconds)
+
+
+def instrument(engine: Engine) -> None:
+    """Report the statements of an engine, async engines by their sync_engine."""
+
+    if not event.contains(engine, "after_cursor_execute", after_cursor_execute):
+        event.listen(engine, "before_cursor_execute", before_cursor_execute)
+        event.listen(engine, "after_cursor_execute", after_cursor_execute)
+
+
+# Main services
+
+
+@contextmanager
+def track_queries() -> Iterator[QueryStats]:
+    """Collect the statements of the current context, threadpool calls included."""
+
+    stats = QueryStats()
+    token = _request_stats.set(stats)
+
+    try:
+        yield stats
+    finally:
+        _request_stats.reset(token)
+
+
+@contextmanager
+def observe_queries() -> Iterator[QueryStats]:
+    """Collect every statement of the process, whatever thread sends it."""
+
+    stats = QueryStats()
+    _observers.append(stats)
+
+    try:
+        yield stats
+    finally:
+        _observers.remove(stats)
+
+
+@contextmanager
+def query_budget(max_queries: int) -> Iterator[QueryStats]:
+    """Fail the block when it sends more than `max_queries` statements."""
+
+    with observe_queries() as stats:
+        yield stats
+
+    if stats.count > max_queries:
+        repeated = "".join(
+            f"\n  {count}x {statement}" for statement, count in stats.suspects()
+        )
+        raise QueryBudgetExceeded(
+            f"{stats.count} statements sent, budget {max_queries}.{repeated}"
+        )
+
+
+# Middleware
+
+
+class QueryStatsMiddleware:
+    """Report the statements of every HTTP request in response headers.
+
+    Meant for development, requests repeating a statement shape are also
+    logged as N+1 suspects.
+    """
+
+    def __init__(self, app) -> None:
+        self.app = app
+
+    async def __call__(self, scope, receive, send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        async def send_with_stats(message) -> None:
+            if message["type"] == "http.response.start":
+                message["headers"] = [
+                    *message.get("headers", []),
+                    (b"x-query-count", str(stats.count).encode()),
+                    (b"x-query-time-ms", f"{stats.seconds * 1000:.2f}".encode()),
+                    (b"x-query-suspects", str(len(stats.suspects())).encode()),
+                ]
+
+            await send(message)
+
+        with track_queries() as stats:
+            await self.app(scope, receive, send_with_stats)
+
+        for statement, count in stats.suspects():
+            logger.warning(
+                "Possible N+1 on %s %s: %d x %s",
+                scope["method"],
+                scope["path"],
+                count,
+                statement,
+            )
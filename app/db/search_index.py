@@ -0,0 +1,78 @@
+"""Import necessary libraries for the full-text search indexes.
+
+PostgreSQL gets a generated tsvector column with a GIN index on tasks and
+comments. SQLite gets FTS5 tables over the same columns, kept in sync by
+triggers. Both are maintained by the database on every write.
+"""
+
+from sqlalchemy import DDL, event
+
+from app.models.task.comment import Comment
+from app.models.task.task import Task
+
+SEARCH_CONFIG = "english"
+
+# PostgreSQL
+
+PG_DDL = {
+    Task.__table__: [
+        "ALTER TABLE tasks ADD COLUMN search_vector tsvector GENERATED ALWAYS AS ("
+        f"setweight(to_tsvector('{SEARCH_CONFIG}', coalesce(title, '')), 'A') || "
+        f"setweight(to_tsvector('{SEARCH_CONFIG}', coalesce(description, '')), 'B')"
+        ") STORED",
+        "CREATE INDEX idx_tasks_search_vector ON tasks USING GIN (search_vector)",
+    ],
+    Comment.__table__: [
+        "ALTER TABLE comments ADD COLUMN search_vector tsvector GENERATED ALWAYS AS ("
+        f"to_tsvector('{SEARCH_CONFIG}', body)"
+        ") STORED",
+        "CREATE INDEX idx_comments_search_vector ON comments USING GIN (search_vector)",
+    ],
+}
+
+# SQLite
+
+
+def sqlite_fts_ddl(table: str, columns: list[str]) -> list[str]:
+    """FTS5 external content table over `columns` of `table` and its triggers."""
+
+    fts = f"{table}_fts"
+    names = ", ".join(columns)
+    new = ", ".join(f"new.{column}" for column in columns)
+    old = ", ".join(f"old.{column}" for column in columns)
+    delete = (
+        f"INSERT INTO {fts}({fts}, rowid, {names}) VALUES ('delete', old.rowid, {old});"
+    )
+    insert = f"INSERT INTO {fts}(rowid, {names}) VALUES (new.rowid, {new});"
+
+    return [
+        f"CREATE VIRTUAL TABLE {fts} USING fts5({names}, content='{table}', "
+        "content_rowid='rowid', tokenize='porter unicode61')",
+        f"CREATE TRIGGER {fts}_insert AFTER INSERT ON {table} BEGIN {insert} END",
+        f"CREATE TRIGGER {fts}_delete AFTER DELETE ON {table} BEGIN {delete} END",
+        f"CREATE TRIGGER {fts}_update AFTER UPDATE OF {names} ON {table} "
+        f"BEGIN {delete} {insert} END",
+    ]
+
+
+SQLITE_DDL = {
+    Task.__table__: sqlite_fts_ddl("tasks", ["title", "description"]),
+    Comment.__table__: sqlite_fts_ddl("comments", ["body"]),
+}
+
+
+for table, statements in PG_DDL.items():
+    for statement in statements:
+        event.listen(
+            table, "after_create", DDL(statement).execute_if(dialect="postgresql")
+        )
+
+for table, statements in SQLITE_DDL.items():
+    for statement in statements:
+        event.listen(table, "after_create", DDL(statement).execute_if(dialect="sqlite"))
+
+    event.listen(
+        table,
+        "before_drop",
+        DDL(f"DROP TABLE IF EXISTS {table.name}_fts").execute_if(dialect="sqlite"),
+    )
@@ -1,16 +1,49 @@
 """Import necessary libraries for db initialization."""
 
-from collections.abc import Generator
+from collections.abc import AsyncGenerator, Generator
 
 from sqlalchemy import create_engine
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import Session, sessionmaker
 
 from app.core.config import settings
+from app.db.query_stats import instrument
+
+ASYNC_DRIVERS = {
+    "postgresql": "postgresql+asyncpg",
+    "sqlite": "sqlite+aiosqlite",
+}
+
+
+def to_async_url(url: str) -> str:
+    """Swap the driver of a sync database URL for its asyncio counterpart."""
+
+    url_obj = make_url(url)
+    driver = ASYNC_DRIVERS.get(url_obj.get_backend_name())
+
+    if driver is not None:
+        url_obj = url_obj.set(drivername=driver)
+
+    return url_obj.render_as_string(hide_password=False)
+
+
+def to_plain_dsn(url: str) -> str:
+    """Drop the SQLAlchemy driver of a database URL, for native clients."""
+
+    url_obj = make_url(url)
+    url_obj = url_obj.set(drivername=url_obj.get_backend_name())
+
+    return url_obj.render_as_string(hide_password=False)
+
+
+# Sync stack
 
 engine = create_engine(
     settings.DATABASE_URL,
     pool_pre_ping=True,
 )
+instrument(engine)
 
 SessionLocal = sessionmaker(
     autocommit=False,
@@ -27,3 +60,25 @@ def get_db() -> Generator[Session, None, None]:
         yield db
     finally:
         db.close()
+
+
+# Async stack
+
+async_engine = create_async_engine(
+    settings.ASYNC_DATABASE_URL or to_async_url(settings.DATABASE_URL),
+    pool_pre_ping=True,
+)
+instrument(async_engine.sync_engine)
+
+AsyncSessionLocal = async_sessionmaker(
+    autoflush=False,
+    expire_on_commit=False,
+    bind=async_engine,
+)
+
+
+async def get_async_db() -> AsyncGenerator[AsyncSession, None]:
+    """FastAPI dependency for the asyncio stack."""
+
+    async with AsyncSessionLocal() as db:
+        yield db
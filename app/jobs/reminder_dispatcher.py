@@ -0,0 +1,130 @@
+"""Import necessary libraries for the reminder dispatcher.
+
+Run one dispatcher per process with `python -m app.jobs.reminder_dispatcher`;
+start as many processes as throughput needs, batches never overlap.
+"""
+
+import argparse
+import asyncio
+import logging
+from collections.abc import Callable, Mapping
+from dataclasses import dataclass
+from datetime import datetime
+
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.core.clock import utc_now
+from app.core.config import settings
+from app.core.notifications import ReminderChannel, default_channels
+from app.db import models  # noqa: F401
+from app.db.session import AsyncSessionLocal
+from app.services.reminder_service import (
+    dispatch_due_reminders,
+    get_pending_lag_seconds,
+)
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class DispatchMetrics:
+    """Counters and lag gauges of one dispatcher process."""
+
+    batches: int = 0
+    sent: int = 0
+    failed: int = 0
+    last_lag_seconds: float = 0.0
+    max_lag_seconds: float = 0.0
+    pending_lag_seconds: float = 0.0
+
+    def observe(self, sent: int, failed: int, lags: list[float]) -> None:
+        """Record one dispatched batch."""
+
+        self.batches += 1
+        self.sent += sent
+        self.failed += failed
+
+        if lags:
+            self.last_lag_seconds = max(lags)
+            self.max_lag_seconds = max(self.max_lag_seconds, self.last_lag_seconds)
+
+
+async def dispatch_reminders(
+    session_factory: async_sessionmaker[AsyncSession] = AsyncSessionLocal,
+    channels: Mapping[str, ReminderChannel] | None = None,
+    batch_size: int = settings.REMINDER_BATCH_SIZE,
+    metrics: DispatchMetrics | None = None,
+    clock: Callable[[], datetime] = utc_now,
+) -> int:
+    """Dispatch due reminders batch by batch until none is left to claim."""
+
+    channels = default_channels() if channels is None else channels
+    metrics = DispatchMetrics() if metrics is None else metrics
+    total = 0
+
+    while True:
+        async with session_factory() as db:
+            result = await dispatch_due_reminders(db, channels, clock(), batch_size)
+
+        if result.sent or result.failed:
+            metrics.observe(len(result.sent), len(result.failed), result.lags)
+        total += len(result.sent)
+
+        # Failed reminders back off, a full batch means more may be due.
+        if len(result.sent) + len(result.failed) < batch_size:
+            break
+
+        await asyncio.sleep(0)
+
+    async with session_factory() as db:
+        metrics.pending_lag_seconds = await get_pending_lag_seconds(db, clock())
+
+    return total
+
+
+async def run_reminder_dispatcher(
+    interval_seconds: float = settings.REMINDER_POLL_INTERVAL_SECONDS,
+    channels: Mapping[str, ReminderChannel] | None = None,
+) -> None:
+    """Dispatch due reminders forever, polling every `interval_seconds`."""
+
+    channels = default_channels() if channels is None else channels
+    metrics = DispatchMetrics()
+
+    while True:
+        try:
+            sent = await dispatch_reminders(channels=channels, metrics=metrics)
+        except Exception:
+            logger.exception("Reminder dispatch failed.")
+        else:
+            if sent or metrics.pending_lag_seconds:
+                logger.info(
+                    "Sent %d reminders, lag %.1fs, pending lag %.1fs, failed %d.",
+                    sent,
+                    metrics.last_lag_seconds,
+                    metrics.pending_lag_seconds,
+                    metrics.failed,
+                )
+
+        await asyncio.sleep(interval_seconds)
+
+
+def main() -> None:
+    """Run a dispatcher process."""
+
+    parser = argparse.ArgumentParser(description="Dispatch due reminders.")
+    parser.add_argument(
+        "--once", action="store_true", help="dispatch what is due, then exit"
+    )
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO)
+
+    if args.once:
+        asyncio.run(dispatch_reminders())
+    else:
+        asyncio.run(run_reminder_dispatcher())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,48 @@
+"""Import necessary libraries for the reset token sweeper."""
+
+import asyncio
+import logging
+
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.core.config import settings
+from app.db.session import AsyncSessionLocal
+from app.services.password_reset_service import delete_expired_reset_tokens
+
+logger = logging.getLogger(__name__)
+
+
+async def sweep_expired_reset_tokens(
+    session_factory: async_sessionmaker[AsyncSession] = AsyncSessionLocal,
+    batch_size: int = settings.RESET_TOKEN_SWEEP_BATCH_SIZE,
+) -> int:
+    """Delete expired reset tokens batch by batch, yielding between batches."""
+
+    total = 0
+
+    while True:
+        async with session_factory() as db:
+            deleted = await delete_expired_reset_tokens(db, batch_size)
+
+        total += deleted
+        if deleted < batch_size:
+            return total
+
+        await asyncio.sleep(0)
+
+
+async def run_reset_token_sweeper(
+    interval_seconds: float = settings.RESET_TOKEN_SWEEP_INTERVAL_SECONDS,
+) -> None:
+    """Sweep expired reset tokens forever, every `interval_seconds`."""
+
+    while True:
+        await asyncio.sleep(interval_seconds)
+
+        try:
+            deleted = await sweep_expired_reset_tokens()
+        except Exception:
+            logger.exception("Reset token sweep failed.")
+        else:
+            if deleted:
+                logger.info("Deleted %d expired reset tokens.", deleted)
@@ -0,0 +1,36 @@
+"""Import necessary libraries for the task count reconciler."""
+
+import asyncio
+import logging
+
+from sqlalchemy.orm import Session, sessionmaker
+
+from app.core.config import settings
+from app.db.session import SessionLocal
+from app.services.task_count_service import reconcile_task_counts
+
+logger = logging.getLogger(__name__)
+
+
+def reconcile(session_factory: sessionmaker[Session] = SessionLocal) -> int:
+    """Fix drifted task status counters, return how many were fixed."""
+
+    with session_factory() as db:
+        return reconcile_task_counts(db)
+
+
+async def run_task_count_reconciler(
+    interval_seconds: float = settings.TASK_COUNT_RECONCILE_INTERVAL_SECONDS,
+) -> None:
+    """Reconcile task status counters forever, every `interval_seconds`."""
+
+    while True:
+        await asyncio.sleep(interval_seconds)
+
+        try:
+            fixed = await asyncio.to_thread(reconcile)
+        except Exception:
+            logger.exception("Task count reconciliation failed.")
+        else:
+            if fixed:
+                logger.warning("Fixed %d drifted task status counters.", fixed)
@@ -0,0 +1,67 @@
+"""Import necessary libraries for the soft deleted task purger."""
+
+import asyncio
+import logging
+from datetime import datetime, timedelta, timezone
+
+from sqlalchemy.orm import Session, sessionmaker
+
+from app.core.config import settings
+from app.db.session import SessionLocal
+from app.services.task_purge_service import purge_deleted_tasks
+
+logger = logging.getLogger(__name__)
+
+
+def purge_batch(
+    deleted_before: datetime,
+    batch_size: int,
+    session_factory: sessionmaker[Session] = SessionLocal,
+) -> int:
+    """Purge one batch of soft deleted tasks in its own session."""
+
+    with session_factory() as db:
+        return purge_deleted_tasks(db, deleted_before, batch_size)
+
+
+async def purge_tasks(
+    session_factory: sessionmaker[Session] = SessionLocal,
+    retention_days: float = settings.TASK_PURGE_RETENTION_DAYS,
+    batch_size: int = settings.TASK_PURGE_BATCH_SIZE,
+    pause_seconds: float = settings.TASK_PURGE_PAUSE_SECONDS,
+    max_batches: int = settings.TASK_PURGE_MAX_BATCHES,
+) -> int:
+    """Purge tasks deleted over `retention_days` ago, pausing between batches."""
+
+    deleted_before = datetime.now(timezone.utc) - timedelta(days=retention_days)
+    total = 0
+
+    for _ in range(max_batches):
+        purged = await asyncio.to_thread(
+            purge_batch, deleted_before, batch_size, session_factory
+        )
+
+        total += purged
+        if purged < batch_size:
+            break
+
+        await asyncio.sleep(pause_seconds)
+
+    return total
+
+
+async def run_task_purger(
+    interval_seconds: float = settings.TASK_PURGE_INTERVAL_SECONDS,
+) -> None:
+    """Purge old soft deleted tasks forever, every `interval_seconds`."""
+
+    while True:
+        await asyncio.sleep(interval_seconds)
+
+        try:
+            purged = await purge_tasks()
+        except Exception:
+            logger.exception("Task purge failed.")
+        else:
+            if purged:
+                logger.info("Purged %d soft deleted tasks.", purged)
@@ -1,23 +1,85 @@
 """Import libraries for router implementation."""
 
+import asyncio
+import math
+from contextlib import asynccontextmanager, suppress
+
 from fastapi import FastAPI, Request, status
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
 
+from app.api.routes.attachment_routes import router as attachment_router
 from app.api.routes.auth_routes import router as auth_routher
+from app.api.routes.comment_routes import router as comment_router
+from app.api.routes.event_routes import router as event_router
 from app.api.routes.password_reset_routes import router as password_reset_router
+from app.api.routes.search_routes import router as search_router
+from app.api.routes.task_routes import router as task_router
+from app.api.routes.workspace_routes import router as workspace_router
+from app.core.config import settings
 from app.core.domain_errors import (
     DomainError,
     ExistingEmail,
     InvalidCode,
+    InvalidContentLength,
     InvalidCredentials,
+    InvalidCursor,
+    InvalidTask,
     NotFound,
+    PayloadTooLarge,
+    PermissionDenied,
+    RangeNotSatisfiable,
+    RateLimited,
+    ServiceBusy,
     UsernameTaken,
 )
+from app.core.events import PostgresEventBackend, event_hub
+from app.core.responses import FastJSONResponse
+from app.core.security import hashing_executor
+from app.db import models  # noqa: F401
+from app.db.query_stats import QueryStatsMiddleware
+from app.db.session import to_plain_dsn
+from app.jobs.reset_token_sweeper import run_reset_token_sweeper
+from app.jobs.task_count_reconciler import run_task_count_reconciler
+from app.jobs.task_purger import run_task_purger
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Start and stop the application resources."""
+
+    background_tasks = []
+
+    if settings.EVENT_BACKEND == "postgres":
+        event_hub.use(PostgresEventBackend(to_plain_dsn(settings.DATABASE_URL)))
+
+    await event_hub.start()
+
+    if settings.RESET_TOKEN_SWEEP_INTERVAL_SECONDS > 0:
+        background_tasks.append(asyncio.create_task(run_reset_token_sweeper()))
+
+    if settings.TASK_COUNT_RECONCILE_INTERVAL_SECONDS > 0:
+        background_tasks.append(asyncio.create_task(run_task_count_reconciler()))
+
+    if settings.TASK_PURGE_INTERVAL_SECONDS > 0:
+        background_tasks.append(asyncio.create_task(run_task_purger()))
+
+    yield
+
+    for task in background_tasks:
+        task.cancel()
+        with suppress(asyncio.CancelledError):
+            await task
+
+    await event_hub.stop()
+    hashing_executor.shutdown()
+
 
 app = FastAPI(
     title="Donee API",
     version="0.1.0",
+    lifespan=lifespan,
+    default_response_class=FastJSONResponse,
 )
 
 app.add_middleware(
@@ -28,8 +90,17 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+if settings.ENVIRONMENT == "development":
+    app.add_middleware(QueryStatsMiddleware)
+
 app.include_router(auth_routher, prefix="/auth", tags=["auth"])
 app.include_router(password_reset_router, prefix="/auth", tags=["auth"])
+app.include_router(task_router, prefix="/tasks", tags=["tasks"])
+app.include_router(comment_router, tags=["comments"])
+app.include_router(attachment_router, tags=["attachments"])
+app.include_router(search_router, prefix="/search", tags=["search"])
+app.include_router(workspace_router, prefix="/workspaces", tags=["workspaces"])
+app.include_router(event_router, prefix="/workspaces")
 
 
 @app.exception_handler(DomainError)
@@ -38,6 +109,7 @@ async def domain_error_handler(request: Request, exc: DomainError):
 
     status_code = status.HTTP_400_BAD_REQUEST
     detail = "Bad request."
+    headers = None
 
     if isinstance(exc, ExistingEmail):
         detail = "Email already registered."
@@ -55,8 +127,44 @@ async def domain_error_handler(request: Request, exc: DomainError):
         detail = "Resource not found."
         status_code = status.HTTP_404_NOT_FOUND
 
+    elif isinstance(exc, PermissionDenied):
+        detail = "Not enough permissions."
+        status_code = status.HTTP_403_FORBIDDEN
+
     elif isinstance(exc, InvalidCode):
         detail = "Code is invalid or expired."
         status_code = status.HTTP_400_BAD_REQUEST
 
-    return JSONResponse(status_code=status_code, content={"detail": detail})
+    elif isinstance(exc, InvalidCursor):
+        detail = "Invalid pagination cursor."
+        status_code = status.HTTP_400_BAD_REQUEST
+
+    elif isinstance(exc, InvalidTask):
+        detail = str(exc) or "Invalid task."
+        status_code = status.HTTP_400_BAD_REQUEST
+
+    elif isinstance(exc, ServiceBusy):
+        detail = "Service is busy, try again later."
+        status_code = status.HTTP_503_SERVICE_UNAVAILABLE
+
+    elif isinstance(exc, PayloadTooLarge):
+        detail = "File is too large."
+        status_code = status.HTTP_413_CONTENT_TOO_LARGE
+
+    elif isinstance(exc, InvalidContentLength):
+        detail = "Invalid Content-Length header."
+        status_code = status.HTTP_400_BAD_REQUEST
+
+    elif isinstance(exc, RangeNotSatisfiable):
+        detail = "Requested range not satisfiable."
+        status_code = status.HTTP_416_RANGE_NOT_SATISFIABLE
+        headers = {"Content-Range": f"bytes */{exc.size}"}
+
+    elif isinstance(exc, RateLimited):
+        detail = "Too many requests."
+        status_code = status.HTTP_429_TOO_MANY_REQUESTS
+        headers = {"Retry-After": str(math.ceil(exc.retry_after))}
+
+    return JSONResponse(
+        status_code=status_code, content={"detail": detail}, headers=headers
+    )
@@ -3,7 +3,16 @@
 from datetime import datetime
 from uuid import UUID, uuid4
 
-from sqlalchemy import DateTime, ForeignKey, String, func
+import sqlalchemy as sa
+from sqlalchemy import (
+    DateTime,
+    ForeignKey,
+    Index,
+    Integer,
+    String,
+    UniqueConstraint,
+    func,
+)
 from sqlalchemy.dialects.postgresql import UUID as PG_UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
@@ -33,6 +42,12 @@ class PasswordResetToken(Base):
         nullable=False,
     )
 
+    attempts: Mapped[int] = mapped_column(
+        Integer,
+        server_default=sa.text("0"),
+        nullable=False,
+    )
+
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
         server_default=func.now(),
@@ -44,6 +59,11 @@ class PasswordResetToken(Base):
         nullable=False,
     )
 
+    __table_args__ = (
+        UniqueConstraint("user_id", name="unique_password_reset_tokens_user_id"),
+        Index("idx_password_reset_tokens_expires_at", "expires_at"),
+    )
+
     # Foreign key constraints:
 
     user = relationship("User", back_populates="reset_tokens", foreign_keys=[user_id])
@@ -4,7 +4,7 @@ from datetime import datetime
 from uuid import UUID, uuid4
 
 import sqlalchemy as sa
-from sqlalchemy import Boolean, DateTime, String, func
+from sqlalchemy import Boolean, DateTime, Index, String, UniqueConstraint, func
 from sqlalchemy.dialects.postgresql import UUID as PG_UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
@@ -25,7 +25,6 @@ class User(Base):
 
     email: Mapped[str] = mapped_column(
         String(320),
-        unique=True,
         nullable=False,
     )
 
@@ -58,6 +57,11 @@ class User(Base):
         nullable=False,
     )
 
+    __table_args__ = (
+        Index("unique_users_email_lower", func.lower(sa.column("email")), unique=True),
+        UniqueConstraint("username", name="unique_users_username"),
+    )
+
     # Referenced by:
 
     reset_tokens = relationship(
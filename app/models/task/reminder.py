@@ -4,7 +4,15 @@ from datetime import datetime
 from uuid import UUID, uuid4
 
 import sqlalchemy as sa
-from sqlalchemy import CheckConstraint, DateTime, ForeignKey, Index, String, func
+from sqlalchemy import (
+    CheckConstraint,
+    DateTime,
+    ForeignKey,
+    Index,
+    Integer,
+    String,
+    func,
+)
 from sqlalchemy.dialects.postgresql import UUID as PG_UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
@@ -34,10 +42,21 @@ class Reminder(Base):
 
     channel: Mapped[str] = mapped_column(
         String(5),
-        server_default=sa.text("inapp"),
+        server_default=sa.text("'inapp'"),
     )
 
-    status: Mapped[str] = mapped_column(String(8), server_default=sa.text("pending"))
+    status: Mapped[str] = mapped_column(String(8), server_default=sa.text("'pending'"))
+
+    attempts: Mapped[int] = mapped_column(
+        Integer, nullable=False, server_default=sa.text("0")
+    )
+
+    # Starts at remind_at and moves back after every failed delivery.
+    next_attempt_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        nullable=False,
+        default=lambda context: context.get_current_parameters()["remind_at"],
+    )
 
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
@@ -45,9 +64,9 @@ class Reminder(Base):
     )
 
     __table_args__ = (
-        Index("idx_reminders_remind_at_status", "remind_at", "status"),
+        Index("idx_reminders_status_next_attempt_at", "status", "next_attempt_at"),
         CheckConstraint("channel IN ('inapp', 'email', 'push')"),
-        CheckConstraint("status IN ('pending', 'sent', 'canceled')"),
+        CheckConstraint("status IN ('pending', 'sent', 'failed', 'canceled')"),
     )
 
     # Foreign key constraints:
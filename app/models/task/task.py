@@ -18,6 +18,7 @@ from sqlalchemy import (
     func,
 )
 from sqlalchemy.dialects.postgresql import UUID as PG_UUID
+from sqlalchemy.ext.hybrid import hybrid_property
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.db.base import Base
@@ -45,17 +46,17 @@ class Task(Base):
         nullable=False,
     )
 
-    description: Mapped[str] = mapped_column(
+    description: Mapped[str | None] = mapped_column(
         Text,
     )
 
-    status: Mapped[str] = mapped_column(String(11), server_default=sa.text("to do"))
+    status: Mapped[str] = mapped_column(String(11), server_default=sa.text("'to do'"))
 
-    priority: Mapped[int] = mapped_column(
+    priority: Mapped[int | None] = mapped_column(
         SmallInteger(),
     )
 
-    assignee_id: Mapped[UUID] = mapped_column(
+    assignee_id: Mapped[UUID | None] = mapped_column(
         PG_UUID(as_uuid=True),
         ForeignKey("users.id", ondelete="CASCADE"),
     )
@@ -66,30 +67,30 @@ class Task(Base):
         nullable=False,
     )
 
-    due_at: Mapped[date] = mapped_column(
+    due_at: Mapped[date | None] = mapped_column(
         Date,
         index=True,
     )
 
-    start_at: Mapped[date] = mapped_column(
+    start_at: Mapped[date | None] = mapped_column(
         Date,
     )
 
-    completed_at: Mapped[date] = mapped_column(
+    completed_at: Mapped[date | None] = mapped_column(
         Date,
     )
 
-    estimate_minutes: Mapped[int] = mapped_column(
+    estimate_minutes: Mapped[int | None] = mapped_column(
         Integer,
     )
 
-    parent_task_id: Mapped[UUID] = mapped_column(
+    parent_task_id: Mapped[UUID | None] = mapped_column(
         PG_UUID(as_uuid=True),
         ForeignKey("tasks.id", ondelete="CASCADE"),
         index=True,
     )
 
-    recurrence_rule: Mapped[str] = mapped_column(
+    recurrence_rule: Mapped[str | None] = mapped_column(
         Text,
     )
 
@@ -98,6 +99,10 @@ class Task(Base):
         server_default=sa.text("false"),
     )
 
+    deleted_at: Mapped[datetime | None] = mapped_column(
+        DateTime(timezone=True),
+    )
+
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
         server_default=func.now(),
@@ -109,9 +114,22 @@ class Task(Base):
         onupdate=func.now(),
     )
 
+    @hybrid_property
+    def is_live(self) -> bool:
+        """Whether the task is not soft deleted.
+
+        In queries it renders the exact predicate of the partial task indexes,
+        which the planners need to match verbatim to use them.
+        """
+
+        return not self.is_deleted
+
+    @is_live.inplace.expression
+    @classmethod
+    def _is_live_expression(cls):
+        return cls.is_deleted.is_(False)
+
     __table_args__ = (
-        Index("idx_tasks_assignee_id_status", "assignee_id", "status"),
-        Index("idx_tasks_project_id_status", "project_id", "status"),
         CheckConstraint(
             """status IN ('to do', 'in_progress', 'blocked', 'done',
             'archived')""",
@@ -164,3 +182,42 @@ class Task(Base):
         back_populates="task",
         cascade="all, delete-orphan",
     )
+
+
+# Partial indexes, the hot paths index live rows only:
+
+Index(
+    "idx_tasks_assignee_id_status",
+    Task.assignee_id,
+    Task.status,
+    Task.created_at,
+    Task.id,
+    postgresql_where=Task.is_live,
+    sqlite_where=Task.is_live,
+)
+
+Index(
+    "idx_tasks_project_id_status",
+    Task.project_id,
+    Task.status,
+    Task.created_at,
+    Task.id,
+    postgresql_where=Task.is_live,
+    sqlite_where=Task.is_live,
+)
+
+Index(
+    "idx_tasks_project_id_created_at",
+    Task.project_id,
+    Task.created_at,
+    Task.id,
+    postgresql_where=Task.is_live,
+    sqlite_where=Task.is_live,
+)
+
+Index(
+    "idx_tasks_deleted_at",
+    Task.deleted_at,
+    postgresql_where=Task.is_deleted.is_(True),
+    sqlite_where=Task.is_deleted.is_(True),
+)
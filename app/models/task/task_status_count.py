@@ -0,0 +1,42 @@
+"""Import the necessary libraries for the task status count model creation."""
+
+from uuid import UUID
+
+import sqlalchemy as sa
+from sqlalchemy import CheckConstraint, Integer, String
+from sqlalchemy.dialects.postgresql import UUID as PG_UUID
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.db.base import Base
+
+
+class TaskStatusCount(Base):
+    """Number of live tasks per status of a project or of an assignee."""
+
+    __tablename__ = "task_status_counts"
+
+    scope: Mapped[str] = mapped_column(
+        String(8),
+        primary_key=True,
+        nullable=False,
+    )
+
+    scope_id: Mapped[UUID] = mapped_column(
+        PG_UUID(as_uuid=True),
+        primary_key=True,
+        nullable=False,
+    )
+
+    status: Mapped[str] = mapped_column(
+        String(11),
+        primary_key=True,
+        nullable=False,
+    )
+
+    task_count: Mapped[int] = mapped_column(
+        Integer,
+        server_default=sa.text("0"),
+        nullable=False,
+    )
+
+    __table_args__ = (CheckConstraint("scope IN ('project', 'assignee')"),)
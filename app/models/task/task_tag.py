@@ -2,6 +2,7 @@
 
 from uuid import UUID
 
+from sqlalchemy import ForeignKey, Index
 from sqlalchemy.dialects.postgresql import UUID as PG_UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
@@ -15,16 +16,21 @@ class TaskTag(Base):
 
     task_id: Mapped[UUID] = mapped_column(
         PG_UUID(as_uuid=True),
+        ForeignKey("tasks.id", ondelete="CASCADE"),
         primary_key=True,
         nullable=False,
     )
 
     tag_id: Mapped[UUID] = mapped_column(
         PG_UUID(as_uuid=True),
+        ForeignKey("tags.id", ondelete="CASCADE"),
         primary_key=True,
         nullable=False,
     )
 
+    # The primary key serves task -> tags, this index serves tag -> tasks.
+    __table_args__ = (Index("idx_task_tags_tag_id_task_id", "tag_id", "task_id"),)
+
     # Foreign key constraints:
 
     task = relationship("Task", foreign_keys=[task_id], back_populates="task_tags")
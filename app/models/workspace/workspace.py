@@ -64,3 +64,10 @@ class Workspace(Base):
         back_populates="workspace",
         cascade="all, delete-orphan",
     )
+
+    workspace_projects = relationship(
+        "Project",
+        foreign_keys="Project.workspace_id",
+        back_populates="workspace",
+        cascade="all, delete-orphan",
+    )
@@ -0,0 +1,22 @@
+"""Import the necessary libraries for attachment schema creation."""
+
+from datetime import datetime
+from uuid import UUID
+
+from pydantic import BaseModel, ConfigDict
+
+# Responses
+
+
+class AttachmentOut(BaseModel):
+    """Schema to provide a stable form of an attachment to the client."""
+
+    model_config = ConfigDict(from_attributes=True)
+
+    id: UUID
+    task_id: UUID
+    uploader_id: UUID
+    filename: str
+    content_type: str | None
+    size_bytes: int
+    created_at: datetime
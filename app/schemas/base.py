@@ -0,0 +1,39 @@
+"""Import the necessary libraries for shared schema bases."""
+
+from functools import cache
+from typing import Any, Self
+
+from pydantic import BaseModel
+
+
+@cache
+def required_fields(schema: type[BaseModel]) -> frozenset[str]:
+    """Names of the fields a schema cannot default."""
+
+    return frozenset(
+        name for name, field in schema.model_fields.items() if field.is_required()
+    )
+
+
+class RowSchema(BaseModel):
+    """Base of response schemas built from ORM rows."""
+
+    @classmethod
+    def from_row(cls, row: Any, **values: Any) -> Self:
+        """Validate the loaded columns of an ORM row, `values` overriding them.
+
+        Loaded columns are read from the instance dict as one plain mapping,
+        which skips the instrumented attribute access of from_attributes
+        validation. Rows with expired columns go through their attributes.
+        """
+
+        data = row.__dict__
+
+        if required_fields(cls).difference(data).difference(values):
+            data = {
+                name: getattr(row, name)
+                for name in cls.model_fields
+                if name not in values and hasattr(row, name)
+            }
+
+        return cls.model_validate({**data, **values} if values else data)
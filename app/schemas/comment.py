@@ -0,0 +1,55 @@
+"""Import the necessary libraries for comment schema creation."""
+
+from datetime import datetime
+from uuid import UUID
+
+from pydantic import BaseModel, ConfigDict, Field
+
+from app.schemas.base import RowSchema
+
+# Requests
+
+
+class CommentCreate(BaseModel):
+    """Schema to post a comment on a task."""
+
+    model_config = ConfigDict(str_strip_whitespace=True, extra="forbid")
+
+    body: str = Field(min_length=1, max_length=10_000)
+
+
+class CommentUpdate(BaseModel):
+    """Schema to edit a comment."""
+
+    model_config = ConfigDict(str_strip_whitespace=True, extra="forbid")
+
+    body: str = Field(min_length=1, max_length=10_000)
+
+
+# Responses
+
+
+class CommentAuthor(BaseModel):
+    """Schema for the public data of a comment author."""
+
+    id: UUID
+    username: str
+
+
+class CommentOut(RowSchema):
+    """Schema to provide a stable form of a comment to the client."""
+
+    id: UUID
+    task_id: UUID
+    author: CommentAuthor | None
+    body: str
+    is_edited: bool
+    created_at: datetime
+    updated_at: datetime
+
+
+class CommentPage(BaseModel):
+    """Schema for a page of comments and the cursor of the next one."""
+
+    items: list[CommentOut]
+    next_cursor: str | None = None
@@ -0,0 +1,26 @@
+"""Import the necessary libraries for search schema creation."""
+
+from typing import Literal
+from uuid import UUID
+
+from pydantic import BaseModel
+
+# Responses
+
+
+class SearchHit(BaseModel):
+    """Schema for a task or comment matching a search."""
+
+    kind: Literal["task", "comment"]
+    id: UUID
+    task_id: UUID
+    title: str
+    snippet: str | None = None
+    rank: float
+
+
+class SearchPage(BaseModel):
+    """Schema for a page of search hits and the cursor of the next one."""
+
+    items: list[SearchHit]
+    next_cursor: str | None = None
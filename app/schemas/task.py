@@ -0,0 +1,195 @@
+"""Import the necessary libraries for task schema creation."""
+
+from datetime import date, datetime
+from typing import Annotated, Literal
+from uuid import UUID
+
+from pydantic import BaseModel, ConfigDict, Field
+
+from app.schemas.base import RowSchema
+
+TaskStatus = Literal["to do", "in_progress", "blocked", "done", "archived"]
+
+# Requests
+
+
+class TaskCreate(BaseModel):
+    """Schema to create a task."""
+
+    model_config = ConfigDict(str_strip_whitespace=True, extra="forbid")
+
+    project_id: UUID
+    title: str = Field(min_length=1, max_length=80)
+    description: str | None = None
+    status: TaskStatus = "to do"
+    priority: int | None = Field(default=None, ge=0, le=5)
+    assignee_id: UUID | None = None
+    due_at: date | None = None
+    start_at: date | None = None
+    estimate_minutes: int | None = Field(default=None, ge=0)
+    parent_task_id: UUID | None = None
+    recurrence_rule: str | None = None
+
+
+class TaskUpdate(BaseModel):
+    """Schema to partially update a task, only sent fields are changed."""
+
+    model_config = ConfigDict(str_strip_whitespace=True, extra="forbid")
+
+    title: str | None = Field(default=None, min_length=1, max_length=80)
+    description: str | None = None
+    status: TaskStatus | None = None
+    priority: int | None = Field(default=None, ge=0, le=5)
+    assignee_id: UUID | None = None
+    due_at: date | None = None
+    start_at: date | None = None
+    estimate_minutes: int | None = Field(default=None, ge=0)
+    parent_task_id: UUID | None = None
+    recurrence_rule: str | None = None
+
+
+# Responses
+
+
+class TaskOut(RowSchema):
+    """Schema to provide a stable form of a task to the client."""
+
+    model_config = ConfigDict(from_attributes=True)
+
+    id: UUID
+    project_id: UUID
+    title: str
+    description: str | None
+    status: TaskStatus
+    priority: int | None
+    assignee_id: UUID | None
+    created_by: UUID
+    due_at: date | None
+    start_at: date | None
+    completed_at: date | None
+    estimate_minutes: int | None
+    parent_task_id: UUID | None
+    recurrence_rule: str | None
+    next_occurrences: list[date] = Field(default_factory=list)
+    created_at: datetime
+    updated_at: datetime
+
+
+class TaskPage(BaseModel):
+    """Schema for a page of tasks and the cursor of the next one."""
+
+    items: list[TaskOut]
+    next_cursor: str | None = None
+
+
+class CalendarEntry(BaseModel):
+    """Schema for one dated occurrence of a task in a calendar window."""
+
+    task_id: UUID
+    title: str
+    status: TaskStatus
+    occurs_on: date
+
+
+class TaskCounts(BaseModel):
+    """Schema for the number of live tasks per status of a project or assignee."""
+
+    scope: Literal["project", "assignee"]
+    scope_id: UUID
+    counts: dict[TaskStatus, int]
+
+
+# Bulk requests
+
+
+class BulkCreate(BaseModel):
+    """Bulk operation creating a task, optionally with a client chosen id."""
+
+    model_config = ConfigDict(extra="forbid")
+
+    op: Literal["create"]
+    id: UUID | None = None
+    task: TaskCreate
+
+
+class BulkUpdate(BaseModel):
+    """Bulk operation patching a task."""
+
+    model_config = ConfigDict(extra="forbid")
+
+    op: Literal["update"]
+    id: UUID
+    changes: TaskUpdate
+
+
+class BulkStatus(BaseModel):
+    """Bulk operation changing the status of a task."""
+
+    model_config = ConfigDict(extra="forbid")
+
+    op: Literal["status"]
+    id: UUID
+    status: TaskStatus
+
+
+class BulkMove(BaseModel):
+    """Bulk operation re-parenting a task, a null parent makes it top level."""
+
+    model_config = ConfigDict(extra="forbid")
+
+    op: Literal["move"]
+    id: UUID
+    parent_task_id: UUID | None
+
+
+BulkOperation = Annotated[
+    BulkCreate | BulkUpdate | BulkStatus | BulkMove, Field(discriminator="op")
+]
+
+
+class TaskBulkRequest(BaseModel):
+    """Schema for a batch of task operations."""
+
+    model_config = ConfigDict(extra="forbid")
+
+    operations: list[BulkOperation] = Field(min_length=1, max_length=1000)
+
+
+# Bulk responses
+
+
+class BulkItemResult(BaseModel):
+    """Schema for the outcome of one bulk operation."""
+
+    index: int
+    op: str
+    id: UUID | None = None
+    ok: bool
+    error: str | None = None
+
+
+class TaskBulkResult(BaseModel):
+    """Schema for the outcome of a batch of task operations."""
+
+    applied: int
+    failed: int
+    results: list[BulkItemResult]
+
+
+# Tree responses
+
+
+class TaskRollup(BaseModel):
+    """Schema for aggregates over the subtasks of a task."""
+
+    subtask_count: int = 0
+    done_count: int = 0
+    estimate_minutes: int = 0
+
+
+class TaskTreeNode(TaskOut):
+    """Schema for a task with its subtasks nested below it."""
+
+    depth: int
+    children: list["TaskTreeNode"] = []
+    rollup: TaskRollup | None = None
@@ -1,9 +1,12 @@
 """Import the necessary libraries for user schema creation."""
 
+from datetime import datetime
 from uuid import UUID
 
 from pydantic import BaseModel, ConfigDict, EmailStr, Field
 
+from app.schemas.base import RowSchema
+
 # Requests
 
 
@@ -29,7 +32,7 @@ class UserLogin(BaseModel):
 # Responses
 
 
-class UserOut(BaseModel):
+class UserOut(RowSchema):
     """Schema to provide a stable form to the client."""
 
     model_config = ConfigDict(from_attributes=True)
@@ -39,6 +42,18 @@ class UserOut(BaseModel):
     username: str
 
 
+class Principal(BaseModel):
+    """Schema for the authenticated user shared between requests."""
+
+    model_config = ConfigDict(from_attributes=True, frozen=True)
+
+    id: UUID
+    email: EmailStr
+    username: str
+    is_active: bool
+    updated_at: datetime | None = None
+
+
 class Token(BaseModel):
     """Schema for token return."""
 
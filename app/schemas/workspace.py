@@ -0,0 +1,33 @@
+"""Import the necessary libraries for workspace schema creation."""
+
+from datetime import date
+from typing import Literal
+from uuid import UUID
+
+from pydantic import BaseModel, ConfigDict
+
+WorkspaceRole = Literal["owner", "admin", "member", "viewer"]
+
+# Requests
+
+
+class MemberRoleUpdate(BaseModel):
+    """Schema to add a member to a workspace or change their role."""
+
+    model_config = ConfigDict(extra="forbid")
+
+    role: WorkspaceRole
+
+
+# Responses
+
+
+class WorkspaceMemberOut(BaseModel):
+    """Schema to provide a stable form of a workspace member to the client."""
+
+    model_config = ConfigDict(from_attributes=True)
+
+    workspace_id: UUID
+    user_id: UUID
+    role: WorkspaceRole
+    added_at: date | None = None
@@ -0,0 +1,90 @@
+"""Import necessary libraries for attachment service."""
+
+from uuid import UUID
+
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from app.core.domain_errors import NotFound
+from app.core.storage import StoredObject
+from app.models.project.project import Project
+from app.models.task.attachment import Attachment
+from app.models.task.task import Task
+from app.services.task_service import get_task_for_user
+from app.services.workspace_service import ensure_workspace_role
+
+# Helpers
+
+
+def get_attachment_for_user(
+    db: Session, user_id: UUID, attachment_id: UUID
+) -> Attachment:
+    """Get an attachment of a live task whose workspace the user belongs to."""
+
+    stmt = (
+        select(Attachment, Project.workspace_id)
+        .join(Task, Task.id == Attachment.task_id)
+        .join(Project, Project.id == Task.project_id)
+        .where(Attachment.id == attachment_id, Task.is_live)
+    )
+    row = db.execute(stmt).first()
+
+    if row is None:
+        raise NotFound()
+
+    ensure_workspace_role(db, user_id, row.workspace_id)
+
+    return row.Attachment
+
+
+# Main services
+
+
+def list_attachments(db: Session, user_id: UUID, task_id: UUID) -> list[Attachment]:
+    """List the attachments of a task, oldest first."""
+
+    get_task_for_user(db, user_id, task_id)
+
+    stmt = (
+        select(Attachment)
+        .where(Attachment.task_id == task_id)
+        .order_by(Attachment.created_at, Attachment.id)
+    )
+    return list(db.execute(stmt).scalars().all())
+
+
+def check_upload_access(db: Session, user_id: UUID, task_id: UUID) -> None:
+    """Check the user may attach files to a task, then end the transaction.
+
+    Uploads stream for long, the connection goes back to the pool meanwhile
+    and the attachment is recorded in a new transaction.
+    """
+
+    get_task_for_user(db, user_id, task_id, "member")
+    db.rollback()
+
+
+def create_attachment(
+    db: Session,
+    user_id: UUID,
+    task_id: UUID,
+    filename: str,
+    content_type: str | None,
+    stored: StoredObject,
+) -> Attachment:
+    """Record a stored file as an attachment of a task."""
+
+    attachment = Attachment(
+        task_id=task_id,
+        uploader_id=user_id,
+        filename=filename,
+        content_type=content_type,
+        storage_key=stored.key,
+        size_bytes=stored.size,
+    )
+
+    db.add(attachment)
+    db.commit()
+    db.refresh(attachment)
+
+    return attachment
@@ -1,63 +1,87 @@
 """Import necessary libraries for authentication service."""
 
-from sqlalchemy import select
-from sqlalchemy.orm import Session
+import asyncio
+
+from sqlalchemy import func, insert, select
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.domain_errors import ExistingEmail, InvalidCredentials, UsernameTaken
 from app.core.jwt_handler import create_access_token
-from app.core.security import hash_password, verify_password
+from app.core.security import hash_password_async, verify_password_async
+from app.db.dialect import is_unique_violation
 from app.models.auth.user import User
 from app.schemas.user import Token, UserCreate
 
 # Helpers
 
 
-def get_user_by_email(db: Session, email: str) -> User | None:
-    """Get an user by their email."""
+def normalize_email(email: str) -> str:
+    """Normalize an email the same way as the unique_users_email_lower index."""
+
+    return email.strip().lower()
+
+
+async def get_user_by_email(db: AsyncSession, email: str) -> User | None:
+    """Get an user by their email, ignoring case."""
 
-    stmt = select(User).where(User.email == email)
-    return db.execute(stmt).scalars().first()
+    stmt = select(User).where(func.lower(User.email) == normalize_email(email))
+    return (await db.execute(stmt)).scalars().first()
 
 
-def get_user_by_username(db: Session, username: str) -> User | None:
+async def get_user_by_username(db: AsyncSession, username: str) -> User | None:
     """Get an user by their username."""
 
     stmt = select(User).where(User.username == username)
-    return db.execute(stmt).scalars().first()
+    return (await db.execute(stmt)).scalars().first()
 
 
 # Main service
 
 
-def register_user(db: Session, user_create: UserCreate) -> User:
-    """Create a new user."""
+async def register_user(db: AsyncSession, user_create: UserCreate) -> User:
+    """Create a new user, relying on the unique indexes to reject duplicates."""
 
-    if get_user_by_email(db, user_create.email):
-        raise ExistingEmail()
+    # Check out the connection while Argon2 runs on the hashing executor.
+    hashed, _ = await asyncio.gather(
+        hash_password_async(user_create.password), db.connection()
+    )
+
+    stmt = (
+        insert(User)
+        .values(
+            email=user_create.email,
+            username=user_create.username,
+            password_hash=hashed,
+            is_active=True,
+        )
+        .returning(User)
+    )
 
-    if get_user_by_username(db, user_create.username):
-        raise UsernameTaken()
+    try:
+        user = (await db.execute(stmt)).scalars().one()
+        await db.commit()
+    except IntegrityError as error:
+        await db.rollback()
 
-    hashed = hash_password(user_create.password)
+        if is_unique_violation(error, "unique_users_email_lower", "users.email"):
+            raise ExistingEmail() from error
 
-    user = User(
-        email=user_create.email,
-        username=user_create.username,
-        password_hash=hashed,
-        is_active=True,
-    )
+        if is_unique_violation(error, "unique_users_username", "users.username"):
+            # The database reports one violation only; email wins when both clash.
+            if await get_user_by_email(db, user_create.email):
+                raise ExistingEmail() from error
+            raise UsernameTaken() from error
 
-    db.add(user)
-    db.commit()
-    db.refresh(user)
+        raise
 
     return user
 
 
-def authenticate_user(db: Session, email: str, password: str) -> User | None:
+async def authenticate_user(db: AsyncSession, email: str, password: str) -> User | None:
     """Validate credentials."""
 
-    user = get_user_by_email(db, email)
+    user = await get_user_by_email(db, email)
 
     if not user:
         return None
@@ -65,16 +89,16 @@ def authenticate_user(db: Session, email: str, password: str) -> User | None:
     if not user.is_active:
         return None
 
-    if not verify_password(password, user.password_hash):
+    if not await verify_password_async(password, user.password_hash):
         return None
 
     return user
 
 
-def login_user(db: Session, email: str, password: str) -> Token:
+async def login_user(db: AsyncSession, email: str, password: str) -> Token:
     """Authenticate user and return a JWT token schema."""
 
-    user = authenticate_user(db, email, password)
+    user = await authenticate_user(db, email, password)
 
     if not user:
         raise InvalidCredentials()
@@ -0,0 +1,82 @@
+"""Import necessary libraries for change feed service."""
+
+from collections.abc import Iterable
+from uuid import UUID
+
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from app.core.events import ChangeEvent, event_hub
+from app.models.project.project import Project
+from app.models.task.task import Task
+
+TaskChange = tuple[str, UUID, UUID]
+
+# Main services
+
+
+def publish_task_changes(db: Session, changes: Iterable[TaskChange]) -> None:
+    """Publish committed (action, task_id, project_id) task changes.
+
+    The workspaces of every project involved are read with one query, and
+    the changes are published together as one batch.
+    """
+
+    changes = list(changes)
+    if not changes:
+        return
+
+    stmt = select(Project.id, Project.workspace_id).where(
+        Project.id.in_({project_id for _, _, project_id in changes})
+    )
+    workspaces = dict(db.execute(stmt).tuples().all())
+
+    event_hub.publish(
+        [
+            ChangeEvent(
+                workspace_id=workspaces[project_id],
+                kind="task",
+                action=action,
+                id=task_id,
+                task_id=task_id,
+            )
+            for action, task_id, project_id in changes
+        ]
+    )
+
+
+def publish_comment_change(
+    db: Session, action: str, comment_id: UUID, task_id: UUID
+) -> None:
+    """Publish a committed comment change to the workspace of its task."""
+
+    stmt = (
+        select(Project.workspace_id)
+        .join(Task, Task.project_id == Project.id)
+        .where(Task.id == task_id)
+    )
+    workspace_id = db.execute(stmt).scalar_one()
+
+    event_hub.publish(
+        [
+            ChangeEvent(
+                workspace_id=workspace_id,
+                kind="comment",
+                action=action,
+                id=comment_id,
+                task_id=task_id,
+            )
+        ]
+    )
+
+
+def publish_member_change(workspace_id: UUID, action: str, user_id: UUID) -> None:
+    """Publish a committed membership change, streams re-check their access."""
+
+    event_hub.publish(
+        [
+            ChangeEvent(
+                workspace_id=workspace_id, kind="member", action=action, id=user_id
+            )
+        ]
+    )
@@ -0,0 +1,196 @@
+"""Import necessary libraries for comment service."""
+
+from uuid import UUID
+
+from sqlalchemy import Select, select, tuple_
+from sqlalchemy.orm import Session
+
+from app.core.conditional import Validators, page_etag
+from app.core.domain_errors import NotFound, PermissionDenied
+from app.core.pagination import decode_cursor, encode_cursor
+from app.models.auth.user import User
+from app.models.project.project import Project
+from app.models.task.comment import Comment
+from app.models.task.task import Task
+from app.schemas.comment import (
+    CommentAuthor,
+    CommentCreate,
+    CommentOut,
+    CommentPage,
+    CommentUpdate,
+)
+from app.services.change_feed_service import publish_comment_change
+from app.services.task_service import get_task_for_user
+from app.services.workspace_service import ensure_workspace_role
+
+# Helpers
+
+
+def load_authors(db: Session, author_ids: set[UUID]) -> dict[UUID, CommentAuthor]:
+    """Load the authors of many comments with a single IN query."""
+
+    if not author_ids:
+        return {}
+
+    stmt = select(User.id, User.username).where(User.id.in_(author_ids))
+    return {
+        row.id: CommentAuthor(id=row.id, username=row.username)
+        for row in db.execute(stmt)
+    }
+
+
+def to_comment_out(comment: Comment, authors: dict[UUID, CommentAuthor]) -> CommentOut:
+    """Build the response of a comment without touching its lazy relationships."""
+
+    return CommentOut.from_row(comment, author=authors.get(comment.author_id))
+
+
+def select_comment_page(task_id: UUID, cursor: str | None, limit: int) -> Select:
+    """Select one keyset page of comments, fetching one extra row.
+
+    The filter and order match idx_comments_task_id_created_at, so the page
+    is read straight from the index without sorting.
+    """
+
+    stmt = select(Comment).where(Comment.task_id == task_id)
+
+    if cursor is not None:
+        created_at, comment_id = decode_cursor(cursor)
+        stmt = stmt.where(
+            tuple_(Comment.created_at, Comment.id) > (created_at, comment_id)
+        )
+
+    return stmt.order_by(Comment.created_at, Comment.id).limit(limit + 1)
+
+
+def get_comment_for_user(
+    db: Session, user_id: UUID, comment_id: UUID, minimum: str = "viewer"
+) -> Comment:
+    """Get a comment on a live task whose workspace the user holds `minimum` in."""
+
+    stmt = (
+        select(Comment, Project.workspace_id)
+        .join(Task, Task.id == Comment.task_id)
+        .join(Project, Project.id == Task.project_id)
+        .where(Comment.id == comment_id, Task.is_live)
+    )
+    row = db.execute(stmt).first()
+
+    if row is None:
+        raise NotFound()
+
+    ensure_workspace_role(db, user_id, row.workspace_id, minimum)
+
+    return row.Comment
+
+
+# Main services
+
+
+def comment_page_etag(task_id: UUID, rows: list[tuple], has_more: bool) -> str:
+    """ETag of a comment page from its (id, updated_at, author username) rows."""
+
+    return page_etag("comments", rows, task_id, has_more)
+
+
+def get_comment_list_validators(
+    db: Session,
+    user_id: UUID,
+    task_id: UUID,
+    cursor: str | None = None,
+    limit: int = 50,
+) -> Validators:
+    """Validators of a comment page, reading narrow columns of its rows only.
+
+    Editing a comment or renaming its author changes a row, adding or
+    deleting one changes which rows the page holds.
+    """
+
+    get_task_for_user(db, user_id, task_id)
+
+    stmt = (
+        select_comment_page(task_id, cursor, limit)
+        .with_only_columns(Comment.id, Comment.updated_at, User.username)
+        .outerjoin_from(Comment, User, User.id == Comment.author_id)
+    )
+    rows = db.execute(stmt).tuples().all()
+
+    return Validators(etag=comment_page_etag(task_id, rows[:limit], len(rows) > limit))
+
+
+def get_comment_page_validators(task_id: UUID, page: CommentPage) -> Validators:
+    """Validators of a loaded comment page, equal to get_comment_list_validators."""
+
+    rows = [
+        (item.id, item.updated_at, item.author.username if item.author else None)
+        for item in page.items
+    ]
+    return Validators(
+        etag=comment_page_etag(task_id, rows, page.next_cursor is not None)
+    )
+
+
+def list_comments(
+    db: Session,
+    user_id: UUID,
+    task_id: UUID,
+    cursor: str | None = None,
+    limit: int = 50,
+) -> CommentPage:
+    """List the comments of a task, loading the page authors with one query."""
+
+    get_task_for_user(db, user_id, task_id)
+
+    stmt = select_comment_page(task_id, cursor, limit)
+    comments = db.execute(stmt).scalars().all()
+
+    next_cursor = None
+    if len(comments) > limit:
+        comments = comments[:limit]
+        next_cursor = encode_cursor(comments[-1].created_at, comments[-1].id)
+
+    authors = load_authors(db, {comment.author_id for comment in comments})
+
+    return CommentPage(
+        items=[to_comment_out(comment, authors) for comment in comments],
+        next_cursor=next_cursor,
+    )
+
+
+def create_comment(
+    db: Session, user_id: UUID, task_id: UUID, payload: CommentCreate
+) -> CommentOut:
+    """Post a comment on a task."""
+
+    get_task_for_user(db, user_id, task_id, "member")
+
+    comment = Comment(task_id=task_id, author_id=user_id, body=payload.body)
+
+    db.add(comment)
+    db.commit()
+    db.refresh(comment)
+
+    publish_comment_change(db, "created", comment.id, task_id)
+
+    return to_comment_out(comment, load_authors(db, {user_id}))
+
+
+def update_comment(
+    db: Session, user_id: UUID, comment_id: UUID, payload: CommentUpdate
+) -> CommentOut:
+    """Edit a comment, only its author may do so."""
+
+    comment = get_comment_for_user(db, user_id, comment_id, "member")
+
+    if comment.author_id != user_id:
+        raise PermissionDenied()
+
+    comment.body = payload.body
+    comment.is_edited = True
+
+    db.commit()
+    db.refresh(comment)
+
+    publish_comment_change(db, "updated", comment.id, comment.task_id)
+
+    return to_comment_out(comment, load_authors(db, {user_id}))
@@ -2,14 +2,20 @@
 
 from datetime import datetime, timedelta, timezone
 from secrets import randbelow
-from uuid import UUID
+from uuid import UUID, uuid4
 
-from sqlalchemy import delete, desc, select
-from sqlalchemy.orm import Session
+from sqlalchemy import delete, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.config import settings
 from app.core.domain_errors import InvalidCode
-from app.core.security import hash_password, hash_reset_code
-from app.core.security import verify_reset_code as verify_reset_code_hash
+from app.core.principal_cache import principal_cache
+from app.core.security import (
+    hash_password_async,
+    hash_reset_code,
+    verify_reset_code_async,
+)
+from app.db.dialect import dialect_insert
 from app.models.auth.password_reset import PasswordResetToken
 from app.schemas.password_reset import (
     ForgotPasswordRequest,
@@ -27,97 +33,141 @@ def gen_random_code() -> str:
     return f"{randbelow(1_000_000):06d}"
 
 
-def normalize_utc(dt: datetime) -> datetime:
-    """Ensure DB datetime is timezone-aware UTC."""
+async def get_active_token_for_user(
+    db: AsyncSession, user_id: UUID
+) -> PasswordResetToken | None:
+    """Get the reset token of a user, there is at most one per user."""
+
+    stmt = select(PasswordResetToken).where(PasswordResetToken.user_id == user_id)
+    return (await db.execute(stmt)).scalars().first()
+
+
+async def invalidate_reset_tokens_for_user(db: AsyncSession, user_id: UUID) -> None:
+    """Delete all reset tokens for the user."""
+
+    stmt = delete(PasswordResetToken).where(PasswordResetToken.user_id == user_id)
+    await db.execute(stmt)
 
-    if dt.tzinfo is None:
-        return dt.replace(tzinfo=timezone.utc)
-    return dt.astimezone(timezone.utc)
 
+async def check_reset_code(db: AsyncSession, user_id: UUID, code: str) -> None:
+    """Check the latest reset code of a user, counting failed attempts.
 
-def get_latest_token_for_user(db: Session, user_id: UUID) -> PasswordResetToken | None:
-    """Get the latest reset token for a user."""
+    An attempt is reserved with one conditional UPDATE before the code is
+    verified, so concurrent guesses cannot all pass the limit check. A
+    correct code gives its attempt back.
+    """
 
+    token = PasswordResetToken
     stmt = (
-        select(PasswordResetToken)
-        .where(PasswordResetToken.user_id == user_id)
-        .order_by(desc(PasswordResetToken.expires_at))
+        update(token)
+        .where(
+            token.user_id == user_id,
+            token.attempts < settings.RESET_CODE_MAX_ATTEMPTS,
+            token.expires_at > datetime.now(timezone.utc),
+        )
+        .values(attempts=token.attempts + 1)
+        .returning(token.id, token.code_hash)
     )
-    return db.execute(stmt).scalars().first()
+    reserved = (await db.execute(stmt)).first()
+    await db.commit()
 
+    if reserved is None:
+        raise InvalidCode()
 
-def invalidate_reset_tokens_for_user(db: Session, user_id: UUID) -> None:
-    """Delete all reset tokens for the user."""
+    if not await verify_reset_code_async(code, reserved.code_hash, user_id):
+        raise InvalidCode()
 
-    stmt = delete(PasswordResetToken).where(PasswordResetToken.user_id == user_id)
-    db.execute(stmt)
+    await db.execute(
+        update(token).where(token.id == reserved.id).values(attempts=token.attempts - 1)
+    )
+    await db.commit()
 
 
 # Main services
 
 
-def request_password_reset(db: Session, payload: ForgotPasswordRequest) -> str:
+async def request_password_reset(
+    db: AsyncSession, payload: ForgotPasswordRequest
+) -> str:
     """Create a password reset code and store its hash."""
 
-    user = get_user_by_email(db, payload.email)
+    user = await get_user_by_email(db, payload.email)
     if not user:
         return None
 
     code = gen_random_code()
-    code_hash = hash_reset_code(code)
+    now = datetime.now(timezone.utc)
 
-    token = PasswordResetToken(
+    # Replace any previous token so each user keeps a single row.
+    stmt = dialect_insert(db.get_bind().dialect.name, PasswordResetToken).values(
+        id=uuid4(),
         user_id=user.id,
-        code_hash=code_hash,
-        expires_at=datetime.now(timezone.utc) + timedelta(minutes=10),
+        code_hash=hash_reset_code(code, user.id),
+        attempts=0,
+        created_at=now,
+        expires_at=now + timedelta(minutes=settings.RESET_CODE_EXPIRE_MINUTES),
+    )
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[PasswordResetToken.user_id],
+        set_={
+            "code_hash": stmt.excluded.code_hash,
+            "attempts": 0,
+            "created_at": stmt.excluded.created_at,
+            "expires_at": stmt.excluded.expires_at,
+        },
     )
 
-    db.add(token)
-    db.commit()
-    db.refresh(token)
+    await db.execute(stmt)
+    await db.commit()
 
     return code
 
 
-def verify_reset_code_service(db: Session, payload: VerifyResetCodeRequest) -> bool:
+async def verify_reset_code_service(
+    db: AsyncSession, payload: VerifyResetCodeRequest
+) -> bool:
     """Verify reset code for email."""
 
-    user = get_user_by_email(db, payload.email)
+    user = await get_user_by_email(db, payload.email)
     if not user:
         raise InvalidCode()
 
-    token = get_latest_token_for_user(db, user.id)
-    if not token:
-        raise InvalidCode()
-
-    if normalize_utc(token.expires_at) < datetime.now(timezone.utc):
-        raise InvalidCode()
-
-    if not verify_reset_code_hash(payload.code, token.code_hash):
-        raise InvalidCode()
+    await check_reset_code(db, user.id, payload.code)
 
     return True
 
 
-def reset_password_service(db: Session, payload: ResetPasswordRequest) -> None:
+async def reset_password_service(
+    db: AsyncSession, payload: ResetPasswordRequest
+) -> None:
     """Reset password."""
 
-    user = get_user_by_email(db, payload.email)
+    user = await get_user_by_email(db, payload.email)
     if not user:
         raise InvalidCode()
 
-    token = get_latest_token_for_user(db, user.id)
-    if not token:
-        raise InvalidCode()
+    await check_reset_code(db, user.id, payload.code)
 
-    if normalize_utc(token.expires_at) < datetime.now(timezone.utc):
-        raise InvalidCode()
+    user.password_hash = await hash_password_async(payload.new_password)
 
-    if not verify_reset_code_hash(payload.code, token.code_hash):
-        raise InvalidCode()
+    await invalidate_reset_tokens_for_user(db, user.id)
+
+    await db.commit()
+
+    principal_cache.invalidate(user.id)
 
-    user.password_hash = hash_password(payload.new_password)
 
-    invalidate_reset_tokens_for_user(db, user.id)
+async def delete_expired_reset_tokens(db: AsyncSession, batch_size: int) -> int:
+    """Delete one bounded batch of expired reset tokens."""
+
+    expired = (
+        select(PasswordResetToken.id)
+        .where(PasswordResetToken.expires_at < datetime.now(timezone.utc))
+        .limit(batch_size)
+    )
+    stmt = delete(PasswordResetToken).where(PasswordResetToken.id.in_(expired))
+
+    result = await db.execute(stmt)
+    await db.commit()
 
-    db.commit()
+    return result.rowcount
@@ -0,0 +1,198 @@
+"""Import necessary libraries for reminder dispatch service."""
+
+import asyncio
+from collections import defaultdict
+from collections.abc import Mapping
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from uuid import UUID
+
+from sqlalchemy import func, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.clock import normalize_utc
+from app.core.config import settings
+from app.core.notifications import ReminderChannel, ReminderMessage
+from app.models.task.reminder import Reminder
+
+
+@dataclass
+class DispatchResult:
+    """Outcome of one dispatched batch."""
+
+    sent: list[UUID] = field(default_factory=list)
+    failed: list[UUID] = field(default_factory=list)
+    lags: list[float] = field(default_factory=list)
+
+
+# Helpers
+
+
+def reminder_columns():
+    """Columns copied into a ReminderMessage."""
+
+    return (
+        Reminder.id,
+        Reminder.task_id,
+        Reminder.channel,
+        Reminder.remind_at,
+        Reminder.attempts,
+    )
+
+
+def select_due_reminder_ids(now: datetime, batch_size: int):
+    """Select the pending reminders due longest, through their status index."""
+
+    return (
+        select(Reminder.id)
+        .where(Reminder.status == "pending", Reminder.next_attempt_at <= now)
+        .order_by(Reminder.next_attempt_at)
+        .limit(batch_size)
+    )
+
+
+def retry_delay(attempts: int) -> timedelta:
+    """Exponential backoff after `attempts` failed deliveries, capped."""
+
+    seconds = settings.REMINDER_RETRY_BASE_SECONDS * 2 ** (attempts - 1)
+    return timedelta(seconds=min(seconds, settings.REMINDER_RETRY_MAX_SECONDS))
+
+
+async def mark_failed(
+    db: AsyncSession, messages: list[ReminderMessage], now: datetime
+) -> None:
+    """Count a failed attempt, then back off or give up after the last one.
+
+    One UPDATE per attempt count, so at most REMINDER_MAX_ATTEMPTS of them.
+    """
+
+    by_attempts: dict[int, list[UUID]] = defaultdict(list)
+    for message in messages:
+        by_attempts[message.attempts + 1].append(message.id)
+
+    for attempts, ids in by_attempts.items():
+        if attempts >= settings.REMINDER_MAX_ATTEMPTS:
+            values = {"status": "failed"}
+        else:
+            values = {
+                "status": "pending",
+                "next_attempt_at": now + retry_delay(attempts),
+            }
+
+        await db.execute(
+            update(Reminder)
+            .where(Reminder.id.in_(ids))
+            .values(attempts=attempts, **values)
+            .execution_options(synchronize_session=False)
+        )
+
+
+async def claim_due_reminders(
+    db: AsyncSession, now: datetime, batch_size: int
+) -> list[ReminderMessage]:
+    """Claim a batch of due reminders for the current transaction.
+
+    Reminders are claimed by next_attempt_at, so failing ones backing off
+    never hold back the ones due after them. On PostgreSQL the rows are
+    locked with FOR UPDATE SKIP LOCKED, so concurrent workers claim disjoint
+    batches and never wait on each other. SQLite has no row locks: the batch
+    is claimed by flipping it to `sent` up front, which takes the database
+    write lock until the transaction ends, and failed deliveries are put
+    back before commit.
+    """
+
+    if db.get_bind().dialect.name == "postgresql":
+        stmt = (
+            select(*reminder_columns())
+            .where(Reminder.status == "pending", Reminder.next_attempt_at <= now)
+            .order_by(Reminder.next_attempt_at)
+            .limit(batch_size)
+            .with_for_update(skip_locked=True)
+        )
+    else:
+        stmt = (
+            update(Reminder)
+            .where(Reminder.id.in_(select_due_reminder_ids(now, batch_size)))
+            .values(status="sent")
+            .returning(*reminder_columns())
+        )
+
+    rows = (await db.execute(stmt)).all()
+    return [ReminderMessage(*row) for row in rows]
+
+
+async def deliver(
+    channels: Mapping[str, ReminderChannel], message: ReminderMessage
+) -> None:
+    """Deliver one reminder through its channel."""
+
+    channel = channels.get(message.channel)
+    if channel is None:
+        raise LookupError(f"No backend for channel {message.channel!r}.")
+
+    await channel.send(message)
+
+
+# Main services
+
+
+async def dispatch_due_reminders(
+    db: AsyncSession,
+    channels: Mapping[str, ReminderChannel],
+    now: datetime,
+    batch_size: int,
+) -> DispatchResult:
+    """Claim, deliver and mark one batch of due reminders in one transaction."""
+
+    messages = await claim_due_reminders(db, now, batch_size)
+    result = DispatchResult()
+
+    if not messages:
+        await db.rollback()
+        return result
+
+    outcomes = await asyncio.gather(
+        *(deliver(channels, message) for message in messages),
+        return_exceptions=True,
+    )
+
+    failed = []
+
+    for message, outcome in zip(messages, outcomes):
+        if isinstance(outcome, Exception):
+            failed.append(message)
+            result.failed.append(message.id)
+        else:
+            result.sent.append(message.id)
+            result.lags.append(
+                (normalize_utc(now) - normalize_utc(message.remind_at)).total_seconds()
+            )
+
+    if result.sent:
+        await db.execute(
+            update(Reminder)
+            .where(Reminder.id.in_(result.sent))
+            .values(status="sent")
+            .execution_options(synchronize_session=False)
+        )
+
+    if failed:
+        await mark_failed(db, failed, now)
+
+    await db.commit()
+    return result
+
+
+async def get_pending_lag_seconds(db: AsyncSession, now: datetime) -> float:
+    """How long the oldest claimable reminder has been waiting."""
+
+    oldest = await db.scalar(
+        select(func.min(Reminder.next_attempt_at)).where(
+            Reminder.status == "pending", Reminder.next_attempt_at <= now
+        )
+    )
+
+    if oldest is None:
+        return 0.0
+
+    return max((normalize_utc(now) - normalize_utc(oldest)).total_seconds(), 0.0)
@@ -0,0 +1,251 @@
+"""Import necessary libraries for search service."""
+
+import html
+import re
+from uuid import UUID
+
+from sqlalchemy import (
+    Float,
+    Select,
+    and_,
+    column,
+    func,
+    literal,
+    literal_column,
+    null,
+    or_,
+    select,
+    table,
+    union_all,
+)
+from sqlalchemy.orm import Session
+
+from app.core.pagination import decode_rank_cursor, encode_rank_cursor
+from app.db.search_index import SEARCH_CONFIG
+from app.models.project.project import Project
+from app.models.task.comment import Comment
+from app.models.task.task import Task
+from app.schemas.search import SearchHit, SearchPage
+from app.services.workspace_service import ensure_workspace_role
+
+# Private use characters mark matches in SQL, the text is escaped before they
+# become <mark> tags, so stored markup never reaches the client as HTML.
+HIGHLIGHT_START = "\ue000"
+HIGHLIGHT_STOP = "\ue001"
+SNIPPET_TOKENS = 16
+
+tasks_fts = table("tasks_fts", column("rowid"))
+comments_fts = table("comments_fts", column("rowid"))
+
+# Helpers
+
+
+def fts5_query(text: str) -> str | None:
+    """Turn free text into an FTS5 query matching every word, or None."""
+
+    words = re.findall(r"\w+", text)
+    return " ".join(f'"{word}"' for word in words) or None
+
+
+def to_html(text: str | None) -> str | None:
+    """Escape highlighted text, then turn its match markers into <mark> tags."""
+
+    if text is None:
+        return None
+
+    return (
+        html.escape(text)
+        .replace(HIGHLIGHT_START, "<mark>")
+        .replace(HIGHLIGHT_STOP, "</mark>")
+    )
+
+
+def select_sqlite_hits(project_ids: Select, text: str, highlight: bool) -> Select:
+    """Select ranked task and comment hits from the FTS5 tables."""
+
+    query = fts5_query(text)
+    task_fts = literal_column("tasks_fts")
+    comment_fts = literal_column("comments_fts")
+
+    def marked(fts, column_index: int):
+        return func.snippet(
+            fts, column_index, HIGHLIGHT_START, HIGHLIGHT_STOP, "…", SNIPPET_TOKENS
+        )
+
+    task_hits = (
+        select(
+            literal("task").label("kind"),
+            Task.id.label("id"),
+            Task.id.label("task_id"),
+            (
+                func.highlight(task_fts, 0, HIGHLIGHT_START, HIGHLIGHT_STOP)
+                if highlight
+                else Task.title
+            ).label("title"),
+            (marked(task_fts, 1) if highlight else null()).label("snippet"),
+            (-func.bm25(task_fts, 10.0, 1.0, type_=Float)).label("rank"),
+        )
+        .select_from(tasks_fts)
+        .join(Task, literal_column("tasks.rowid") == tasks_fts.c.rowid)
+        .where(
+            task_fts.op("MATCH")(query),
+            Task.project_id.in_(project_ids),
+            Task.is_live,
+        )
+    )
+
+    comment_hits = (
+        select(
+            literal("comment").label("kind"),
+            Comment.id.label("id"),
+            Comment.task_id.label("task_id"),
+            Task.title.label("title"),
+            (marked(comment_fts, 0) if highlight else null()).label("snippet"),
+            (-func.bm25(comment_fts, type_=Float)).label("rank"),
+        )
+        .select_from(comments_fts)
+        .join(Comment, literal_column("comments.rowid") == comments_fts.c.rowid)
+        .join(Task, Task.id == Comment.task_id)
+        .where(
+            comment_fts.op("MATCH")(query),
+            Task.project_id.in_(project_ids),
+            Task.is_live,
+        )
+    )
+
+    return union_all(task_hits, comment_hits)
+
+
+def select_postgres_hits(project_ids: Select, text: str) -> Select:
+    """Select ranked task and comment hits through the tsvector GIN indexes."""
+
+    config = literal_column(f"'{SEARCH_CONFIG}'::regconfig")
+    query = func.websearch_to_tsquery(config, text)
+    task_vector = literal_column("tasks.search_vector")
+    comment_vector = literal_column("comments.search_vector")
+
+    task_hits = select(
+        literal("task").label("kind"),
+        Task.id.label("id"),
+        Task.id.label("task_id"),
+        Task.title.label("title"),
+        func.coalesce(Task.description, "").label("snippet"),
+        func.ts_rank_cd(task_vector, query, type_=Float).label("rank"),
+    ).where(
+        task_vector.op("@@")(query),
+        Task.project_id.in_(project_ids),
+        Task.is_live,
+    )
+
+    comment_hits = (
+        select(
+            literal("comment").label("kind"),
+            Comment.id.label("id"),
+            Comment.task_id.label("task_id"),
+            Task.title.label("title"),
+            Comment.body.label("snippet"),
+            func.ts_rank_cd(comment_vector, query, type_=Float).label("rank"),
+        )
+        .join(Task, Task.id == Comment.task_id)
+        .where(
+            comment_vector.op("@@")(query),
+            Task.project_id.in_(project_ids),
+            Task.is_live,
+        )
+    )
+
+    return union_all(task_hits, comment_hits)
+
+
+def select_page(hits, cursor: str | None, limit: int) -> Select:
+    """Select one page of hits by rank, then id, fetching one extra row."""
+
+    hits = hits.subquery("hits")
+    stmt = select(hits)
+
+    if cursor is not None:
+        rank, hit_id = decode_rank_cursor(cursor)
+        stmt = stmt.where(
+            or_(hits.c.rank < rank, and_(hits.c.rank == rank, hits.c.id > hit_id))
+        )
+
+    return stmt.order_by(hits.c.rank.desc(), hits.c.id).limit(limit + 1)
+
+
+def with_headlines(page: Select, text: str, highlight: bool) -> Select:
+    """Highlight the hits of a page only, ts_headline is costly."""
+
+    page = page.subquery("page")
+    config = literal_column(f"'{SEARCH_CONFIG}'::regconfig")
+    query = func.websearch_to_tsquery(config, text)
+    options = f'StartSel="{HIGHLIGHT_START}", StopSel="{HIGHLIGHT_STOP}", MaxWords=35'
+
+    if highlight:
+        title = func.ts_headline(config, page.c.title, query, options)
+        snippet = func.ts_headline(config, page.c.snippet, query, options)
+    else:
+        title, snippet = page.c.title, null()
+
+    return select(
+        page.c.kind,
+        page.c.id,
+        page.c.task_id,
+        title.label("title"),
+        snippet.label("snippet"),
+        page.c.rank,
+    ).order_by(page.c.rank.desc(), page.c.id)
+
+
+# Main services
+
+
+def search(
+    db: Session,
+    user_id: UUID,
+    workspace_id: UUID,
+    text: str,
+    cursor: str | None = None,
+    limit: int = 20,
+    highlight: bool = True,
+) -> SearchPage:
+    """Search the tasks and comments of a workspace, best matches first.
+
+    Highlighted titles and snippets are escaped HTML with <mark> around the
+    matches, plain ones are the stored text.
+    """
+
+    ensure_workspace_role(db, user_id, workspace_id)
+
+    project_ids = select(Project.id).where(Project.workspace_id == workspace_id)
+
+    if db.get_bind().dialect.name == "postgresql":
+        page = select_page(select_postgres_hits(project_ids, text), cursor, limit)
+        stmt = with_headlines(page, text, highlight)
+    else:
+        if fts5_query(text) is None:
+            return SearchPage(items=[])
+        stmt = select_page(
+            select_sqlite_hits(project_ids, text, highlight), cursor, limit
+        )
+
+    rows = db.execute(stmt).all()
+
+    next_cursor = None
+    if len(rows) > limit:
+        rows = rows[:limit]
+        next_cursor = encode_rank_cursor(rows[-1].rank, rows[-1].id)
+
+    return SearchPage(
+        items=[
+            SearchHit(
+                kind=row.kind,
+                id=row.id,
+                task_id=row.task_id,
+                title=to_html(row.title) if highlight else row.title,
+                snippet=to_html(row.snippet or None) if highlight else None,
+                rank=row.rank,
+            )
+            for row in rows
+        ],
+        next_cursor=next_cursor,
+    )
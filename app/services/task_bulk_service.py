@@ -0,0 +1,335 @@
+"""Import necessary libraries for bulk task service."""
+
+from collections import Counter
+from uuid import UUID, uuid4
+
+from sqlalchemy import Select, insert, select, update
+from sqlalchemy.orm import Session, aliased
+
+from app.core.domain_errors import InvalidTask
+from app.models.task.task import Task
+from app.schemas.task import (
+    BulkCreate,
+    BulkItemResult,
+    BulkMove,
+    BulkStatus,
+    BulkUpdate,
+    TaskBulkRequest,
+    TaskBulkResult,
+)
+from app.services.change_feed_service import publish_task_changes
+from app.services.task_count_service import apply_count_deltas, task_state, track_change
+from app.services.task_service import (
+    check_recurrence_rule,
+    completed_at_for,
+    lock_tasks_for_write,
+)
+from app.services.workspace_service import select_writable_project_ids
+
+
+class BulkItemError(Exception):
+    """Raised while validating one operation of a batch."""
+
+
+class BulkPlan:
+    """In-memory state of the tasks touched by a batch.
+
+    Operations are validated against this state in order, so later items see
+    the effect of earlier ones, and the resulting rows are flushed at the end
+    with one multi-row INSERT and one executemany UPDATE.
+    """
+
+    def __init__(self, user_id: UUID, allowed_projects: set[UUID]) -> None:
+        self.user_id = user_id
+        self.allowed_projects = allowed_projects
+        self.tasks: dict[UUID, dict] = {}
+        self.existing_ids: set[UUID] = set()
+        self.loaded: dict[UUID, dict] = {}
+        self.parents: dict[UUID, UUID | None] = {}
+        self.creates: dict[UUID, dict] = {}
+        self.updates: dict[UUID, dict] = {}
+
+    def get(self, task_id: UUID) -> dict:
+        """Return the current state of a visible task."""
+
+        task = self.tasks.get(task_id)
+
+        if task is None or task["project_id"] not in self.allowed_projects:
+            raise BulkItemError("Task not found.")
+
+        return task
+
+    def check_parent(self, task_id: UUID, project_id: UUID, parent_id: UUID) -> None:
+        """Check that a parent is in the same project and makes no cycle."""
+
+        if self.get(parent_id)["project_id"] != project_id:
+            raise BulkItemError("Parent task must belong to the same project.")
+
+        seen = set()
+        current: UUID | None = parent_id
+
+        while current is not None and current not in seen:
+            if current == task_id:
+                raise BulkItemError("A task cannot be its own ancestor.")
+            seen.add(current)
+            current = self.parents.get(current)
+
+    def change(self, task_id: UUID, changes: dict) -> None:
+        """Record changes of an existing or batch created task."""
+
+        if "status" in changes and changes["status"] != self.tasks[task_id]["status"]:
+            changes["completed_at"] = completed_at_for(changes["status"])
+
+        self.tasks[task_id].update(changes)
+
+        if "parent_task_id" in changes:
+            self.parents[task_id] = changes["parent_task_id"]
+
+        if task_id in self.creates:
+            self.creates[task_id].update(changes)
+        else:
+            self.updates.setdefault(task_id, {"id": task_id}).update(changes)
+
+    def apply(self, operation) -> UUID:
+        """Validate one operation and fold it into the plan."""
+
+        if isinstance(operation, BulkCreate):
+            return self.apply_create(operation)
+
+        task = self.get(operation.id)
+
+        if isinstance(operation, BulkStatus):
+            changes = {"status": operation.status}
+
+        elif isinstance(operation, BulkMove):
+            changes = {"parent_task_id": operation.parent_task_id}
+
+        elif isinstance(operation, BulkUpdate):
+            changes = operation.changes.model_dump(exclude_unset=True)
+
+            for field in ("title", "status"):
+                if field in changes and changes[field] is None:
+                    raise BulkItemError(f"Task {field} cannot be empty.")
+
+        if changes.get("parent_task_id") is not None:
+            self.check_parent(
+                operation.id, task["project_id"], changes["parent_task_id"]
+            )
+
+        check_recurrence_rule(changes.get("recurrence_rule"))
+
+        self.change(operation.id, changes)
+        return operation.id
+
+    def apply_create(self, operation: BulkCreate) -> UUID:
+        """Validate a create operation and queue its row."""
+
+        payload = operation.task
+        task_id = operation.id or uuid4()
+
+        if payload.project_id not in self.allowed_projects:
+            raise BulkItemError("Project not found.")
+
+        if task_id in self.tasks or task_id in self.existing_ids:
+            raise BulkItemError("Task id already exists.")
+
+        if payload.parent_task_id is not None:
+            self.check_parent(task_id, payload.project_id, payload.parent_task_id)
+
+        check_recurrence_rule(payload.recurrence_rule)
+
+        row = {
+            **payload.model_dump(),
+            "id": task_id,
+            "created_by": self.user_id,
+            "completed_at": completed_at_for(payload.status),
+        }
+
+        self.creates[task_id] = row
+        self.tasks[task_id] = row.copy()
+        self.parents[task_id] = payload.parent_task_id
+
+        return task_id
+
+    def ordered_creates(self) -> list[dict]:
+        """Return created rows with every parent before its children."""
+
+        ordered: list[dict] = []
+        placed: set[UUID] = set()
+
+        def place(task_id: UUID) -> None:
+            if task_id in placed:
+                return
+            placed.add(task_id)
+
+            parent_id = self.creates[task_id]["parent_task_id"]
+            if parent_id in self.creates:
+                place(parent_id)
+
+            ordered.append(self.creates[task_id])
+
+        for task_id in self.creates:
+            place(task_id)
+
+        return ordered
+
+    def changes(self) -> list[tuple[str, UUID, UUID]]:
+        """Return the (action, task_id, project_id) changes of the batch."""
+
+        return [
+            (
+                "created" if task_id in self.creates else "updated",
+                task_id,
+                self.tasks[task_id]["project_id"],
+            )
+            for task_id in {**self.creates, **self.updates}
+        ]
+
+    def count_deltas(self) -> Counter:
+        """Status counter changes of the created and updated tasks."""
+
+        deltas = Counter()
+
+        for task_id in self.creates:
+            track_change(deltas, None, task_state(self.tasks[task_id]))
+
+        for task_id in self.updates:
+            track_change(
+                deltas,
+                task_state(self.loaded[task_id]),
+                task_state(self.tasks[task_id]),
+            )
+
+        return deltas
+
+
+# Helpers
+
+
+def referenced_ids(
+    payload: TaskBulkRequest,
+) -> tuple[set[UUID], set[UUID], set[UUID]]:
+    """Collect the task, parent task and project ids a batch refers to."""
+
+    task_ids: set[UUID] = set()
+    parent_ids: set[UUID] = set()
+    project_ids: set[UUID] = set()
+
+    for operation in payload.operations:
+        if isinstance(operation, BulkCreate):
+            project_ids.add(operation.task.project_id)
+            parent_id = operation.task.parent_task_id
+        elif isinstance(operation, BulkUpdate):
+            parent_id = operation.changes.parent_task_id
+        elif isinstance(operation, BulkMove):
+            parent_id = operation.parent_task_id
+        else:
+            parent_id = None
+
+        if operation.id is not None:
+            task_ids.add(operation.id)
+        if parent_id is not None:
+            parent_ids.add(parent_id)
+
+    return task_ids | parent_ids, parent_ids, project_ids
+
+
+def select_ancestor_links(task_ids: set[UUID]) -> Select:
+    """Select the parent links of tasks and of all their ancestors.
+
+    UNION rather than UNION ALL, so a corrupt cycle cannot recurse forever.
+    """
+
+    start = select(Task.id, Task.parent_task_id).where(Task.id.in_(task_ids))
+    links = start.cte("ancestor_links", recursive=True)
+    parent = aliased(Task)
+    links = links.union(
+        select(parent.id, parent.parent_task_id).join(
+            links, parent.id == links.c.parent_task_id
+        )
+    )
+
+    return select(links.c.id, links.c.parent_task_id)
+
+
+def load_plan(db: Session, user_id: UUID, payload: TaskBulkRequest) -> BulkPlan:
+    """Load everything a batch needs to be validated in a few queries."""
+
+    task_ids, parent_ids, project_ids = referenced_ids(payload)
+
+    # Soft deleted rows keep their id, creates must not reuse it. The rows
+    # stay locked until commit, so the counter deltas use their last state.
+    stmt = select(
+        Task.id, Task.project_id, Task.assignee_id, Task.status, Task.is_deleted
+    ).where(Task.id.in_(task_ids))
+    rows = db.execute(lock_tasks_for_write(db, stmt, task_ids)).all()
+    live_rows = [row for row in rows if not row.is_deleted]
+    project_ids.update(row.project_id for row in live_rows)
+
+    allowed_projects = select_writable_project_ids(db, user_id, project_ids)
+
+    plan = BulkPlan(user_id, allowed_projects)
+    plan.existing_ids = {row.id for row in rows}
+    plan.loaded = {
+        row.id: {
+            "project_id": row.project_id,
+            "assignee_id": row.assignee_id,
+            "status": row.status,
+        }
+        for row in live_rows
+    }
+    plan.tasks = {task_id: task.copy() for task_id, task in plan.loaded.items()}
+
+    # Ancestor chains of the new parents, to detect cycles in memory.
+    if parent_ids:
+        plan.parents = dict(
+            db.execute(select_ancestor_links(parent_ids)).tuples().all()
+        )
+
+    return plan
+
+
+# Main service
+
+
+def run_bulk_operations(
+    db: Session, user_id: UUID, payload: TaskBulkRequest
+) -> TaskBulkResult:
+    """Validate a batch of task operations and apply the valid ones at once."""
+
+    plan = load_plan(db, user_id, payload)
+    results: list[BulkItemResult] = []
+
+    for index, operation in enumerate(payload.operations):
+        try:
+            task_id = plan.apply(operation)
+        except (BulkItemError, InvalidTask) as error:
+            results.append(
+                BulkItemResult(
+                    index=index,
+                    op=operation.op,
+                    id=operation.id,
+                    ok=False,
+                    error=str(error),
+                )
+            )
+        else:
+            results.append(
+                BulkItemResult(index=index, op=operation.op, id=task_id, ok=True)
+            )
+
+    if plan.creates:
+        db.execute(insert(Task), plan.ordered_creates())
+
+    if plan.updates:
+        db.execute(update(Task), list(plan.updates.values()))
+
+    apply_count_deltas(db, plan.count_deltas())
+    db.commit()
+
+    publish_task_changes(db, plan.changes())
+
+    applied = sum(result.ok for result in results)
+    return TaskBulkResult(
+        applied=applied, failed=len(results) - applied, results=results
+    )
@@ -0,0 +1,185 @@
+"""Import necessary libraries for task status count service."""
+
+from collections import Counter
+from typing import get_args
+from uuid import UUID
+
+from sqlalchemy import delete, func, literal, select, union_all
+from sqlalchemy.orm import Session
+
+from app.db.dialect import dialect_insert
+from app.models.task.task import Task
+from app.models.task.task_status_count import TaskStatusCount
+from app.schemas.task import TaskCounts, TaskStatus
+from app.services.workspace_service import ensure_project_access
+
+CountKey = tuple[str, UUID, str]
+
+# Advisory lock key serializing reconcilers across processes on PostgreSQL.
+RECONCILE_LOCK_KEY = 0x7A5C0C
+
+# Helpers
+
+
+def task_state(task) -> dict:
+    """The fields of a task, ORM object or row dict, that its counts depend on."""
+
+    get = task.get if isinstance(task, dict) else lambda key: getattr(task, key)
+
+    return {
+        "project_id": get("project_id"),
+        "assignee_id": get("assignee_id"),
+        "status": get("status") or "to do",
+        "is_deleted": bool(get("is_deleted")),
+    }
+
+
+def count_keys(state: dict) -> list[CountKey]:
+    """The counters a task in `state` is counted in."""
+
+    if state["is_deleted"]:
+        return []
+
+    keys = [("project", state["project_id"], state["status"])]
+
+    if state["assignee_id"] is not None:
+        keys.append(("assignee", state["assignee_id"], state["status"]))
+
+    return keys
+
+
+def track_change(deltas: Counter, before: dict | None, after: dict | None) -> None:
+    """Add to `deltas` the counter changes of a task going from before to after."""
+
+    for key in count_keys(before) if before else []:
+        deltas[key] -= 1
+
+    for key in count_keys(after) if after else []:
+        deltas[key] += 1
+
+
+def apply_count_deltas(db: Session, deltas: Counter) -> None:
+    """Add deltas to their counters with one upsert, in the caller transaction.
+
+    Keys are sorted so concurrent writers lock counter rows in one order.
+    """
+
+    rows = [
+        {"scope": scope, "scope_id": scope_id, "status": status, "task_count": delta}
+        for (scope, scope_id, status), delta in sorted(deltas.items())
+        if delta
+    ]
+
+    if not rows:
+        return
+
+    stmt = dialect_insert(db.get_bind().dialect.name, TaskStatusCount).values(rows)
+    stmt = stmt.on_conflict_do_update(
+        index_elements=["scope", "scope_id", "status"],
+        set_={"task_count": TaskStatusCount.task_count + stmt.excluded.task_count},
+    )
+
+    db.execute(stmt)
+
+
+def lock_reconciliation(db: Session) -> bool:
+    """Take the reconciliation lock until the transaction ends, or tell it is held.
+
+    PostgreSQL uses a transaction advisory lock, so a reconciler overlapping
+    another skips its run instead of applying the same drift twice. SQLite
+    serializes writers: dropping the zeroed counters first takes the write
+    lock, so a second reconciler waits and then reads the corrected counters.
+    """
+
+    if db.get_bind().dialect.name == "postgresql":
+        return bool(
+            db.scalar(select(func.pg_try_advisory_xact_lock(RECONCILE_LOCK_KEY)))
+        )
+
+    db.execute(delete(TaskStatusCount).where(TaskStatusCount.task_count == 0))
+    return True
+
+
+# Main services
+
+
+def get_task_counts(db: Session, scope: str, scope_id: UUID) -> TaskCounts:
+    """Read the per-status counts of a project or assignee from their counters."""
+
+    stmt = select(TaskStatusCount.status, TaskStatusCount.task_count).where(
+        TaskStatusCount.scope == scope, TaskStatusCount.scope_id == scope_id
+    )
+    counts = dict.fromkeys(get_args(TaskStatus), 0)
+    counts.update(db.execute(stmt).tuples().all())
+
+    return TaskCounts(scope=scope, scope_id=scope_id, counts=counts)
+
+
+def get_task_counts_for_user(
+    db: Session, user_id: UUID, project_id: UUID | None = None
+) -> TaskCounts:
+    """Counts of a project of the user, or of the tasks assigned to the user."""
+
+    if project_id is None:
+        return get_task_counts(db, "assignee", user_id)
+
+    ensure_project_access(db, user_id, project_id)
+    return get_task_counts(db, "project", project_id)
+
+
+def reconcile_task_counts(db: Session) -> int:
+    """Fix counters that drifted from the tasks table, return how many.
+
+    The drift is computed in one statement, so it reads the tasks and the
+    counters from the same snapshot, and applied as deltas, so writes
+    committed meanwhile are kept. Reconcilers of all workers are serialized,
+    so overlapping runs never correct the same drift twice.
+    """
+
+    if not lock_reconciliation(db):
+        db.rollback()
+        return 0
+
+    live = Task.is_live
+    drift = union_all(
+        select(
+            literal("project").label("scope"),
+            Task.project_id.label("scope_id"),
+            Task.status.label("status"),
+            func.count().label("delta"),
+        )
+        .where(live)
+        .group_by(Task.project_id, Task.status),
+        select(
+            literal("assignee").label("scope"),
+            Task.assignee_id.label("scope_id"),
+            Task.status.label("status"),
+            func.count().label("delta"),
+        )
+        .where(live, Task.assignee_id.is_not(None))
+        .group_by(Task.assignee_id, Task.status),
+        select(
+            TaskStatusCount.scope,
+            TaskStatusCount.scope_id,
+            TaskStatusCount.status,
+            -TaskStatusCount.task_count,
+        ),
+    ).subquery()
+
+    stmt = (
+        select(drift.c.scope, drift.c.scope_id, drift.c.status, func.sum(drift.c.delta))
+        .group_by(drift.c.scope, drift.c.scope_id, drift.c.status)
+        .having(func.sum(drift.c.delta) != 0)
+    )
+    deltas = Counter(
+        {
+            (scope, scope_id, status): delta
+            for scope, scope_id, status, delta in db.execute(stmt)
+        }
+    )
+
+    apply_count_deltas(db, deltas)
+    db.execute(delete(TaskStatusCount).where(TaskStatusCount.task_count == 0))
+    db.commit()
+
+    return len(deltas)
@@ -0,0 +1,55 @@
+"""Import necessary libraries for soft deleted task purge service."""
+
+from datetime import datetime
+
+from sqlalchemy import delete, exists, select
+from sqlalchemy.orm import Session, aliased
+
+from app.models.task.attachment import Attachment
+from app.models.task.comment import Comment
+from app.models.task.reminder import Reminder
+from app.models.task.task import Task
+from app.models.task.task_tag import TaskTag
+
+# Main services
+
+
+def purge_deleted_tasks(db: Session, deleted_before: datetime, batch_size: int) -> int:
+    """Hard delete one bounded batch of tasks soft deleted before a date.
+
+    The batch is read through idx_tasks_deleted_at and its dependent rows are
+    deleted explicitly, child tables first, so one short transaction holds
+    at most `batch_size` task locks. Tasks that still have subtasks wait
+    until those are purged, so a live subtask never loses its parent.
+    Stored attachment objects are content addressed and may be shared, they
+    are left to the storage.
+    """
+
+    subtask = aliased(Task)
+    stmt = (
+        select(Task.id)
+        .where(
+            Task.is_deleted.is_(True),
+            Task.deleted_at < deleted_before,
+            ~exists().where(subtask.parent_task_id == Task.id),
+        )
+        .order_by(Task.deleted_at)
+        .limit(batch_size)
+    )
+
+    if db.get_bind().dialect.name == "postgresql":
+        stmt = stmt.with_for_update(skip_locked=True)
+
+    task_ids = db.execute(stmt).scalars().all()
+
+    if not task_ids:
+        db.rollback()
+        return 0
+
+    for model in (TaskTag, Reminder, Attachment, Comment):
+        db.execute(delete(model).where(model.task_id.in_(task_ids)))
+
+    db.execute(delete(Task).where(Task.id.in_(task_ids)))
+    db.commit()
+
+    return len(task_ids)
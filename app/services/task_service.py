@@ -0,0 +1,584 @@
+"""Import necessary libraries for task service."""
+
+from collections import Counter
+from datetime import date, datetime, time, timezone
+from uuid import UUID
+
+from sqlalchemy import (
+    Select,
+    and_,
+    exists,
+    intersect,
+    literal_column,
+    or_,
+    select,
+    tuple_,
+    update,
+)
+from sqlalchemy.orm import Session, aliased
+
+from app.core.clock import normalize_utc
+from app.core.conditional import Validators, page_etag, weak_etag
+from app.core.domain_errors import InvalidTask, NotFound
+from app.core.pagination import decode_cursor, encode_cursor
+from app.core.recurrence import (
+    RecurrenceError,
+    RecurrenceRule,
+    compile_rule,
+    next_occurrences,
+    occurrences_between,
+)
+from app.models.project.project import Project
+from app.models.task.task import Task
+from app.models.task.task_tag import TaskTag
+from app.schemas.task import (
+    CalendarEntry,
+    TaskCreate,
+    TaskOut,
+    TaskPage,
+    TaskRollup,
+    TaskTreeNode,
+    TaskUpdate,
+)
+from app.services.change_feed_service import publish_task_changes
+from app.services.task_count_service import apply_count_deltas, task_state, track_change
+from app.services.workspace_service import (
+    ensure_project_access,
+    ensure_workspace_role,
+    select_project_ids_for_user,
+)
+
+MAX_TREE_DEPTH = 50
+NEXT_OCCURRENCES = 5
+MAX_CALENDAR_DAYS = 92
+MAX_OCCURRENCES_PER_TASK = 100
+
+# Helpers
+
+
+def select_tasks_for_user(user_id: UUID) -> Select:
+    """Select the live tasks a user can see."""
+
+    return select(Task).where(
+        Task.project_id.in_(select_project_ids_for_user(user_id)),
+        Task.is_live,
+    )
+
+
+def lock_tasks_for_write(db: Session, stmt: Select, task_ids) -> Select:
+    """Lock the tasks a write reads, so its counter deltas start from their state.
+
+    PostgreSQL locks the rows with FOR UPDATE. SQLite has no row locks and
+    pysqlite only opens transactions on writes, so a no-op UPDATE of the
+    rows takes the database write lock before they are read.
+    """
+
+    if db.get_bind().dialect.name == "postgresql":
+        stmt = stmt.with_for_update(of=Task)
+    else:
+        db.execute(
+            update(Task)
+            .where(Task.id.in_(task_ids))
+            .values(id=Task.id, updated_at=Task.updated_at)
+            .execution_options(synchronize_session=False)
+        )
+
+    return stmt.execution_options(populate_existing=True)
+
+
+def get_task_for_user(
+    db: Session,
+    user_id: UUID,
+    task_id: UUID,
+    minimum: str = "viewer",
+    for_update: bool = False,
+) -> Task:
+    """Get a live task whose workspace the user holds `minimum` in.
+
+    Raise NotFound for unknown tasks and non members, PermissionDenied for
+    lower roles. The role comes from the role cache. Writes pass
+    `for_update` to lock the task until they commit.
+    """
+
+    stmt = (
+        select(Task, Project.workspace_id)
+        .join(Project, Project.id == Task.project_id)
+        .where(Task.id == task_id, Task.is_live)
+    )
+    if for_update:
+        stmt = lock_tasks_for_write(db, stmt, [task_id])
+
+    row = db.execute(stmt).first()
+
+    if row is None:
+        raise NotFound()
+
+    ensure_workspace_role(db, user_id, row.workspace_id, minimum)
+
+    return row.Task
+
+
+def filter_by_tags(
+    stmt: Select,
+    tags_all: list[UUID] | None = None,
+    tags_any: list[UUID] | None = None,
+    tags_none: list[UUID] | None = None,
+) -> Select:
+    """Keep the tasks having every `tags_all`, one of `tags_any`, no `tags_none`.
+
+    The AND and OR sets are read through idx_task_tags_tag_id_task_id, one
+    index range per tag, AND being the INTERSECT of those ranges. The NOT
+    set is checked per task through the (task_id, tag_id) primary key.
+    """
+
+    if tags_all:
+        per_tag = [
+            select(TaskTag.task_id).where(TaskTag.tag_id == tag_id)
+            for tag_id in set(tags_all)
+        ]
+        tagged = per_tag[0] if len(per_tag) == 1 else intersect(*per_tag)
+        stmt = stmt.where(Task.id.in_(tagged))
+
+    if tags_any:
+        stmt = stmt.where(
+            Task.id.in_(select(TaskTag.task_id).where(TaskTag.tag_id.in_(tags_any)))
+        )
+
+    if tags_none:
+        stmt = stmt.where(
+            ~exists().where(TaskTag.task_id == Task.id, TaskTag.tag_id.in_(tags_none))
+        )
+
+    return stmt
+
+
+def select_task_list(
+    user_id: UUID,
+    project_id: UUID | None = None,
+    assignee_id: UUID | None = None,
+    status: str | None = None,
+    tags_all: list[UUID] | None = None,
+    tags_any: list[UUID] | None = None,
+    tags_none: list[UUID] | None = None,
+) -> Select:
+    """Select the visible tasks matching the task list filters."""
+
+    stmt = select_tasks_for_user(user_id)
+
+    if project_id is not None:
+        stmt = stmt.where(Task.project_id == project_id)
+
+    if assignee_id is not None:
+        stmt = stmt.where(Task.assignee_id == assignee_id)
+
+    if status is not None:
+        stmt = stmt.where(Task.status == status)
+
+    return filter_by_tags(stmt, tags_all, tags_any, tags_none)
+
+
+def completed_at_for(status: str) -> date | None:
+    """Return the completion date matching a task status."""
+
+    return date.today() if status == "done" else None
+
+
+def check_recurrence_rule(rule: str | None) -> None:
+    """Raise InvalidTask unless the rule is empty or of the supported subset."""
+
+    if rule is None:
+        return
+
+    try:
+        compile_rule(rule)
+    except RecurrenceError as error:
+        raise InvalidTask(f"Invalid recurrence rule: {error}") from error
+
+
+def recurrence_of(task: Task) -> RecurrenceRule | None:
+    """The compiled rule of a task, None for one-off tasks or unsupported rules."""
+
+    if not task.recurrence_rule:
+        return None
+
+    try:
+        return compile_rule(task.recurrence_rule)
+    except RecurrenceError:
+        return None
+
+
+def recurrence_start(task: Task) -> date:
+    """The date a task recurs from."""
+
+    return task.due_at or task.start_at or task.created_at.date()
+
+
+def task_out(task: Task, today: date, schema: type[TaskOut] = TaskOut, **fields):
+    """Serialize a task with its next occurrences, if it recurs."""
+
+    if recurrence_of(task) is not None:
+        fields["next_occurrences"] = next_occurrences(
+            task.recurrence_rule, recurrence_start(task), today, NEXT_OCCURRENCES
+        )
+
+    return schema.from_row(task, **fields)
+
+
+def select_ancestor_path(task_id: UUID, user_id: UUID | None = None) -> Select:
+    """Select a task and its ancestors with their distance, in one recursive CTE."""
+
+    start = select(
+        Task.id, Task.parent_task_id, literal_column("0").label("depth")
+    ).where(Task.id == task_id)
+    if user_id is not None:
+        start = start.where(
+            Task.project_id.in_(select_project_ids_for_user(user_id)),
+            Task.is_live,
+        )
+
+    path = start.cte("task_path", recursive=True)
+    parent = aliased(Task)
+    path = path.union_all(
+        select(parent.id, parent.parent_task_id, path.c.depth + 1)
+        .join(path, parent.id == path.c.parent_task_id)
+        .where(path.c.depth < MAX_TREE_DEPTH)
+    )
+
+    return select(Task, path.c.depth).join(path, Task.id == path.c.id)
+
+
+def check_parent(db: Session, task: Task, parent_task_id: UUID) -> None:
+    """Check that a parent task is in the same project and makes no cycle."""
+
+    parent = db.get(Task, parent_task_id)
+
+    if parent is None or parent.is_deleted or parent.project_id != task.project_id:
+        raise InvalidTask("Parent task must belong to the same project.")
+
+    stmt = select_ancestor_path(parent_task_id).with_only_columns(Task.id)
+    if task.id in set(db.scalars(stmt)):
+        raise InvalidTask("A task cannot be its own ancestor.")
+
+
+# Main services
+
+
+def create_task(db: Session, user_id: UUID, payload: TaskCreate) -> Task:
+    """Create a task in a project of the user."""
+
+    ensure_project_access(db, user_id, payload.project_id, "member")
+    check_recurrence_rule(payload.recurrence_rule)
+
+    task = Task(
+        **payload.model_dump(),
+        created_by=user_id,
+        completed_at=completed_at_for(payload.status),
+    )
+
+    if payload.parent_task_id is not None:
+        check_parent(db, task, payload.parent_task_id)
+
+    deltas = Counter()
+    track_change(deltas, None, task_state(task))
+    apply_count_deltas(db, deltas)
+
+    db.add(task)
+    db.commit()
+    db.refresh(task)
+
+    publish_task_changes(db, [("created", task.id, task.project_id)])
+
+    return task
+
+
+def select_task_page(
+    user_id: UUID,
+    project_id: UUID | None = None,
+    assignee_id: UUID | None = None,
+    status: str | None = None,
+    tags_all: list[UUID] | None = None,
+    tags_any: list[UUID] | None = None,
+    tags_none: list[UUID] | None = None,
+    cursor: str | None = None,
+    limit: int = 50,
+) -> Select:
+    """Select one keyset page of tasks by (created_at, id), plus one extra row."""
+
+    stmt = select_task_list(
+        user_id, project_id, assignee_id, status, tags_all, tags_any, tags_none
+    )
+
+    if cursor is not None:
+        created_at, task_id = decode_cursor(cursor)
+        stmt = stmt.where(tuple_(Task.created_at, Task.id) > (created_at, task_id))
+
+    return stmt.order_by(Task.created_at, Task.id).limit(limit + 1)
+
+
+def task_page_etag(rows: list[tuple], has_more: bool, today: date) -> str:
+    """ETag of a task page from its (id, updated_at) rows.
+
+    The day is part of it, it changes the next occurrences of recurring tasks.
+    """
+
+    return page_etag("tasks", rows, has_more, today)
+
+
+def list_tasks(db: Session, user_id: UUID, **filters) -> TaskPage:
+    """List tasks ordered by (created_at, id), one keyset page at a time."""
+
+    limit = filters.get("limit", 50)
+    tasks = db.execute(select_task_page(user_id, **filters)).scalars().all()
+
+    next_cursor = None
+    if len(tasks) > limit:
+        tasks = tasks[:limit]
+        next_cursor = encode_cursor(tasks[-1].created_at, tasks[-1].id)
+
+    today = date.today()
+
+    return TaskPage(
+        items=[task_out(task, today) for task in tasks],
+        next_cursor=next_cursor,
+    )
+
+
+def get_task_page_validators(page: TaskPage) -> Validators:
+    """Validators of a loaded task page, equal to get_task_list_validators."""
+
+    rows = [(item.id, item.updated_at) for item in page.items]
+    return Validators(
+        etag=task_page_etag(rows, page.next_cursor is not None, date.today())
+    )
+
+
+def get_task_validators(db: Session, user_id: UUID, task_id: UUID) -> Validators:
+    """Validators of a visible task, reading its updated_at only.
+
+    The next occurrences of a recurring task move with the day, so its
+    validators do too.
+    """
+
+    stmt = (
+        select_tasks_for_user(user_id)
+        .with_only_columns(Task.updated_at, Task.recurrence_rule)
+        .where(Task.id == task_id)
+    )
+    row = db.execute(stmt).first()
+
+    if row is None:
+        raise NotFound()
+
+    if not row.recurrence_rule:
+        return Validators(
+            etag=weak_etag("task", task_id, row.updated_at),
+            last_modified=row.updated_at,
+        )
+
+    today = date.today()
+    return Validators(
+        etag=weak_etag("task", task_id, row.updated_at, today),
+        last_modified=max(
+            normalize_utc(row.updated_at),
+            datetime.combine(today, time.min, tzinfo=timezone.utc),
+        ),
+    )
+
+
+def get_task_list_validators(db: Session, user_id: UUID, **filters) -> Validators:
+    """Validators of a task page, reading only the ids and updated_at of its rows.
+
+    A write changes the updated_at of a row, and a create or delete changes
+    which rows the page holds. Collections carry no Last-Modified, a delete
+    would not move it.
+    """
+
+    limit = filters.get("limit", 50)
+    stmt = select_task_page(user_id, **filters).with_only_columns(
+        Task.id, Task.updated_at
+    )
+    rows = db.execute(stmt).tuples().all()
+
+    return Validators(
+        etag=task_page_etag(rows[:limit], len(rows) > limit, date.today())
+    )
+
+
+def list_calendar(
+    db: Session,
+    user_id: UUID,
+    start: date,
+    end: date,
+    project_id: UUID | None = None,
+) -> list[CalendarEntry]:
+    """List the due dates and recurrences of tasks within [start, end].
+
+    Recurring tasks are expanded lazily from the start of the window, and at
+    most MAX_OCCURRENCES_PER_TASK times each.
+    """
+
+    if end < start:
+        raise InvalidTask("Calendar end must not be before its start.")
+
+    if (end - start).days >= MAX_CALENDAR_DAYS:
+        raise InvalidTask(f"Calendar windows span at most {MAX_CALENDAR_DAYS} days.")
+
+    stmt = select_tasks_for_user(user_id).where(
+        or_(
+            Task.recurrence_rule.is_not(None),
+            and_(Task.due_at >= start, Task.due_at <= end),
+        )
+    )
+
+    if project_id is not None:
+        ensure_project_access(db, user_id, project_id)
+        stmt = stmt.where(Task.project_id == project_id)
+
+    entries = []
+
+    for task in db.execute(stmt).scalars():
+        rule = recurrence_of(task)
+
+        if rule is not None:
+            days = occurrences_between(
+                rule, recurrence_start(task), start, end, MAX_OCCURRENCES_PER_TASK
+            )
+        elif task.due_at is not None and start <= task.due_at <= end:
+            days = [task.due_at]
+        else:
+            days = []
+
+        entries.extend(
+            CalendarEntry(
+                task_id=task.id, title=task.title, status=task.status, occurs_on=day
+            )
+            for day in days
+        )
+
+    entries.sort(key=lambda entry: (entry.occurs_on, str(entry.task_id)))
+
+    return entries
+
+
+def update_task(db: Session, user_id: UUID, task_id: UUID, payload: TaskUpdate) -> Task:
+    """Apply the fields sent in a partial update."""
+
+    task = get_task_for_user(db, user_id, task_id, "member", for_update=True)
+    changes = payload.model_dump(exclude_unset=True)
+
+    for field in ("title", "status"):
+        if field in changes and changes[field] is None:
+            raise InvalidTask(f"Task {field} cannot be empty.")
+
+    if changes.get("parent_task_id") is not None:
+        check_parent(db, task, changes["parent_task_id"])
+
+    check_recurrence_rule(changes.get("recurrence_rule"))
+
+    if "status" in changes and changes["status"] != task.status:
+        changes["completed_at"] = completed_at_for(changes["status"])
+
+    before = task_state(task)
+
+    for field, value in changes.items():
+        setattr(task, field, value)
+
+    deltas = Counter()
+    track_change(deltas, before, task_state(task))
+    apply_count_deltas(db, deltas)
+
+    db.commit()
+    db.refresh(task)
+
+    publish_task_changes(db, [("updated", task.id, task.project_id)])
+
+    return task
+
+
+def get_task_ancestors(db: Session, user_id: UUID, task_id: UUID) -> list[Task]:
+    """Return the ancestors of a task, from the root down to its parent."""
+
+    stmt = select_ancestor_path(task_id, user_id)
+    rows = db.execute(stmt).all()
+
+    if not rows:
+        raise NotFound()
+
+    rows.sort(key=lambda row: row.depth, reverse=True)
+    return [task for task, depth in rows if depth > 0]
+
+
+def get_task_tree(
+    db: Session,
+    user_id: UUID,
+    task_id: UUID,
+    max_depth: int = MAX_TREE_DEPTH,
+    rollup: bool = False,
+) -> TaskTreeNode:
+    """Return a task with its live subtasks up to `max_depth` levels down.
+
+    The subtree is fetched with one recursive CTE and assembled in O(n).
+    """
+
+    start = select(Task.id, literal_column("0").label("depth")).where(
+        Task.id == task_id,
+        Task.project_id.in_(select_project_ids_for_user(user_id)),
+        Task.is_live,
+    )
+    tree = start.cte("task_tree", recursive=True)
+    child = aliased(Task)
+    tree = tree.union_all(
+        select(child.id, tree.c.depth + 1)
+        .join(tree, child.parent_task_id == tree.c.id)
+        .where(tree.c.depth < max_depth, child.is_live)
+    )
+
+    stmt = select(Task, tree.c.depth).join(tree, Task.id == tree.c.id)
+    rows = db.execute(stmt).all()
+
+    if not rows:
+        raise NotFound()
+
+    today = date.today()
+    nodes = {
+        task.id: task_out(task, today, TaskTreeNode, depth=depth)
+        for task, depth in rows
+    }
+    levels: list[list[TaskTreeNode]] = [[] for _ in range(max_depth + 1)]
+
+    for node in nodes.values():
+        levels[node.depth].append(node)
+        if node.depth > 0:
+            nodes[node.parent_task_id].children.append(node)
+
+    if rollup:
+        for level in reversed(levels):
+            for node in level:
+                node.rollup = TaskRollup()
+                for subtask in node.children:
+                    node.rollup.subtask_count += 1 + subtask.rollup.subtask_count
+                    node.rollup.done_count += (
+                        subtask.status == "done"
+                    ) + subtask.rollup.done_count
+                    node.rollup.estimate_minutes += (
+                        subtask.estimate_minutes or 0
+                    ) + subtask.rollup.estimate_minutes
+
+    return nodes[task_id]
+
+
+def delete_task(db: Session, user_id: UUID, task_id: UUID) -> None:
+    """Soft delete a task."""
+
+    task = get_task_for_user(db, user_id, task_id, "member", for_update=True)
+    before = task_state(task)
+    task.is_deleted = True
+    task.deleted_at = datetime.now(timezone.utc)
+
+    deltas = Counter()
+    track_change(deltas, before, None)
+    apply_count_deltas(db, deltas)
+
+    db.commit()
+
+    publish_task_changes(db, [("deleted", task.id, task.project_id)])
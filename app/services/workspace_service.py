@@ -0,0 +1,197 @@
+"""Import necessary libraries for workspace service."""
+
+from collections.abc import Iterable
+from uuid import UUID
+
+from sqlalchemy import Select, delete, select
+from sqlalchemy.orm import Session
+
+from app.core.domain_errors import NotFound, PermissionDenied
+from app.core.role_cache import role_cache
+from app.models.auth.user import User
+from app.models.project.project import Project
+from app.models.workspace.workspace_member import WorkspaceMember
+from app.schemas.workspace import MemberRoleUpdate
+from app.services.change_feed_service import publish_member_change
+
+ROLE_LEVELS = {"viewer": 0, "member": 1, "admin": 2, "owner": 3}
+
+# Helpers
+
+
+def select_project_ids_for_user(user_id: UUID) -> Select:
+    """Select the ids of the projects in the workspaces of a user."""
+
+    return (
+        select(Project.id)
+        .join(WorkspaceMember, WorkspaceMember.workspace_id == Project.workspace_id)
+        .where(WorkspaceMember.user_id == user_id)
+    )
+
+
+def get_workspace_roles(
+    db: Session, user_id: UUID, workspace_ids: Iterable[UUID]
+) -> dict[UUID, str | None]:
+    """Resolve the role of a user in many workspaces, None when not a member.
+
+    Cached roles are served from the role cache, the others are loaded
+    together with a single query.
+    """
+
+    roles, missing = role_cache.get_many(user_id, set(workspace_ids))
+
+    if missing:
+        versions = role_cache.versions(missing)
+        stmt = select(WorkspaceMember.workspace_id, WorkspaceMember.role).where(
+            WorkspaceMember.user_id == user_id,
+            WorkspaceMember.workspace_id.in_(missing),
+        )
+        loaded: dict[UUID, str | None] = dict.fromkeys(missing)
+        loaded.update(db.execute(stmt).tuples().all())
+
+        role_cache.set_many(user_id, loaded, versions)
+        roles.update(loaded)
+
+    return roles
+
+
+def has_role(role: str | None, minimum: str) -> bool:
+    """Tell whether a role grants at least the `minimum` role."""
+
+    return role is not None and ROLE_LEVELS[role] >= ROLE_LEVELS[minimum]
+
+
+def check_workspace_roles(
+    db: Session, user_id: UUID, workspace_ids: Iterable[UUID], minimum: str
+) -> dict[UUID, bool]:
+    """Tell for many workspaces whether the user holds at least `minimum`."""
+
+    roles = get_workspace_roles(db, user_id, workspace_ids)
+    return {
+        workspace_id: has_role(role, minimum) for workspace_id, role in roles.items()
+    }
+
+
+def ensure_workspace_role(
+    db: Session, user_id: UUID, workspace_id: UUID, minimum: str = "viewer"
+) -> str:
+    """Return the role of a member holding at least `minimum`.
+
+    Raise NotFound for non members and PermissionDenied for lower roles.
+    """
+
+    role = get_workspace_roles(db, user_id, [workspace_id])[workspace_id]
+
+    if role is None:
+        raise NotFound()
+
+    if not has_role(role, minimum):
+        raise PermissionDenied()
+
+    return role
+
+
+def ensure_project_access(
+    db: Session, user_id: UUID, project_id: UUID, minimum: str = "viewer"
+) -> None:
+    """Check the role of the user in the workspace of a project.
+
+    Raise NotFound for unknown projects and non members, PermissionDenied
+    below `minimum`.
+    """
+
+    stmt = select(Project.workspace_id).where(Project.id == project_id)
+    workspace_id = db.execute(stmt).scalar_one_or_none()
+
+    if workspace_id is None:
+        raise NotFound()
+
+    ensure_workspace_role(db, user_id, workspace_id, minimum)
+
+
+def select_writable_project_ids(
+    db: Session, user_id: UUID, project_ids: Iterable[UUID]
+) -> set[UUID]:
+    """Keep the projects whose workspace the user holds `member` or more in."""
+
+    stmt = select(Project.id, Project.workspace_id).where(Project.id.in_(project_ids))
+    workspaces = dict(db.execute(stmt).tuples().all())
+    allowed = check_workspace_roles(db, user_id, set(workspaces.values()), "member")
+
+    return {
+        project_id
+        for project_id, workspace_id in workspaces.items()
+        if allowed[workspace_id]
+    }
+
+
+# Main services
+
+
+def list_workspace_members(db: Session, workspace_id: UUID) -> list[WorkspaceMember]:
+    """List the members of a workspace."""
+
+    stmt = (
+        select(WorkspaceMember)
+        .where(WorkspaceMember.workspace_id == workspace_id)
+        .order_by(WorkspaceMember.added_at, WorkspaceMember.user_id)
+    )
+    return list(db.execute(stmt).scalars().all())
+
+
+def set_workspace_member(
+    db: Session,
+    caller_role: str,
+    workspace_id: UUID,
+    user_id: UUID,
+    payload: MemberRoleUpdate,
+) -> WorkspaceMember:
+    """Add a member or change their role, only owners may touch owners."""
+
+    if db.get(User, user_id) is None:
+        raise NotFound()
+
+    member = db.get(WorkspaceMember, (workspace_id, user_id))
+
+    if caller_role != "owner" and "owner" in (
+        payload.role,
+        member.role if member else None,
+    ):
+        raise PermissionDenied()
+
+    if member is None:
+        member = WorkspaceMember(workspace_id=workspace_id, user_id=user_id)
+        db.add(member)
+
+    member.role = payload.role
+    db.commit()
+    db.refresh(member)
+
+    role_cache.invalidate_workspace(workspace_id)
+    publish_member_change(workspace_id, "updated", user_id)
+    return member
+
+
+def remove_workspace_member(
+    db: Session, caller_role: str, workspace_id: UUID, user_id: UUID
+) -> None:
+    """Remove a member from a workspace, only owners may remove owners."""
+
+    member = db.get(WorkspaceMember, (workspace_id, user_id))
+
+    if member is None:
+        raise NotFound()
+
+    if member.role == "owner" and caller_role != "owner":
+        raise PermissionDenied()
+
+    db.execute(
+        delete(WorkspaceMember).where(
+            WorkspaceMember.workspace_id == workspace_id,
+            WorkspaceMember.user_id == user_id,
+        )
+    )
+    db.commit()
+
+    role_cache.invalidate_workspace(workspace_id)
+    publish_member_change(workspace_id, "deleted", user_id)
@@ -0,0 +1,399 @@
+"""Import necessary libraries for the auth and task load benchmark.
+
+Drives the app in process, against the database of DATABASE_URL, at a fixed
+concurrency and reports latency percentiles, throughput and SQL statements
+per request for every scenario:
+
+    python -m benchmarks.load --requests 200 --concurrency 16
+    python -m benchmarks.load --save      # record the baseline
+    python -m benchmarks.load --compare   # exit 1 on regressions
+
+Latencies only compare on the machine and database that recorded the
+baseline. Statement counts and the Argon2 cost compare anywhere.
+"""
+
+import argparse
+import asyncio
+import json
+import platform
+import statistics
+import sys
+import time
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass, field
+from pathlib import Path
+from uuid import UUID, uuid4
+
+import httpx
+from sqlalchemy import make_url
+
+from app.core.config import settings
+from app.core.security import hash_password
+from app.db.base import Base
+from app.db.query_stats import observe_queries
+from app.db.session import SessionLocal, async_engine, engine
+from app.main import app
+from app.models.auth.user import User
+from app.models.project.project import Project
+from app.models.workspace.workspace import Workspace
+from app.models.workspace.workspace_member import WorkspaceMember
+
+BASELINE = Path(__file__).parent / "baselines" / "load.json"
+PASSWORD = "bench-password"
+
+# Cache misses make statement counts fractional and vary with the run size,
+# an extra statement per request always shows.
+QUERY_SLACK = 0.5
+
+# Fixtures
+
+
+@dataclass
+class Context:
+    """State shared by the requests of a run."""
+
+    run_id: str
+    headers: dict[str, str] = field(default_factory=dict)
+    email: str = ""
+    project_id: UUID | None = None
+    task_ids: list[str] = field(default_factory=list)
+
+    def email_of(self, scenario: str, index: int) -> str:
+        return f"bench-{self.run_id}-{scenario}-{index}@donee.com"
+
+
+async def setup(client: httpx.AsyncClient, ctx: Context, requests: int) -> None:
+    """Register the main user, give it a project, a task and users to reset."""
+
+    ctx.email = ctx.email_of("main", 0)
+    res = await client.post(
+        "/auth/register",
+        json={"email": ctx.email, "username": ctx.email, "password": PASSWORD},
+    )
+    res.raise_for_status()
+
+    res = await client.post(
+        "/auth/login", json={"email": ctx.email, "password": PASSWORD}
+    )
+    res.raise_for_status()
+    ctx.headers = {"Authorization": f"Bearer {res.json()['access_token']}"}
+
+    # Reset users share one hash, registering each would time Argon2 too.
+    password_hash = hash_password(PASSWORD)
+
+    with SessionLocal() as db:
+        user = db.query(User).filter_by(email=ctx.email).one()
+
+        workspace = Workspace(owner_id=user.id, name="Benchmark")
+        db.add(workspace)
+        db.flush()
+        db.add(
+            WorkspaceMember(workspace_id=workspace.id, user_id=user.id, role="owner")
+        )
+        project = Project(workspace_id=workspace.id, name="Benchmark")
+        db.add(project)
+
+        for index in range(requests):
+            email = ctx.email_of("reset", index)
+            db.add(User(email=email, username=email, password_hash=password_hash))
+
+        db.commit()
+        ctx.project_id = project.id
+
+    # Reads and updates work without the task_create scenario too.
+    (await task_create(client, ctx, 0)).raise_for_status()
+
+
+# Scenarios
+
+Scenario = Callable[[httpx.AsyncClient, Context, int], Awaitable[httpx.Response]]
+
+
+async def register(client, ctx, index):
+    email = ctx.email_of("register", index)
+    return await client.post(
+        "/auth/register",
+        json={"email": email, "username": email, "password": PASSWORD},
+    )
+
+
+async def login(client, ctx, index):
+    return await client.post(
+        "/auth/login", json={"email": ctx.email, "password": PASSWORD}
+    )
+
+
+async def me(client, ctx, index):
+    return await client.get("/auth/me", headers=ctx.headers)
+
+
+async def password_reset(client, ctx, index):
+    """Request, verify and redeem a reset code, as one timed flow."""
+
+    email = ctx.email_of("reset", index)
+
+    res = await client.post("/auth/forgot-password", json={"email": email})
+    res.raise_for_status()
+    code = res.json()["debug_code"]
+
+    res = await client.post(
+        "/auth/verify-reset-code", json={"email": email, "code": code}
+    )
+    res.raise_for_status()
+
+    return await client.post(
+        "/auth/reset-password",
+        json={"email": email, "code": code, "new_password": f"{PASSWORD}-new"},
+    )
+
+
+async def task_create(client, ctx, index):
+    res = await client.post(
+        "/tasks",
+        json={"project_id": str(ctx.project_id), "title": f"Task {index}"},
+        headers=ctx.headers,
+    )
+    if res.is_success:
+        ctx.task_ids.append(res.json()["id"])
+    return res
+
+
+async def task_list(client, ctx, index):
+    return await client.get(
+        "/tasks", params={"project_id": str(ctx.project_id)}, headers=ctx.headers
+    )
+
+
+async def task_read(client, ctx, index):
+    task_id = ctx.task_ids[index % len(ctx.task_ids)]
+    return await client.get(f"/tasks/{task_id}", headers=ctx.headers)
+
+
+async def task_update(client, ctx, index):
+    task_id = ctx.task_ids[index % len(ctx.task_ids)]
+    return await client.patch(
+        f"/tasks/{task_id}", json={"priority": index % 4}, headers=ctx.headers
+    )
+
+
+SCENARIOS: dict[str, Scenario] = {
+    "register": register,
+    "login": login,
+    "me": me,
+    "password_reset": password_reset,
+    "task_create": task_create,
+    "task_list": task_list,
+    "task_read": task_read,
+    "task_update": task_update,
+}
+
+# Measurements
+
+
+def summarize(latencies: list[float], errors: int, elapsed: float, statements: int):
+    """Percentiles in ms, throughput and statements per request of a scenario."""
+
+    requests = len(latencies) + errors
+    if len(latencies) < 2:
+        latencies = latencies * 2 or [0.0, 0.0]
+
+    cuts = statistics.quantiles(latencies, n=100, method="inclusive")
+
+    return {
+        "requests": requests,
+        "errors": errors,
+        "p50_ms": round(cuts[49] * 1000, 2),
+        "p95_ms": round(cuts[94] * 1000, 2),
+        "p99_ms": round(cuts[98] * 1000, 2),
+        "throughput_rps": round(requests / elapsed, 1),
+        "queries_per_request": round(statements / requests, 2),
+    }
+
+
+async def run_scenario(
+    client: httpx.AsyncClient,
+    ctx: Context,
+    scenario: Scenario,
+    requests: int,
+    concurrency: int,
+) -> dict:
+    """Send `requests` requests from `concurrency` workers and summarize them."""
+
+    indices = iter(range(requests))
+    latencies: list[float] = []
+    errors = 0
+
+    async def worker() -> None:
+        nonlocal errors
+
+        for index in indices:
+            start = time.perf_counter()
+            try:
+                (await scenario(client, ctx, index)).raise_for_status()
+            except httpx.HTTPStatusError:
+                errors += 1
+            else:
+                latencies.append(time.perf_counter() - start)
+
+    with observe_queries() as stats:
+        start = time.perf_counter()
+        await asyncio.gather(*(worker() for _ in range(concurrency)))
+        elapsed = time.perf_counter() - start
+
+    return summarize(latencies, errors, elapsed, stats.count)
+
+
+def measure_hashing(rounds: int = 5) -> float:
+    """Median Argon2 hash time in ms, the floor of register and login."""
+
+    timings = []
+    for _ in range(rounds):
+        start = time.perf_counter()
+        hash_password(PASSWORD)
+        timings.append(time.perf_counter() - start)
+
+    return round(statistics.median(timings) * 1000, 2)
+
+
+async def run(names: list[str], requests: int, concurrency: int) -> dict:
+    """Run the scenarios in order against the app and return the report."""
+
+    # Limits would throttle the auth scenarios, jobs would add statements.
+    settings.ENVIRONMENT = "development"
+    settings.RATE_LIMIT_ENABLED = False
+    settings.RESET_TOKEN_SWEEP_INTERVAL_SECONDS = 0
+    settings.TASK_COUNT_RECONCILE_INTERVAL_SECONDS = 0
+    settings.TASK_PURGE_INTERVAL_SECONDS = 0
+
+    Base.metadata.create_all(bind=engine)
+
+    ctx = Context(run_id=uuid4().hex[:8])
+    report = {
+        "environment": {
+            "database": make_url(settings.DATABASE_URL).get_backend_name(),
+            "python": platform.python_version(),
+            "requests": requests,
+            "concurrency": concurrency,
+        },
+        "hash_ms": measure_hashing(),
+        "scenarios": {},
+    }
+
+    transport = httpx.ASGITransport(app=app)
+    async with app.router.lifespan_context(app):
+        async with httpx.AsyncClient(
+            transport=transport, base_url="http://bench"
+        ) as client:
+            await setup(client, ctx, requests)
+
+            for name in names:
+                report["scenarios"][name] = await run_scenario(
+                    client, ctx, SCENARIOS[name], requests, concurrency
+                )
+
+    await async_engine.dispose()
+    return report
+
+
+# Baselines
+
+
+def compare(report: dict, baseline: dict, tolerance: float) -> list[str]:
+    """Describe every metric of the report that regressed from the baseline."""
+
+    regressions = []
+
+    if report["environment"] != baseline["environment"]:
+        print("warning: baseline recorded with", baseline["environment"])
+
+    if report["hash_ms"] > baseline["hash_ms"] * tolerance:
+        regressions.append(
+            f"hash_ms {report['hash_ms']} > {baseline['hash_ms']} x{tolerance}"
+        )
+
+    for name, result in report["scenarios"].items():
+        expected = baseline["scenarios"].get(name)
+        if expected is None:
+            continue
+
+        if (
+            result["queries_per_request"]
+            > expected["queries_per_request"] + QUERY_SLACK
+        ):
+            regressions.append(
+                f"{name} queries_per_request {result['queries_per_request']}"
+                f" > {expected['queries_per_request']}"
+            )
+
+        if result["p95_ms"] > expected["p95_ms"] * tolerance:
+            regressions.append(
+                f"{name} p95_ms {result['p95_ms']} > {expected['p95_ms']}"
+                f" x{tolerance}"
+            )
+
+        if result["errors"] > expected["errors"]:
+            regressions.append(f"{name} errors {result['errors']}")
+
+    return regressions
+
+
+def print_report(report: dict) -> None:
+    """Print one line per scenario."""
+
+    print(f"argon2 hash {report['hash_ms']:.2f} ms")
+    print(
+        f"{'scenario':<15}{'req':>6}{'err':>5}{'p50 ms':>9}{'p95 ms':>9}"
+        f"{'p99 ms':>9}{'req/s':>9}{'sql/req':>9}"
+    )
+    for name, result in report["scenarios"].items():
+        print(
+            f"{name:<15}{result['requests']:>6}{result['errors']:>5}"
+            f"{result['p50_ms']:>9.2f}{result['p95_ms']:>9.2f}"
+            f"{result['p99_ms']:>9.2f}{result['throughput_rps']:>9.1f}"
+            f"{result['queries_per_request']:>9.2f}"
+        )
+
+
+def main() -> None:
+    """Run the benchmark, then save or compare against the baseline."""
+
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--requests", type=int, default=200)
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument(
+        "--scenarios", default=",".join(SCENARIOS), help="comma separated names"
+    )
+    parser.add_argument("--baseline", type=Path, default=BASELINE)
+    parser.add_argument("--save", action="store_true", help="record the baseline")
+    parser.add_argument("--compare", action="store_true", help="fail on regressions")
+    parser.add_argument(
+        "--tolerance", type=float, default=1.5, help="allowed latency ratio"
+    )
+    args = parser.parse_args()
+
+    names = args.scenarios.split(",")
+    unknown = set(names) - set(SCENARIOS)
+    if unknown:
+        parser.error(f"unknown scenarios: {', '.join(sorted(unknown))}")
+
+    report = asyncio.run(run(names, args.requests, args.concurrency))
+    print_report(report)
+
+    if args.save:
+        args.baseline.parent.mkdir(parents=True, exist_ok=True)
+        args.baseline.write_text(json.dumps(report, indent=2) + "\n")
+        print(f"baseline saved to {args.baseline}")
+
+    if args.compare:
+        regressions = compare(
+            report, json.loads(args.baseline.read_text()), args.tolerance
+        )
+        for regression in regressions:
+            print("regression:", regression)
+
+        if regressions:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,153 @@
+"""Import necessary libraries for the response serialization micro-benchmark.
+
+Measures the per-object cost of turning ORM rows into a JSON list response,
+the way FastAPI does it for a response_model, before and after the fast path:
+
+    python -m benchmarks.serialization --objects 1000 --repeat 20
+"""
+
+import argparse
+import timeit
+from datetime import date, datetime, timezone
+from functools import partial
+from uuid import uuid4
+
+from fastapi.responses import JSONResponse
+from pydantic import TypeAdapter
+
+from app.core.responses import FastJSONResponse
+from app.db import models  # noqa: F401
+from app.models.task.comment import Comment
+from app.models.task.task import Task
+from app.schemas.comment import CommentAuthor, CommentOut, CommentPage
+from app.schemas.task import TaskOut, TaskPage
+
+# Fixtures
+
+
+def make_tasks(count: int) -> list[Task]:
+    """Build task rows shaped like the ones list_tasks loads."""
+
+    now = datetime.now(timezone.utc)
+
+    return [
+        Task(
+            id=uuid4(),
+            project_id=uuid4(),
+            title=f"Task {index}",
+            description="Write the quarterly report and share it with the team.",
+            status="to do",
+            priority=2,
+            assignee_id=uuid4(),
+            created_by=uuid4(),
+            due_at=date.today(),
+            start_at=None,
+            completed_at=None,
+            estimate_minutes=30,
+            parent_task_id=None,
+            recurrence_rule=None,
+            created_at=now,
+            updated_at=now,
+        )
+        for index in range(count)
+    ]
+
+
+def make_comments(count: int) -> list[Comment]:
+    """Build comment rows shaped like the ones list_comments loads."""
+
+    now = datetime.now(timezone.utc)
+
+    return [
+        Comment(
+            id=uuid4(),
+            task_id=uuid4(),
+            author_id=uuid4(),
+            body="Looks good to me, merging after the review.",
+            is_edited=False,
+            created_at=now,
+            updated_at=now,
+        )
+        for _ in range(count)
+    ]
+
+
+# Paths
+
+
+def task_list(tasks: list[Task], build, response_class) -> bytes:
+    """Build, dump and render a task page like a response_model route."""
+
+    page = TaskPage(items=[build(task) for task in tasks])
+    content = TASK_PAGE.dump_python(TASK_PAGE.validate_python(page), mode="json")
+    return response_class(content).body
+
+
+def comment_list(comments: list[Comment], build, response_class) -> bytes:
+    """Build, dump and render a comment page like a response_model route."""
+
+    page = CommentPage(items=[build(comment, AUTHOR) for comment in comments])
+    content = COMMENT_PAGE.dump_python(COMMENT_PAGE.validate_python(page), mode="json")
+    return response_class(content).body
+
+
+AUTHOR = CommentAuthor(id=uuid4(), username="author")
+TASK_PAGE = TypeAdapter(TaskPage)
+COMMENT_PAGE = TypeAdapter(CommentPage)
+
+PATHS = {
+    "tasks": {
+        "before": lambda rows: task_list(rows, TaskOut.model_validate, JSONResponse),
+        "after": lambda rows: task_list(rows, TaskOut.from_row, FastJSONResponse),
+    },
+    "comments": {
+        "before": lambda rows: comment_list(
+            rows,
+            lambda comment, author: CommentOut(
+                id=comment.id,
+                task_id=comment.task_id,
+                author=author,
+                body=comment.body,
+                is_edited=comment.is_edited,
+                created_at=comment.created_at,
+                updated_at=comment.updated_at,
+            ),
+            JSONResponse,
+        ),
+        "after": lambda rows: comment_list(
+            rows,
+            lambda comment, author: CommentOut.from_row(comment, author=author),
+            FastJSONResponse,
+        ),
+    },
+}
+
+
+def main() -> None:
+    """Print the best per-object time of every path."""
+
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--objects", type=int, default=1000)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    rows = {"tasks": make_tasks(args.objects), "comments": make_comments(args.objects)}
+
+    for name, paths in PATHS.items():
+        timings = {}
+
+        for label, path in paths.items():
+            run = partial(path, rows[name])
+            assert run() == paths["before"](rows[name])
+            best = min(timeit.repeat(run, number=1, repeat=args.repeat))
+            timings[label] = best / args.objects * 1e6
+
+        print(
+            f"{name:<9} before {timings['before']:6.2f} us/object   "
+            f"after {timings['after']:6.2f} us/object   "
+            f"x{timings['before'] / timings['after']:.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
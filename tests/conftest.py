@@ -3,20 +3,40 @@
 import pytest
 from fastapi.testclient import TestClient
 from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
 from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import NullPool
 
+from app.core.principal_cache import principal_cache
+from app.core.rate_limit import InMemoryRateLimitBackend, rate_limiter
+from app.core.role_cache import role_cache
 from app.db.base import Base
-from app.db.session import get_db
+from app.db.query_stats import instrument
+from app.db.session import get_async_db, get_db
 from app.main import app
+from app.models.auth.user import User
+from app.models.project.project import Project
+from app.models.workspace.workspace import Workspace
+from app.models.workspace.workspace_member import WorkspaceMember
 
 SQL_ALCHEMY_URL = "sqlite:///./test.db"
 engine = create_engine(SQL_ALCHEMY_URL, connect_args={"check_same_thread": False})
+instrument(engine)
 TestingSessionLocal = sessionmaker(
     autocommit=False,
     autoflush=False,
     bind=engine,
 )
 
+ASYNC_SQL_ALCHEMY_URL = "sqlite+aiosqlite:///./test.db"
+async_engine = create_async_engine(ASYNC_SQL_ALCHEMY_URL, poolclass=NullPool)
+instrument(async_engine.sync_engine)
+TestingAsyncSessionLocal = async_sessionmaker(
+    autoflush=False,
+    expire_on_commit=False,
+    bind=async_engine,
+)
+
 
 @pytest.fixture(scope="function")
 def db_session():
@@ -31,6 +51,20 @@ def db_session():
         Base.metadata.drop_all(bind=engine)
 
 
+@pytest.fixture(scope="function")
+def session_factory(db_session):
+    """Sync session factory bound to the tests db."""
+
+    return TestingSessionLocal
+
+
+@pytest.fixture(scope="function")
+def async_session_factory(db_session):
+    """Async session factory bound to the tests db."""
+
+    return TestingAsyncSessionLocal
+
+
 @pytest.fixture(scope="function")
 def client(db_session):
     """Create a HTTP client."""
@@ -42,9 +76,57 @@ def client(db_session):
         finally:
             pass
 
+    async def override_get_async_db():
+        """Fake version of get_async_db"""
+        async with TestingAsyncSessionLocal() as db:
+            yield db
+
     app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_async_db] = override_get_async_db
+    principal_cache.clear()
+    role_cache.clear()
+    rate_limiter.use(InMemoryRateLimitBackend())
 
     with TestClient(app) as c:
         yield c
 
     app.dependency_overrides.clear()
+
+
+@pytest.fixture(scope="function")
+def auth_headers(client):
+    """Register and log in the default test user."""
+
+    client.post(
+        "/auth/register",
+        json={
+            "email": "test@donee.com",
+            "username": "testuser",
+            "password": "12345678",
+        },
+    )
+    res = client.post(
+        "/auth/login", json={"email": "test@donee.com", "password": "12345678"}
+    )
+
+    return {"Authorization": f"Bearer {res.json()['access_token']}"}
+
+
+@pytest.fixture(scope="function")
+def project(db_session, auth_headers):
+    """Create a workspace owned by the test user with one project."""
+
+    user = db_session.query(User).filter_by(email="test@donee.com").one()
+
+    workspace = Workspace(owner_id=user.id, name="Personal")
+    db_session.add(workspace)
+    db_session.flush()
+
+    db_session.add(
+        WorkspaceMember(workspace_id=workspace.id, user_id=user.id, role="owner")
+    )
+    project = Project(workspace_id=workspace.id, name="Donee")
+    db_session.add(project)
+    db_session.commit()
+
+    return project
@@ -0,0 +1,200 @@
+"""Attachment Tests."""
+
+import asyncio
+import hashlib
+
+import pytest
+
+from app.core.domain_errors import PayloadTooLarge, RangeNotSatisfiable
+from app.core.storage import (
+    InMemoryObjectStore,
+    LocalStorage,
+    get_storage,
+    parse_range,
+    save_stream,
+)
+from app.main import app
+from app.models.task.task import Task
+
+CONTENT = bytes(range(256)) * 64
+
+# Helpers
+
+
+@pytest.fixture
+def local_storage(tmp_path):
+    """Serve attachments from a temporary directory."""
+
+    storage = LocalStorage(tmp_path)
+    app.dependency_overrides[get_storage] = lambda: storage
+    return storage
+
+
+@pytest.fixture
+def object_store():
+    """Serve attachments from an in-memory object store."""
+
+    storage = InMemoryObjectStore()
+    app.dependency_overrides[get_storage] = lambda: storage
+    return storage
+
+
+@pytest.fixture
+def task(db_session, project):
+    """Create a task in the test project."""
+
+    task = Task(project_id=project.id, created_by=project.workspace.owner_id, title="t")
+    db_session.add(task)
+    db_session.commit()
+    return task
+
+
+def upload(client, headers, task, content=CONTENT, filename="notes.bin"):
+    """Upload `content` as an attachment of `task`."""
+
+    return client.post(
+        f"/tasks/{task.id}/attachments",
+        params={"filename": filename},
+        content=content,
+        headers={**headers, "Content-Type": "application/octet-stream"},
+    )
+
+
+async def chunked(content, size):
+    """Yield `content` in chunks of `size` bytes."""
+
+    for offset in range(0, len(content), size):
+        yield content[offset : offset + size]
+
+
+# Upload tests
+
+
+def test_upload_is_content_addressed_and_deduplicated(
+    client, auth_headers, task, local_storage
+):
+    """Test that identical uploads share a single stored file."""
+
+    first = upload(client, auth_headers, task)
+    second = upload(client, auth_headers, task, filename="copy.bin")
+
+    assert first.status_code == 201
+    assert first.json()["size_bytes"] == len(CONTENT)
+    assert first.json()["id"] != second.json()["id"]
+
+    stored = [
+        path for path in (local_storage.root / "objects").rglob("*") if path.is_file()
+    ]
+    assert [path.name for path in stored] == [hashlib.sha256(CONTENT).hexdigest()]
+    assert stored[0].read_bytes() == CONTENT
+    assert list(local_storage.staging_dir.iterdir()) == []
+
+    listed = client.get(f"/tasks/{task.id}/attachments", headers=auth_headers)
+    assert [item["filename"] for item in listed.json()] == ["notes.bin", "copy.bin"]
+
+
+def test_oversized_stream_is_rejected_without_leftovers(tmp_path):
+    """Test that a stream over the limit is refused and its staging file removed."""
+
+    storage = LocalStorage(tmp_path)
+
+    with pytest.raises(PayloadTooLarge):
+        asyncio.run(save_stream(storage, chunked(CONTENT, 1000), max_size=5000))
+
+    assert list(storage.staging_dir.iterdir()) == []
+
+    stored = asyncio.run(save_stream(storage, chunked(CONTENT, 1000)))
+    assert stored.size == len(CONTENT)
+    assert stored.sha256 == hashlib.sha256(CONTENT).hexdigest()
+
+
+def test_upload_releases_the_session_while_streaming(
+    client, auth_headers, task, object_store, db_session, monkeypatch
+):
+    """Test that no transaction is held open while the body is stored."""
+
+    in_transaction = []
+
+    async def exists(key):
+        in_transaction.append(db_session.in_transaction())
+        return key in object_store.objects
+
+    monkeypatch.setattr(object_store, "exists", exists)
+
+    assert upload(client, auth_headers, task).status_code == 201
+    assert in_transaction == [False]
+
+
+def test_upload_rejects_malformed_content_length(client, auth_headers, task):
+    """Test that a bad or oversized Content-Length is refused up front."""
+
+    for value, status_code in (("abc", 400), ("-1", 400), (str(2**62), 413)):
+        res = client.post(
+            f"/tasks/{task.id}/attachments",
+            params={"filename": "notes.bin"},
+            content=CONTENT,
+            headers={**auth_headers, "Content-Length": value},
+        )
+        assert res.status_code == status_code
+
+
+# Download tests
+
+
+def test_download_honours_etag_and_range(client, auth_headers, task, local_storage):
+    """Test full, conditional and partial downloads from local storage."""
+
+    attachment_id = upload(client, auth_headers, task).json()["id"]
+    url = f"/attachments/{attachment_id}/content"
+
+    full = client.get(url, headers=auth_headers)
+    assert full.status_code == 200
+    assert full.content == CONTENT
+    etag = full.headers["etag"]
+    assert etag == f'"{hashlib.sha256(CONTENT).hexdigest()}"'
+
+    cached = client.get(url, headers={**auth_headers, "If-None-Match": etag})
+    assert cached.status_code == 304
+
+    partial = client.get(url, headers={**auth_headers, "Range": "bytes=10-19"})
+    assert partial.status_code == 206
+    assert partial.content == CONTENT[10:20]
+    assert partial.headers["content-range"] == f"bytes 10-19/{len(CONTENT)}"
+
+
+def test_object_store_download_streams_ranges(client, auth_headers, task, object_store):
+    """Test that ranges are served when the backend has no local files."""
+
+    attachment_id = upload(client, auth_headers, task).json()["id"]
+    url = f"/attachments/{attachment_id}/content"
+
+    assert len(object_store.objects) == 1
+    assert client.get(url, headers=auth_headers).content == CONTENT
+
+    suffix = client.get(url, headers={**auth_headers, "Range": "bytes=-100"})
+    assert suffix.status_code == 206
+    assert suffix.content == CONTENT[-100:]
+
+    stale = client.get(
+        url, headers={**auth_headers, "Range": "bytes=0-9", "If-Range": '"old"'}
+    )
+    assert stale.status_code == 200
+    assert stale.content == CONTENT
+
+    outside = client.get(url, headers={**auth_headers, "Range": "bytes=999999-"})
+    assert outside.status_code == 416
+    assert outside.headers["content-range"] == f"bytes */{len(CONTENT)}"
+
+
+def test_parse_range():
+    """Test single range parsing."""
+
+    assert parse_range("bytes=0-0", 10) == (0, 1)
+    assert parse_range("bytes=5-", 10) == (5, 10)
+    assert parse_range("bytes=-3", 10) == (7, 10)
+    assert parse_range("bytes=8-100", 10) == (8, 10)
+    assert parse_range("bytes=0-1,4-5", 10) is None
+    assert parse_range("items=0-1", 10) is None
+
+    with pytest.raises(RangeNotSatisfiable):
+        parse_range("bytes=10-", 10)
@@ -44,10 +44,40 @@ def test_register_fails_if_email_exists(client):
     assert res1.status_code in (200, 201)
 
     res2 = register_user(client)
-    assert res2.status_code == 400
+    assert res2.status_code == 409
     assert res2.json().get("detail") == "Email already registered."
 
 
+def test_register_fails_if_username_taken(client):
+    """Test that a username that already exists cannot be registered."""
+
+    res1 = register_user(client)
+    assert res1.status_code in (200, 201)
+
+    res2 = register_user(client, email="other@donee.com")
+    assert res2.status_code == 409
+    assert res2.json().get("detail") == "Username already taken."
+
+
+def test_register_fails_if_email_exists_with_other_case(client):
+    """Test that emails are unique regardless of case."""
+
+    register_user(client)
+
+    res = register_user(client, email="TEST@Donee.com", username="otheruser")
+    assert res.status_code == 409
+    assert res.json().get("detail") == "Email already registered."
+
+
+def test_login_ignores_email_case(client):
+    """Test that login matches the email regardless of case."""
+
+    register_user(client, email="Test.User@donee.com")
+
+    res = login_user(client, email="test.user@DONEE.com")
+    assert res.status_code == 200
+
+
 def test_login_success_returns_token(client):
     """Test that a token is returned when logging in."""
 
@@ -190,3 +220,24 @@ def test_reset_password_fails_with_wrong_code(client):
         },
     )
     assert reset.status_code in (400, 401)
+
+
+def test_reset_code_locks_after_too_many_wrong_attempts(client):
+    """Test that the code stops working after too many wrong guesses."""
+
+    register_user(client)
+
+    forgot = client.post("/auth/forgot-password", json={"email": "test@donee.com"})
+    code = forgot.json()["debug_code"]
+    wrong = "000000" if code != "000000" else "111111"
+
+    for _ in range(5):
+        res = client.post(
+            "/auth/verify-reset-code", json={"email": "test@donee.com", "code": wrong}
+        )
+        assert res.status_code == 400
+
+    verify = client.post(
+        "/auth/verify-reset-code", json={"email": "test@donee.com", "code": code}
+    )
+    assert verify.status_code == 400
@@ -0,0 +1,103 @@
+"""Comment Tests."""
+
+from datetime import datetime
+from uuid import uuid4
+
+from app.core.pagination import encode_cursor
+from app.services.comment_service import select_comment_page
+
+# Helpers
+
+
+def create_task(client, headers, project):
+    """Create a task in the test project and return its id."""
+
+    res = client.post(
+        "/tasks",
+        json={"project_id": str(project.id), "title": "Task"},
+        headers=headers,
+    )
+    return res.json()["id"]
+
+
+def post_comment(client, headers, task_id, body="Hello"):
+    """Post a comment on a task."""
+
+    return client.post(
+        f"/tasks/{task_id}/comments", json={"body": body}, headers=headers
+    )
+
+
+# Comment tests
+
+
+def test_post_and_list_comments_with_authors(client, auth_headers, project):
+    """Test that comments are listed with their authors."""
+
+    task_id = create_task(client, auth_headers, project)
+
+    res = post_comment(client, auth_headers, task_id)
+    assert res.status_code == 201
+    assert res.json()["author"]["username"] == "testuser"
+
+    page = client.get(f"/tasks/{task_id}/comments", headers=auth_headers).json()
+    assert [item["body"] for item in page["items"]] == ["Hello"]
+    assert page["items"][0]["author"]["username"] == "testuser"
+
+
+def test_comments_page_with_cursor(client, auth_headers, project):
+    """Test that keyset pages return every comment once and in order."""
+
+    task_id = create_task(client, auth_headers, project)
+    bodies = [f"Comment {index}" for index in range(5)]
+    for body in bodies:
+        post_comment(client, auth_headers, task_id, body)
+
+    seen, cursor = [], None
+    while True:
+        params = {"limit": 2, **({"cursor": cursor} if cursor else {})}
+        page = client.get(
+            f"/tasks/{task_id}/comments", params=params, headers=auth_headers
+        ).json()
+        seen.extend(item["body"] for item in page["items"])
+
+        cursor = page["next_cursor"]
+        if cursor is None:
+            break
+
+    assert seen == bodies
+
+
+def test_edit_comment_marks_it_edited(client, auth_headers, project):
+    """Test that editing a comment changes its body and flag."""
+
+    task_id = create_task(client, auth_headers, project)
+    comment = post_comment(client, auth_headers, task_id).json()
+
+    res = client.patch(
+        f"/comments/{comment['id']}", json={"body": "Edited"}, headers=auth_headers
+    )
+    assert res.status_code == 200
+    assert res.json()["body"] == "Edited"
+    assert res.json()["is_edited"] is True
+
+
+def test_comment_page_query_uses_task_created_at_index(db_session):
+    """Test that the page query is served by the index without a sort."""
+
+    cursor = encode_cursor(datetime.now(), uuid4())
+    compiled = select_comment_page(uuid4(), cursor, 50).compile(
+        dialect=db_session.get_bind().dialect
+    )
+
+    plan = (
+        db_session.connection()
+        .exec_driver_sql(
+            f"EXPLAIN QUERY PLAN {compiled}", (None,) * len(compiled.positiontup)
+        )
+        .all()
+    )
+    details = " ".join(row[-1] for row in plan)
+
+    assert "idx_comments_task_id_created_at" in details
+    assert "TEMP B-TREE" not in details
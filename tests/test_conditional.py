@@ -0,0 +1,170 @@
+"""Conditional GET Tests."""
+
+from datetime import datetime, timezone
+
+from sqlalchemy import update
+
+from app.api.routes import task_routes
+from app.core.conditional import etag_matches, weak_etag
+from app.db.query_stats import query_budget
+from app.models.task.task import Task
+
+# Helpers
+
+
+def create_task(client, headers, project):
+    """Create a task and return its id."""
+
+    res = client.post(
+        "/tasks",
+        json={"project_id": str(project.id), "title": "Task"},
+        headers=headers,
+    )
+    return res.json()["id"]
+
+
+def backdate_tasks(db_session):
+    """Move every task to a fixed past instant, for exact Last-Modified values."""
+
+    db_session.execute(
+        update(Task).values(updated_at=datetime(2020, 1, 1, tzinfo=timezone.utc))
+    )
+    db_session.commit()
+
+
+# Helper tests
+
+
+def test_etags_compare_weakly():
+    """Test If-None-Match lists, wildcards and weak prefixes."""
+
+    etag = weak_etag("task", 1)
+
+    assert etag.startswith('W/"')
+    assert etag_matches(f'"other", {etag}', etag)
+    assert etag_matches(etag.removeprefix("W/"), etag)
+    assert etag_matches("*", etag)
+    assert not etag_matches('W/"other"', etag)
+
+
+# Endpoint tests
+
+
+def test_task_read_revalidates_without_loading(
+    client, auth_headers, project, db_session, monkeypatch
+):
+    """Test that a current client copy gets a 304 from updated_at alone."""
+
+    task_id = create_task(client, auth_headers, project)
+    backdate_tasks(db_session)
+
+    res = client.get(f"/tasks/{task_id}", headers=auth_headers)
+    etag = res.headers["etag"]
+    assert res.status_code == 200
+    assert res.headers["last-modified"] == "Wed, 01 Jan 2020 00:00:00 GMT"
+
+    def not_loaded(*args):
+        raise AssertionError("The task row was loaded.")
+
+    with monkeypatch.context() as patch:
+        patch.setattr(task_routes, "get_task_for_user", not_loaded)
+        res = client.get(
+            f"/tasks/{task_id}", headers={**auth_headers, "If-None-Match": etag}
+        )
+        assert res.status_code == 304
+        assert res.content == b""
+        assert res.headers["etag"] == etag
+
+        res = client.get(
+            f"/tasks/{task_id}",
+            headers={
+                **auth_headers,
+                "If-Modified-Since": "Thu, 02 Jan 2020 00:00:00 GMT",
+            },
+        )
+        assert res.status_code == 304
+
+    client.patch(f"/tasks/{task_id}", json={"title": "New"}, headers=auth_headers)
+
+    res = client.get(
+        f"/tasks/{task_id}", headers={**auth_headers, "If-None-Match": etag}
+    )
+    assert res.status_code == 200
+    assert res.headers["etag"] != etag
+    assert res.json()["title"] == "New"
+
+
+def test_task_list_etag_follows_writes(client, auth_headers, project):
+    """Test that creating, editing and deleting tasks changes the page ETag."""
+
+    task_id = create_task(client, auth_headers, project)
+    create_task(client, auth_headers, project)
+
+    def list_etag(etag=None):
+        headers = {**auth_headers, "If-None-Match": etag} if etag else auth_headers
+        res = client.get("/tasks", params={"limit": 1}, headers=headers)
+        assert "last-modified" not in res.headers
+        return res.status_code, res.headers["etag"]
+
+    _, etag = list_etag()
+    assert list_etag(etag) == (304, etag)
+
+    client.patch(f"/tasks/{task_id}", json={"title": "New"}, headers=auth_headers)
+    status, edited_etag = list_etag(etag)
+    assert status == 200
+    assert edited_etag != etag
+
+    client.delete(f"/tasks/{task_id}", headers=auth_headers)
+    status, deleted_etag = list_etag(edited_etag)
+    assert status == 200
+    assert deleted_etag != edited_etag
+
+    # Without a Last-Modified, If-Modified-Since alone never answers 304.
+    res = client.get(
+        "/tasks",
+        headers={**auth_headers, "If-Modified-Since": "Fri, 01 Jan 2100 00:00:00 GMT"},
+    )
+    assert res.status_code == 200
+
+
+def test_unconditional_lists_tag_the_loaded_page(client, auth_headers, project):
+    """Test that lists compute no validators without preconditions."""
+
+    create_task(client, auth_headers, project)
+
+    with query_budget(1):
+        res = client.get("/tasks", headers=auth_headers)
+
+    res = client.get(
+        "/tasks", headers={**auth_headers, "If-None-Match": res.headers["etag"]}
+    )
+    assert res.status_code == 304
+
+
+def test_comment_list_and_me_revalidate(client, auth_headers, project):
+    """Test 304s on comment lists and the current user."""
+
+    task_id = create_task(client, auth_headers, project)
+
+    res = client.get(f"/tasks/{task_id}/comments", headers=auth_headers)
+    etag = res.headers["etag"]
+    res = client.get(
+        f"/tasks/{task_id}/comments", headers={**auth_headers, "If-None-Match": etag}
+    )
+    assert res.status_code == 304
+
+    client.post(
+        f"/tasks/{task_id}/comments", json={"body": "Hello"}, headers=auth_headers
+    )
+    res = client.get(
+        f"/tasks/{task_id}/comments", headers={**auth_headers, "If-None-Match": etag}
+    )
+    assert res.status_code == 200
+    assert len(res.json()["items"]) == 1
+
+    res = client.get("/auth/me", headers=auth_headers)
+    assert res.headers["cache-control"] == "private, no-cache"
+    res = client.get(
+        "/auth/me", headers={**auth_headers, "If-None-Match": res.headers["etag"]}
+    )
+    assert res.status_code == 304
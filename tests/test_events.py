@@ -0,0 +1,327 @@
+"""Workspace change feed Tests."""
+
+import asyncio
+import uuid
+
+import pytest
+from starlette.websockets import WebSocketDisconnect
+
+from app.core.events import (
+    NOTIFY_MAX_BYTES,
+    AccessRevoked,
+    ChangeEvent,
+    EventHub,
+    PostgresEventBackend,
+    SlowConsumer,
+    Subscription,
+    event_hub,
+    sse_stream,
+    watch,
+)
+from tests.test_workspaces import register
+
+WORKSPACE_ID = uuid.uuid4()
+
+
+def change(object_id, action="updated"):
+    """Build a task change of the test workspace."""
+
+    return ChangeEvent(
+        workspace_id=WORKSPACE_ID,
+        kind="task",
+        action=action,
+        id=object_id,
+        task_id=object_id,
+    )
+
+
+# Subscription tests
+
+
+def test_subscription_coalesces_changes_of_an_object():
+    """Test that only the latest change of every object is delivered."""
+
+    first, second = uuid.uuid4(), uuid.uuid4()
+
+    async def run():
+        subscription = Subscription(WORKSPACE_ID, max_pending=10)
+        subscription.push(change(first, "created"))
+        subscription.push(change(second, "created"))
+        subscription.push(change(first, "deleted"))
+        return await subscription.next_batch()
+
+    batch = asyncio.run(run())
+
+    assert [(event.id, event.action) for event in batch] == [
+        (second, "created"),
+        (first, "deleted"),
+    ]
+
+
+def test_subscription_drops_slow_consumer():
+    """Test that a subscriber with too many pending changes must resync."""
+
+    async def run():
+        subscription = Subscription(WORKSPACE_ID, max_pending=2)
+        for _ in range(3):
+            subscription.push(change(uuid.uuid4()))
+        await subscription.next_batch()
+
+    with pytest.raises(SlowConsumer):
+        asyncio.run(run())
+
+
+def test_sse_stream_frames_batches_and_resync():
+    """Test the heartbeat, batch and resync messages of the SSE stream."""
+
+    object_id = uuid.uuid4()
+
+    async def run():
+        subscription = Subscription(WORKSPACE_ID, max_pending=1)
+        stream = sse_stream(subscription, heartbeat_seconds=0.01)
+
+        chunks = [await anext(stream)]
+        subscription.push(change(object_id))
+        chunks.append(await anext(stream))
+        subscription.push(change(uuid.uuid4()))
+        subscription.push(change(uuid.uuid4()))
+        chunks.append(await anext(stream))
+        return chunks
+
+    ping, batch, resync = asyncio.run(run())
+
+    assert ping == b": ping\n\n"
+    assert batch.startswith(b"event: changes\ndata: [")
+    assert str(object_id).encode() in batch
+    assert resync == b"event: resync\ndata: {}\n\n"
+
+
+def test_watch_rechecks_access_on_membership_changes():
+    """Test that access is checked again periodically and on member events."""
+
+    checks = []
+
+    async def check_access(membership_changed):
+        checks.append(membership_changed)
+        return len(checks) < 3
+
+    async def run():
+        subscription = Subscription(WORKSPACE_ID, max_pending=10)
+        stream = watch(
+            subscription, check_access, heartbeat_seconds=0.01, check_seconds=3600
+        )
+
+        subscription.push(change(uuid.uuid4()))
+        await anext(stream)
+        subscription.push(
+            ChangeEvent(WORKSPACE_ID, kind="member", action="updated", id=uuid.uuid4())
+        )
+        await anext(stream)
+
+        stream = watch(
+            subscription, check_access, heartbeat_seconds=0.01, check_seconds=0
+        )
+        await anext(stream)
+        subscription.push(
+            ChangeEvent(WORKSPACE_ID, kind="member", action="deleted", id=uuid.uuid4())
+        )
+        await anext(stream)
+
+    with pytest.raises(AccessRevoked):
+        asyncio.run(run())
+
+    assert checks == [True, False, True]
+
+
+# Backend tests
+
+
+class FakeConnection:
+    """Stand-in for an asyncpg connection."""
+
+    def __init__(self):
+        self.listeners = {}
+        self.terminated = []
+        self.closed = False
+        self.sent = []
+
+    async def add_listener(self, channel, listener):
+        self.listeners[channel] = listener
+
+    def add_termination_listener(self, listener):
+        self.terminated.append(listener)
+
+    async def execute(self, query, channel, payloads):
+        self.sent.append(payloads)
+        for payload in payloads:
+            self.listeners[channel](self, 0, channel, payload)
+
+    async def close(self):
+        self.closed = True
+
+    def is_closed(self):
+        return self.closed
+
+    def drop(self):
+        """Lose the connection, as a server restart would."""
+
+        self.closed = True
+        for listener in self.terminated:
+            listener(self)
+
+
+def test_postgres_backend_reconnects_and_resyncs():
+    """Test that a lost connection is reopened with backoff and resyncs."""
+
+    connections, failures = [], [ConnectionRefusedError("down")]
+
+    async def connect(dsn):
+        if len(connections) == 1 and failures:
+            raise failures.pop()
+        connections.append(FakeConnection())
+        return connections[-1]
+
+    object_id = uuid.uuid4()
+
+    async def run():
+        backend = PostgresEventBackend(
+            "postgresql://", retry_base_seconds=0, connect=connect
+        )
+        hub = EventHub(backend)
+        await hub.start()
+
+        with hub.subscribe(WORKSPACE_ID) as subscription:
+            connections[0].drop()
+            with pytest.raises(ConnectionError):
+                await backend.publish([change(uuid.uuid4())])
+
+            with pytest.raises(SlowConsumer):
+                await asyncio.wait_for(subscription.next_batch(), 1)
+
+        with hub.subscribe(WORKSPACE_ID) as subscription:
+            await backend.publish([change(object_id)])
+            batch = await subscription.next_batch()
+
+        await hub.stop()
+        return batch
+
+    batch = asyncio.run(run())
+
+    assert [event.id for event in batch] == [object_id]
+    assert failures == []
+    assert len(connections) == 2
+    assert all(connection.closed for connection in connections)
+
+
+def test_postgres_backend_sends_a_batch_in_one_statement():
+    """Test that a large batch is one statement of payloads under the limit."""
+
+    connection = FakeConnection()
+    events = [change(uuid.uuid4()) for _ in range(1000)]
+    delivered = []
+
+    async def connect(dsn):
+        return connection
+
+    async def run():
+        backend = PostgresEventBackend("postgresql://", connect=connect)
+        await backend.start(delivered.append, lambda: None)
+        await backend.publish(events)
+        await backend.stop()
+
+    asyncio.run(run())
+
+    [payloads] = connection.sent
+    assert len(payloads) > 1
+    assert all(len(payload.encode()) <= NOTIFY_MAX_BYTES for payload in payloads)
+    assert delivered == events
+
+
+def test_bulk_call_publishes_one_batch(client, auth_headers, project, monkeypatch):
+    """Test that the changes of one bulk call reach the hub together."""
+
+    batches = []
+    monkeypatch.setattr(event_hub, "publish", batches.append)
+
+    operations = [
+        {"op": "create", "task": {"project_id": str(project.id), "title": "Task"}}
+        for _ in range(50)
+    ]
+    res = client.post(
+        "/tasks/bulk", json={"operations": operations}, headers=auth_headers
+    )
+
+    assert res.json()["applied"] == 50
+    assert [len(batch) for batch in batches] == [50]
+
+
+# Endpoint tests
+
+
+def test_websocket_receives_task_changes(client, auth_headers, project):
+    """Test that a task created over HTTP reaches a workspace subscriber."""
+
+    token = auth_headers["Authorization"].split()[1]
+    url = f"/workspaces/{project.workspace_id}/events/ws?token={token}"
+
+    with client.websocket_connect(url) as websocket:
+        res = client.post(
+            "/tasks",
+            json={"project_id": str(project.id), "title": "Task"},
+            headers=auth_headers,
+        )
+        message = websocket.receive_json()
+
+    assert message["type"] == "changes"
+    assert message["events"] == [
+        {
+            "kind": "task",
+            "action": "created",
+            "id": res.json()["id"],
+            "task_id": res.json()["id"],
+        }
+    ]
+
+
+def test_websocket_rejects_non_members(client, auth_headers, project):
+    """Test that the socket closes for invalid tokens and other workspaces."""
+
+    token = auth_headers["Authorization"].split()[1]
+
+    for url in [
+        f"/workspaces/{project.workspace_id}/events/ws?token=invalid",
+        f"/workspaces/{uuid.uuid4()}/events/ws?token={token}",
+    ]:
+        with pytest.raises(WebSocketDisconnect) as exc:
+            with client.websocket_connect(url) as websocket:
+                websocket.receive_json()
+
+        assert exc.value.code == 1008
+
+
+def test_event_stream_requires_membership(client, auth_headers):
+    """Test that the SSE endpoint checks the workspace role first."""
+
+    res = client.get(f"/workspaces/{uuid.uuid4()}/events", headers=auth_headers)
+
+    assert res.status_code == 404
+
+
+def test_websocket_closes_for_removed_members(client, auth_headers, project):
+    """Test that a member removed from the workspace stops receiving changes."""
+
+    user_id, headers = register(client, "viewer")
+    members = f"/workspaces/{project.workspace_id}/members/{user_id}"
+    client.put(members, json={"role": "viewer"}, headers=auth_headers)
+
+    token = headers["Authorization"].split()[1]
+    url = f"/workspaces/{project.workspace_id}/events/ws?token={token}"
+
+    with client.websocket_connect(url) as websocket:
+        assert client.delete(members, headers=auth_headers).status_code == 204
+        assert websocket.receive_json() == {"type": "revoked"}
+
+        with pytest.raises(WebSocketDisconnect) as exc:
+            websocket.receive_json()
+
+    assert exc.value.code == 1008
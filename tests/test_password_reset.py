@@ -0,0 +1,151 @@
+"""Password reset Tests."""
+
+import asyncio
+from datetime import datetime, timedelta, timezone
+
+from sqlalchemy import func, select
+
+from app.core.config import settings
+from app.core.domain_errors import InvalidCode
+from app.jobs.reset_token_sweeper import sweep_expired_reset_tokens
+from app.models.auth.password_reset import PasswordResetToken
+from app.models.auth.user import User
+from app.services import password_reset_service
+from app.services.auth_service import get_user_by_email
+
+# Helpers
+
+
+def add_user_with_token(db_session, username, expires_at):
+    """Insert a user with a reset token expiring at `expires_at`."""
+
+    user = User(email=f"{username}@donee.com", username=username, password_hash="x")
+    db_session.add(user)
+    db_session.flush()
+
+    db_session.add(
+        PasswordResetToken(user_id=user.id, code_hash="x", expires_at=expires_at)
+    )
+    db_session.commit()
+
+
+def count_tokens(db_session):
+    """Count stored reset tokens."""
+
+    return db_session.scalar(select(func.count()).select_from(PasswordResetToken))
+
+
+# Token table tests
+
+
+def test_forgot_password_keeps_a_single_token_per_user(client, db_session):
+    """Test that a new code replaces the previous one."""
+
+    client.post(
+        "/auth/register",
+        json={
+            "email": "test@donee.com",
+            "username": "testuser",
+            "password": "12345678",
+        },
+    )
+
+    first = client.post("/auth/forgot-password", json={"email": "test@donee.com"})
+    second = client.post("/auth/forgot-password", json={"email": "test@donee.com"})
+
+    assert count_tokens(db_session) == 1
+
+    new_code = second.json()["debug_code"]
+    verify = client.post(
+        "/auth/verify-reset-code", json={"email": "test@donee.com", "code": new_code}
+    )
+    assert verify.status_code == 200
+
+    old_code = first.json()["debug_code"]
+    if old_code != new_code:
+        verify = client.post(
+            "/auth/verify-reset-code",
+            json={"email": "test@donee.com", "code": old_code},
+        )
+        assert verify.status_code == 400
+
+
+def test_sweeper_deletes_only_expired_tokens(db_session, async_session_factory):
+    """Test that the sweeper removes expired tokens in batches."""
+
+    now = datetime.now(timezone.utc)
+    for index in range(5):
+        add_user_with_token(db_session, f"expired{index}", now - timedelta(minutes=1))
+    add_user_with_token(db_session, "live", now + timedelta(minutes=10))
+
+    deleted = asyncio.run(
+        sweep_expired_reset_tokens(async_session_factory, batch_size=2)
+    )
+
+    assert deleted == 5
+    assert count_tokens(db_session) == 1
+
+
+def test_concurrent_wrong_codes_share_the_attempt_limit(
+    client, async_session_factory, monkeypatch
+):
+    """Test that parallel guesses cannot verify more codes than allowed."""
+
+    client.post(
+        "/auth/register",
+        json={"email": "test@donee.com", "username": "testuser", "password": "x" * 8},
+    )
+    code = client.post(
+        "/auth/forgot-password", json={"email": "test@donee.com"}
+    ).json()["debug_code"]
+    verified = []
+
+    async def slow_wrong_guess(code, code_hash, user_id):
+        verified.append(code)
+        await asyncio.sleep(0.05)
+        return False
+
+    monkeypatch.setattr(
+        password_reset_service, "verify_reset_code_async", slow_wrong_guess
+    )
+
+    async def guess():
+        async with async_session_factory() as db:
+            user = await get_user_by_email(db, "test@donee.com")
+            try:
+                await password_reset_service.check_reset_code(db, user.id, "000000")
+            except InvalidCode:
+                return False
+            return True
+
+    async def run():
+        return await asyncio.gather(*(guess() for _ in range(20)))
+
+    assert not any(asyncio.run(run()))
+    assert len(verified) == settings.RESET_CODE_MAX_ATTEMPTS
+
+    monkeypatch.undo()
+    res = client.post(
+        "/auth/verify-reset-code", json={"email": "test@donee.com", "code": code}
+    )
+    assert res.status_code == 400
+
+
+def test_correct_codes_give_their_attempt_back(client, db_session):
+    """Test that verifying then redeeming a code does not use up attempts."""
+
+    client.post(
+        "/auth/register",
+        json={"email": "test@donee.com", "username": "testuser", "password": "x" * 8},
+    )
+    code = client.post(
+        "/auth/forgot-password", json={"email": "test@donee.com"}
+    ).json()["debug_code"]
+
+    for _ in range(settings.RESET_CODE_MAX_ATTEMPTS + 1):
+        res = client.post(
+            "/auth/verify-reset-code", json={"email": "test@donee.com", "code": code}
+        )
+        assert res.status_code == 200
+
+    assert db_session.scalar(select(PasswordResetToken.attempts)) == 0
@@ -0,0 +1,112 @@
+"""Principal cache Tests."""
+
+from uuid import uuid4
+
+from app.core.principal_cache import PrincipalCache, principal_cache
+from app.schemas.user import Principal
+
+# Helpers
+
+
+def make_principal(username="testuser"):
+    """Build a principal with a fresh id."""
+
+    return Principal(
+        id=uuid4(), email=f"{username}@donee.com", username=username, is_active=True
+    )
+
+
+class FakeClock:
+    """Manually advanced monotonic clock."""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+# Cache tests
+
+
+def test_cache_counts_hits_and_misses():
+    """Test that lookups update the hit and miss counters."""
+
+    cache = PrincipalCache(max_size=10, ttl_seconds=60)
+    principal = make_principal()
+
+    assert cache.get(principal.id) is None
+    cache.set(principal)
+    assert cache.get(principal.id) == principal
+
+    assert cache.hits == 1
+    assert cache.misses == 1
+
+
+def test_cache_expires_entries_after_ttl():
+    """Test that entries are dropped once their TTL has elapsed."""
+
+    clock = FakeClock()
+    cache = PrincipalCache(max_size=10, ttl_seconds=30, clock=clock)
+    principal = make_principal()
+    cache.set(principal)
+
+    clock.now = 29
+    assert cache.get(principal.id) == principal
+
+    clock.now = 30
+    assert cache.get(principal.id) is None
+    assert len(cache) == 0
+
+
+def test_cache_evicts_least_recently_used():
+    """Test that the size limit evicts the least recently used entry."""
+
+    cache = PrincipalCache(max_size=2, ttl_seconds=60)
+    first, second, third = make_principal("a"), make_principal("b"), make_principal("c")
+
+    cache.set(first)
+    cache.set(second)
+    cache.get(first.id)
+    cache.set(third)
+
+    assert cache.get(second.id) is None
+    assert cache.get(first.id) == first
+    assert cache.get(third.id) == third
+
+
+def test_invalidate_drops_entry_and_stale_loads():
+    """Test that invalidation removes the entry and rejects older loads."""
+
+    cache = PrincipalCache(max_size=10, ttl_seconds=60)
+    principal = make_principal()
+    cache.set(principal)
+
+    epoch = cache.epoch
+    cache.invalidate(principal.id)
+    cache.set(principal, epoch)
+
+    assert cache.get(principal.id) is None
+
+
+def test_me_is_served_from_cache(client):
+    """Test that repeated /auth/me calls hit the principal cache."""
+
+    client.post(
+        "/auth/register",
+        json={
+            "email": "test@donee.com",
+            "username": "testuser",
+            "password": "12345678",
+        },
+    )
+    login = client.post(
+        "/auth/login", json={"email": "test@donee.com", "password": "12345678"}
+    )
+    headers = {"Authorization": f"Bearer {login.json()['access_token']}"}
+
+    assert client.get("/auth/me", headers=headers).status_code == 200
+    assert client.get("/auth/me", headers=headers).status_code == 200
+
+    assert principal_cache.misses == 1
+    assert principal_cache.hits == 1
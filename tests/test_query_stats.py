@@ -0,0 +1,65 @@
+"""SQL statement instrumentation Tests."""
+
+import pytest
+
+from app.db.query_stats import QueryBudgetExceeded, query_budget, track_queries
+from app.models.auth.user import User
+
+# Stats tests
+
+
+def test_repeated_statements_are_n_plus_one_suspects(db_session):
+    """Test that a statement shape sent in a loop is flagged."""
+
+    with track_queries() as stats:
+        for _ in range(5):
+            db_session.query(User).filter_by(email="test@donee.com").all()
+            db_session.expire_all()
+        db_session.query(User).count()
+
+    assert stats.count == 6
+    assert stats.seconds > 0
+    assert [count for _, count in stats.suspects(threshold=5)] == [5]
+    assert stats.suspects(threshold=6) == []
+
+
+def test_query_budget_fails_when_exceeded(db_session):
+    """Test that a block over its budget raises with the repeated shapes."""
+
+    with pytest.raises(QueryBudgetExceeded, match="3 statements sent, budget 2"):
+        with query_budget(2):
+            for _ in range(3):
+                db_session.query(User).count()
+
+
+# Middleware tests
+
+
+def test_responses_report_query_headers(client, auth_headers, project):
+    """Test that sync and async routes report their statements."""
+
+    res = client.get("/tasks", headers=auth_headers)
+    assert int(res.headers["x-query-count"]) > 0
+    assert float(res.headers["x-query-time-ms"]) > 0
+    assert res.headers["x-query-suspects"] == "0"
+
+    res = client.post(
+        "/auth/login", json={"email": "test@donee.com", "password": "12345678"}
+    )
+    assert int(res.headers["x-query-count"]) > 0
+
+
+def test_task_list_query_budget(client, auth_headers, project):
+    """Test that listing tasks does not load anything per task."""
+
+    for index in range(10):
+        client.post(
+            "/tasks",
+            json={"project_id": str(project.id), "title": f"Task {index}"},
+            headers=auth_headers,
+        )
+
+    with query_budget(1):
+        res = client.get("/tasks", headers=auth_headers)
+
+    assert len(res.json()["items"]) == 10
@@ -0,0 +1,110 @@
+"""Rate limit Tests."""
+
+import asyncio
+
+from app.core.rate_limit import (
+    FakeSharedStore,
+    InMemoryRateLimitBackend,
+    SharedStoreRateLimitBackend,
+)
+
+# Helpers
+
+
+class FakeClock:
+    """Manually advanced clock."""
+
+    def __init__(self, now=0.0):
+        self.now = now
+
+    def __call__(self):
+        return self.now
+
+
+def hits(backend, count, key="key", limit=3, window_seconds=60):
+    """Send `count` hits and return the retry-after values."""
+
+    async def run():
+        return [await backend.hit(key, limit, window_seconds) for _ in range(count)]
+
+    return asyncio.run(run())
+
+
+# Backend tests
+
+
+def test_in_memory_backend_refills_over_time():
+    """Test that the token bucket rejects bursts and refills with time."""
+
+    clock = FakeClock()
+    backend = InMemoryRateLimitBackend(clock=clock)
+
+    assert hits(backend, 4) == [0, 0, 0, 20.0]
+
+    clock.now = 20
+    assert hits(backend, 1) == [0]
+
+
+def test_in_memory_pruning_keeps_each_bucket_limit():
+    """Test that pruning judges buckets by their own rate and stays bounded."""
+
+    clock = FakeClock()
+    backend = InMemoryRateLimitBackend(max_keys=3, clock=clock)
+    assert hits(backend, 1, key="strict", limit=1) == [0]
+
+    clock.now = 30
+    hits(backend, 1, key="a", limit=100, window_seconds=1)
+    hits(backend, 1, key="b", limit=100, window_seconds=1)
+    clock.now = 31
+    hits(backend, 1, key="c", limit=100, window_seconds=1)
+
+    assert list(backend._buckets) == ["strict", "c"]
+    assert hits(backend, 1, key="strict", limit=1)[0] > 0
+
+    prunes = []
+    backend = InMemoryRateLimitBackend(max_keys=100, clock=clock)
+    prune = backend._prune
+    backend._prune = lambda now: prunes.append(now) or prune(now)
+
+    for index in range(1000):
+        hits(backend, 1, key=f"ip-{index}")
+
+    assert len(backend._buckets) <= 100
+    assert len(prunes) <= 1000 // 10
+
+
+def test_shared_backend_limits_across_workers():
+    """Test that two workers sharing a store share the same budget."""
+
+    clock = FakeClock(now=600)
+    store = FakeSharedStore(clock=clock)
+    worker_a = SharedStoreRateLimitBackend(store, clock=clock)
+    worker_b = SharedStoreRateLimitBackend(store, clock=clock)
+
+    assert hits(worker_a, 2) == [0, 0]
+    assert hits(worker_b, 1) == [0]
+    assert hits(worker_b, 1) == [60]
+
+    clock.now = 720
+    assert hits(worker_a, 1) == [0]
+
+
+# Endpoint tests
+
+
+def test_login_is_limited_per_email_before_hashing(client):
+    """Test that repeated logins for one email are rejected with 429."""
+
+    payload = {"email": "nobody@donee.com", "password": "12345678"}
+
+    for _ in range(10):
+        assert client.post("/auth/login", json=payload).status_code == 401
+
+    res = client.post("/auth/login", json=payload)
+    assert res.status_code == 429
+    assert int(res.headers["Retry-After"]) > 0
+
+    other = client.post(
+        "/auth/login", json={"email": "other@donee.com", "password": "12345678"}
+    )
+    assert other.status_code == 401
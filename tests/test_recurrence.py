@@ -0,0 +1,317 @@
+"""Recurrence rule Tests."""
+
+from datetime import date, timedelta
+from itertools import islice
+
+import pytest
+
+from app.core.recurrence import (
+    RecurrenceError,
+    compile_rule,
+    iter_occurrences,
+    next_occurrences,
+    occurrences_between,
+    parse_rule,
+)
+
+# Helpers
+
+
+def expand(text, dtstart, n=10, after=None):
+    """Return the first `n` occurrences of a rule."""
+
+    return list(islice(iter_occurrences(parse_rule(text), dtstart, after), n))
+
+
+def create_task(client, headers, project, **fields):
+    """Create a task in the project and return the response."""
+
+    return client.post(
+        "/tasks",
+        json={"project_id": str(project.id), "title": "Task", **fields},
+        headers=headers,
+    )
+
+
+# Parser tests
+
+
+@pytest.mark.parametrize(
+    "text",
+    [
+        "INTERVAL=2",
+        "FREQ=HOURLY",
+        "FREQ=DAILY;INTERVAL=0",
+        "FREQ=DAILY;INTERVAL=-1",
+        "FREQ=DAILY;COUNT=3;UNTIL=20250101",
+        "FREQ=WEEKLY;BYDAY=2TU",
+        "FREQ=MONTHLY;BYDAY=6MO",
+        "FREQ=WEEKLY;BYMONTHDAY=1",
+        "FREQ=MONTHLY;BYMONTHDAY=32",
+        "FREQ=DAILY;BYSETPOS=1",
+        "FREQ=DAILY;FREQ=WEEKLY",
+        "FREQ=DAILY;UNTIL=tomorrow",
+    ],
+)
+def test_parse_rejects_unsupported_rules(text):
+    """Test that rules outside of the subset raise RecurrenceError."""
+
+    with pytest.raises(RecurrenceError):
+        parse_rule(text)
+
+
+def test_compiled_rules_are_cached():
+    """Test that a rule text is parsed once."""
+
+    compile_rule.cache_clear()
+    first = compile_rule("RRULE:FREQ=WEEKLY;BYDAY=MO,FR")
+    second = compile_rule("RRULE:FREQ=WEEKLY;BYDAY=MO,FR")
+
+    assert first is second
+    assert compile_rule.cache_info().hits == 1
+
+
+# Expansion tests
+
+
+def test_expand_daily_weekly_and_yearly():
+    """Test intervals, weekday sets and leap days."""
+
+    assert expand("FREQ=DAILY;INTERVAL=3", date(2025, 1, 30), 3) == [
+        date(2025, 1, 30),
+        date(2025, 2, 2),
+        date(2025, 2, 5),
+    ]
+    assert expand("FREQ=WEEKLY;BYDAY=MO,WE", date(2025, 1, 1), 4) == [
+        date(2025, 1, 1),
+        date(2025, 1, 6),
+        date(2025, 1, 8),
+        date(2025, 1, 13),
+    ]
+    assert expand("FREQ=YEARLY", date(2024, 2, 29), 2) == [
+        date(2024, 2, 29),
+        date(2028, 2, 29),
+    ]
+
+
+def test_expand_monthly_ordinals_and_month_days():
+    """Test nth weekdays, last weekdays and days missing from short months."""
+
+    assert expand("FREQ=MONTHLY;BYDAY=2TU", date(2025, 1, 1), 3) == [
+        date(2025, 1, 14),
+        date(2025, 2, 11),
+        date(2025, 3, 11),
+    ]
+    assert expand("FREQ=MONTHLY;BYDAY=-1FR", date(2025, 1, 1), 2) == [
+        date(2025, 1, 31),
+        date(2025, 2, 28),
+    ]
+    assert expand("FREQ=MONTHLY;BYMONTHDAY=-1", date(2025, 1, 15), 2) == [
+        date(2025, 1, 31),
+        date(2025, 2, 28),
+    ]
+    assert expand("FREQ=MONTHLY", date(2025, 1, 31), 3) == [
+        date(2025, 1, 31),
+        date(2025, 3, 31),
+        date(2025, 5, 31),
+    ]
+
+
+def test_month_days_limit_weekdays():
+    """Test that BYMONTHDAY with BYDAY keeps only the days matching both."""
+
+    assert expand("FREQ=MONTHLY;BYDAY=FR;BYMONTHDAY=13", date(2025, 1, 1), 3) == [
+        date(2025, 6, 13),
+        date(2026, 2, 13),
+        date(2026, 3, 13),
+    ]
+    assert expand(
+        "FREQ=MONTHLY;BYDAY=1MO,-1MO;BYMONTHDAY=1,-1", date(2025, 1, 1), 2
+    ) == [
+        date(2025, 3, 31),
+        date(2025, 6, 30),
+    ]
+
+
+def test_count_and_until_end_the_series():
+    """Test that COUNT counts from dtstart, even when reading after a date."""
+
+    assert len(expand("FREQ=DAILY;COUNT=5", date(2025, 1, 1), 100)) == 5
+    assert expand("FREQ=DAILY;COUNT=5", date(2025, 1, 1), 100, date(2025, 1, 4)) == [
+        date(2025, 1, 4),
+        date(2025, 1, 5),
+    ]
+    assert expand("FREQ=WEEKLY;UNTIL=20250115", date(2025, 1, 1), 100) == [
+        date(2025, 1, 1),
+        date(2025, 1, 8),
+        date(2025, 1, 15),
+    ]
+
+
+def test_window_far_from_dtstart_is_skipped_to():
+    """Test that a window centuries after dtstart is reached without walking."""
+
+    rule = parse_rule("FREQ=DAILY;INTERVAL=2")
+    days = occurrences_between(
+        rule, date(1900, 1, 1), date(2400, 1, 1), date(2400, 1, 10), limit=100
+    )
+
+    assert days[0] >= date(2400, 1, 1)
+    assert all((day - date(1900, 1, 1)).days % 2 == 0 for day in days)
+    assert len(days) == 5
+
+
+def test_rules_matching_nothing_stop():
+    """Test that a rule with no occurrence does not loop forever."""
+
+    assert expand("FREQ=DAILY;INTERVAL=7;BYDAY=TU", date(2025, 1, 1)) == []
+
+
+def test_series_stop_at_the_last_date():
+    """Test that series running past date.max end instead of raising."""
+
+    assert expand("FREQ=DAILY", date(9999, 12, 30)) == [
+        date(9999, 12, 30),
+        date(9999, 12, 31),
+    ]
+    rule = parse_rule("FREQ=MONTHLY;INTERVAL=996;BYDAY=5MO")
+    assert 0 < len(list(iter_occurrences(rule, date(2025, 1, 1)))) < 100
+    assert expand("FREQ=YEARLY", date(9999, 1, 1)) == [date(9999, 1, 1)]
+
+
+def test_next_occurrences_are_bounded():
+    """Test that only the next N instances are materialized."""
+
+    days = next_occurrences("FREQ=DAILY", date(2025, 1, 1), date(2025, 6, 1), 3)
+
+    assert days == (date(2025, 6, 1), date(2025, 6, 2), date(2025, 6, 3))
+
+
+# Endpoint tests
+
+
+def test_invalid_rules_are_rejected(client, auth_headers, project):
+    """Test that create, update and bulk validate recurrence rules."""
+
+    res = create_task(client, auth_headers, project, recurrence_rule="FREQ=HOURLY")
+    assert res.status_code == 400
+
+    task_id = create_task(client, auth_headers, project).json()["id"]
+    res = client.patch(
+        f"/tasks/{task_id}",
+        json={"recurrence_rule": "FREQ=DAILY;COUNT=0"},
+        headers=auth_headers,
+    )
+    assert res.status_code == 400
+
+    res = client.post(
+        "/tasks/bulk",
+        json={
+            "operations": [
+                {
+                    "op": "update",
+                    "id": task_id,
+                    "changes": {"recurrence_rule": "nonsense"},
+                }
+            ]
+        },
+        headers=auth_headers,
+    )
+    assert "recurrence" in res.json()["results"][0]["error"]
+
+
+def test_list_includes_next_occurrences(client, auth_headers, project):
+    """Test that recurring tasks list their next occurrences from today."""
+
+    today = date.today()
+    create_task(
+        client,
+        auth_headers,
+        project,
+        recurrence_rule="FREQ=DAILY",
+        due_at=(today - timedelta(days=30)).isoformat(),
+    )
+    create_task(client, auth_headers, project)
+
+    items = client.get("/tasks", headers=auth_headers).json()["items"]
+
+    assert items[0]["next_occurrences"] == [
+        (today + timedelta(days=offset)).isoformat() for offset in range(5)
+    ]
+    assert items[1]["next_occurrences"] == []
+
+
+def test_every_task_endpoint_includes_next_occurrences(client, auth_headers, project):
+    """Test that a recurring task reads the same on every endpoint."""
+
+    today = date.today()
+    expected = [(today + timedelta(days=offset)).isoformat() for offset in range(5)]
+
+    parent = create_task(
+        client, auth_headers, project, recurrence_rule="FREQ=DAILY"
+    ).json()
+    assert parent["next_occurrences"] == expected
+
+    child = create_task(client, auth_headers, project, parent_task_id=parent["id"])
+    child_id = child.json()["id"]
+
+    read = client.get(f"/tasks/{parent['id']}", headers=auth_headers)
+    updated = client.patch(
+        f"/tasks/{parent['id']}", json={"title": "Daily"}, headers=auth_headers
+    )
+    ancestors = client.get(f"/tasks/{child_id}/ancestors", headers=auth_headers)
+    tree = client.get(f"/tasks/{parent['id']}/tree", headers=auth_headers)
+
+    assert read.json()["next_occurrences"] == expected
+    assert updated.json()["next_occurrences"] == expected
+    assert ancestors.json()[0]["next_occurrences"] == expected
+    assert tree.json()["next_occurrences"] == expected
+    assert tree.json()["children"][0]["next_occurrences"] == []
+
+
+def test_list_survives_series_ending_at_the_last_date(client, auth_headers, project):
+    """Test that a task recurring near date.max does not break the list."""
+
+    create_task(
+        client, auth_headers, project, recurrence_rule="FREQ=DAILY", due_at="9999-12-30"
+    )
+
+    res = client.get("/tasks", headers=auth_headers)
+
+    assert res.status_code == 200
+    assert res.json()["items"][0]["next_occurrences"] == ["9999-12-30", "9999-12-31"]
+
+
+def test_calendar_expands_within_window(client, auth_headers, project):
+    """Test that the calendar mixes one-off due dates and bounded recurrences."""
+
+    create_task(
+        client,
+        auth_headers,
+        project,
+        title="Weekly",
+        recurrence_rule="FREQ=WEEKLY;BYDAY=MO",
+        due_at="2020-01-06",
+    )
+    create_task(client, auth_headers, project, title="Once", due_at="2025-03-05")
+    create_task(client, auth_headers, project, title="Later", due_at="2025-05-01")
+
+    res = client.get(
+        "/tasks/calendar",
+        params={"start": "2025-03-01", "end": "2025-03-17"},
+        headers=auth_headers,
+    )
+    assert res.status_code == 200
+    assert [(entry["title"], entry["occurs_on"]) for entry in res.json()] == [
+        ("Weekly", "2025-03-03"),
+        ("Once", "2025-03-05"),
+        ("Weekly", "2025-03-10"),
+        ("Weekly", "2025-03-17"),
+    ]
+
+    res = client.get(
+        "/tasks/calendar",
+        params={"start": "2025-01-01", "end": "2025-12-31"},
+        headers=auth_headers,
+    )
+    assert res.status_code == 400
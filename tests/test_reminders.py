@@ -0,0 +1,167 @@
+"""Reminder dispatch Tests."""
+
+import asyncio
+from datetime import datetime, timedelta, timezone
+
+from sqlalchemy import select
+
+from app.core.clock import normalize_utc
+from app.core.config import settings
+from app.core.notifications import InMemoryChannel
+from app.jobs.reminder_dispatcher import DispatchMetrics, dispatch_reminders
+from app.models.task.reminder import Reminder
+from app.models.task.task import Task
+
+NOW = datetime(2026, 1, 1, 12, 0, tzinfo=timezone.utc)
+
+# Helpers
+
+
+class FailingChannel:
+    """Channel whose deliveries always fail."""
+
+    async def send(self, message) -> None:
+        raise ConnectionError("Channel is down.")
+
+
+def add_reminders(db_session, project, offsets, channel="inapp"):
+    """Add one task with a reminder `offset` minutes from NOW for each offset."""
+
+    task = Task(project_id=project.id, created_by=project.workspace.owner_id, title="t")
+    db_session.add(task)
+    db_session.flush()
+
+    reminders = [
+        Reminder(
+            task_id=task.id,
+            remind_at=NOW + timedelta(minutes=offset),
+            channel=channel,
+        )
+        for offset in offsets
+    ]
+    db_session.add_all(reminders)
+    db_session.commit()
+
+    return [reminder.id for reminder in reminders]
+
+
+def statuses(db_session):
+    """Map reminder ids to their status."""
+
+    db_session.expire_all()
+    return dict(db_session.execute(select(Reminder.id, Reminder.status)).all())
+
+
+def channels():
+    """Fresh in-memory channels for every reminder channel."""
+
+    return {name: InMemoryChannel() for name in ("inapp", "email", "push")}
+
+
+# Dispatch tests
+
+
+def test_dispatch_sends_due_reminders_only(db_session, async_session_factory, project):
+    """Test that due reminders are delivered through their channel and marked."""
+
+    due = add_reminders(db_session, project, [-30, -5], channel="email")
+    later = add_reminders(db_session, project, [10])
+    backends = channels()
+    metrics = DispatchMetrics()
+
+    sent = asyncio.run(
+        dispatch_reminders(
+            async_session_factory, backends, metrics=metrics, clock=lambda: NOW
+        )
+    )
+
+    assert sent == 2
+    assert {message.id for message in backends["email"].sent} == set(due)
+    assert backends["inapp"].sent == []
+    assert statuses(db_session) == {due[0]: "sent", due[1]: "sent", later[0]: "pending"}
+    assert metrics.last_lag_seconds == 30 * 60
+    assert metrics.pending_lag_seconds == 0
+
+
+def test_failed_deliveries_back_off(db_session, async_session_factory, project):
+    """Test that failing reminders are retried later without blocking newer ones."""
+
+    failed_ids = add_reminders(db_session, project, [-3], channel="push")
+    sent_ids = add_reminders(db_session, project, [-2, -1])
+    backends = {**channels(), "push": FailingChannel()}
+    metrics = DispatchMetrics()
+
+    sent = asyncio.run(
+        dispatch_reminders(
+            async_session_factory,
+            backends,
+            batch_size=1,
+            metrics=metrics,
+            clock=lambda: NOW,
+        )
+    )
+
+    assert sent == 2
+    assert metrics.failed == 1
+    assert metrics.pending_lag_seconds == 0
+    assert statuses(db_session) == {
+        failed_ids[0]: "pending",
+        sent_ids[0]: "sent",
+        sent_ids[1]: "sent",
+    }
+
+    failed = db_session.get(Reminder, failed_ids[0])
+    assert failed.attempts == 1
+    assert normalize_utc(failed.next_attempt_at) == NOW + timedelta(
+        seconds=settings.REMINDER_RETRY_BASE_SECONDS
+    )
+
+
+def test_reminders_fail_after_the_last_attempt(
+    db_session, async_session_factory, project, monkeypatch
+):
+    """Test that a reminder stops being claimed once its attempts run out."""
+
+    monkeypatch.setattr(settings, "REMINDER_MAX_ATTEMPTS", 2)
+    monkeypatch.setattr(settings, "REMINDER_RETRY_BASE_SECONDS", 60)
+    ids = add_reminders(db_session, project, [-1], channel="push")
+    backends = {**channels(), "push": FailingChannel()}
+
+    for minutes in (0, 1, 2):
+        now = NOW + timedelta(minutes=minutes)
+        asyncio.run(
+            dispatch_reminders(
+                async_session_factory, backends, clock=lambda now=now: now
+            )
+        )
+
+    assert statuses(db_session) == {ids[0]: "failed"}
+    assert db_session.get(Reminder, ids[0]).attempts == 2
+
+
+def test_concurrent_dispatchers_never_double_send(
+    db_session, async_session_factory, project
+):
+    """Test that parallel dispatchers split the due reminders between them."""
+
+    ids = add_reminders(db_session, project, range(-25, 0))
+    backend = InMemoryChannel()
+
+    async def run_dispatchers():
+        return await asyncio.gather(
+            *(
+                dispatch_reminders(
+                    async_session_factory,
+                    {"inapp": backend},
+                    batch_size=4,
+                    clock=lambda: NOW,
+                )
+                for _ in range(3)
+            )
+        )
+
+    totals = asyncio.run(run_dispatchers())
+
+    delivered = [message.id for message in backend.sent]
+    assert sum(totals) == len(ids)
+    assert sorted(delivered) == sorted(ids)
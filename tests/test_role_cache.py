@@ -0,0 +1,73 @@
+"""Role cache Tests."""
+
+from uuid import uuid4
+
+from app.core.role_cache import RoleCache
+
+# Helpers
+
+
+class FakeClock:
+    """Manually advanced monotonic clock."""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+# Cache tests
+
+
+def test_cache_serves_roles_and_non_members():
+    """Test that roles and missing memberships are both cached."""
+
+    cache = RoleCache(max_size=10, ttl_seconds=60)
+    user_id, member_of, outside = uuid4(), uuid4(), uuid4()
+
+    found, missing = cache.get_many(user_id, [member_of, outside])
+    assert found == {}
+    assert sorted(missing) == sorted([member_of, outside])
+
+    versions = cache.versions(missing)
+    cache.set_many(user_id, {member_of: "admin", outside: None}, versions)
+
+    found, missing = cache.get_many(user_id, [member_of, outside])
+    assert found == {member_of: "admin", outside: None}
+    assert missing == []
+    assert (cache.hits, cache.misses) == (2, 2)
+
+
+def test_invalidation_outdates_entries_and_stale_loads():
+    """Test that a membership change drops entries and loads racing with it."""
+
+    cache = RoleCache(max_size=10, ttl_seconds=60)
+    user_id, workspace_id = uuid4(), uuid4()
+
+    cache.set_many(user_id, {workspace_id: "member"}, cache.versions([workspace_id]))
+    cache.invalidate_workspace(workspace_id)
+    assert cache.get_many(user_id, [workspace_id]) == ({}, [workspace_id])
+
+    versions = cache.versions([workspace_id])
+    cache.invalidate_workspace(workspace_id)
+    cache.set_many(user_id, {workspace_id: "member"}, versions)
+    assert cache.get_many(user_id, [workspace_id]) == ({}, [workspace_id])
+
+
+def test_cache_expires_and_evicts():
+    """Test TTL expiry and LRU eviction."""
+
+    clock = FakeClock()
+    cache = RoleCache(max_size=2, ttl_seconds=30, clock=clock)
+    user_id = uuid4()
+    first, second, third = uuid4(), uuid4(), uuid4()
+
+    for workspace_id in (first, second, third):
+        cache.set_many(user_id, {workspace_id: "viewer"}, {workspace_id: 0})
+
+    assert len(cache) == 2
+    assert cache.get_many(user_id, [first])[1] == [first]
+
+    clock.now = 31
+    assert cache.get_many(user_id, [third])[1] == [third]
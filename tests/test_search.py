@@ -0,0 +1,216 @@
+"""Search Tests."""
+
+from uuid import uuid4
+
+from sqlalchemy import select
+from sqlalchemy.dialects import postgresql
+
+from app.models.project.project import Project
+from app.models.task.task import Task
+from app.models.workspace.workspace import Workspace
+from app.services.search_service import (
+    HIGHLIGHT_START,
+    HIGHLIGHT_STOP,
+    select_page,
+    select_postgres_hits,
+    to_html,
+    with_headlines,
+)
+
+# Helpers
+
+
+def create_task(client, headers, project, title, description=None):
+    """Create a task in the test project and return its id."""
+
+    res = client.post(
+        "/tasks",
+        json={
+            "project_id": str(project.id),
+            "title": title,
+            "description": description,
+        },
+        headers=headers,
+    )
+    return res.json()["id"]
+
+
+def search(client, headers, project, q, **params):
+    """Search the workspace of the test project."""
+
+    return client.get(
+        "/search",
+        params={"workspace_id": str(project.workspace_id), "q": q, **params},
+        headers=headers,
+    )
+
+
+# Search tests
+
+
+def test_search_ranks_and_highlights_tasks_and_comments(client, auth_headers, project):
+    """Test that titles, descriptions and comments are matched and ranked."""
+
+    in_title = create_task(client, auth_headers, project, "Invoice the client")
+    in_description = create_task(
+        client, auth_headers, project, "Monthly chores", "Send the invoice by Friday"
+    )
+    create_task(client, auth_headers, project, "Unrelated")
+    client.post(
+        f"/tasks/{in_description}/comments",
+        json={"body": "The invoice went out late"},
+        headers=auth_headers,
+    )
+
+    res = search(client, auth_headers, project, "invoice")
+    assert res.status_code == 200
+    items = res.json()["items"]
+
+    hits = {(item["kind"], item["task_id"]): item for item in items}
+    assert (items[0]["kind"], items[0]["task_id"]) == ("task", in_title)
+    assert set(hits) == {
+        ("task", in_title),
+        ("task", in_description),
+        ("comment", in_description),
+    }
+    assert [item["rank"] for item in items] == sorted(
+        (item["rank"] for item in items), reverse=True
+    )
+    assert items[0]["title"] == "<mark>Invoice</mark> the client"
+    assert "<mark>invoice</mark>" in hits[("task", in_description)]["snippet"]
+    assert hits[("comment", in_description)]["title"] == "Monthly chores"
+
+    plain = search(client, auth_headers, project, "invoice", highlight=False).json()
+    assert plain["items"][0]["title"] == "Invoice the client"
+    assert plain["items"][0]["snippet"] is None
+
+
+def test_search_is_scoped_and_follows_writes(client, auth_headers, project, db_session):
+    """Test that deleted, renamed and foreign tasks drop out of the results."""
+
+    other_workspace = Workspace(owner_id=project.workspace.owner_id, name="Other")
+    db_session.add(other_workspace)
+    db_session.flush()
+    other_project = Project(workspace_id=other_workspace.id, name="Other")
+    db_session.add(other_project)
+    db_session.flush()
+    db_session.add(
+        Task(
+            project_id=other_project.id,
+            created_by=project.workspace.owner_id,
+            title="Budget elsewhere",
+        )
+    )
+    db_session.commit()
+
+    renamed = create_task(client, auth_headers, project, "Budget review")
+    deleted = create_task(client, auth_headers, project, "Budget draft")
+    client.delete(f"/tasks/{deleted}", headers=auth_headers)
+
+    items = search(client, auth_headers, project, "budget").json()["items"]
+    assert [item["id"] for item in items] == [renamed]
+
+    client.patch(f"/tasks/{renamed}", json={"title": "Roadmap"}, headers=auth_headers)
+    assert search(client, auth_headers, project, "budget").json()["items"] == []
+    assert len(search(client, auth_headers, project, "roadmap").json()["items"]) == 1
+
+
+def test_search_pages_with_cursor(client, auth_headers, project):
+    """Test that ranked pages return every hit once."""
+
+    ids = {
+        create_task(client, auth_headers, project, f"Release {index}")
+        for index in range(5)
+    }
+
+    seen, cursor = [], None
+    while True:
+        params = {"limit": 2, **({"cursor": cursor} if cursor else {})}
+        page = search(client, auth_headers, project, "release", **params).json()
+        seen.extend(item["id"] for item in page["items"])
+        cursor = page["next_cursor"]
+        if cursor is None:
+            break
+
+    assert len(seen) == len(ids)
+    assert set(seen) == ids
+
+
+def test_search_needs_workspace_membership(client, auth_headers, project):
+    """Test that unknown workspaces are not searchable."""
+
+    res = client.get(
+        "/search",
+        params={"workspace_id": str(uuid4()), "q": "anything"},
+        headers=auth_headers,
+    )
+    assert res.status_code == 404
+
+    punctuation = search(client, auth_headers, project, "***")
+    assert punctuation.json() == {"items": [], "next_cursor": None}
+
+
+def test_search_escapes_highlighted_text(client, auth_headers, project):
+    """Test that stored markup is escaped and only matches are marked."""
+
+    task_id = create_task(
+        client,
+        auth_headers,
+        project,
+        "Invoice <img src=x onerror=alert(1)>",
+        "<script>alert(1)</script> invoice",
+    )
+    client.post(
+        f"/tasks/{task_id}/comments",
+        json={"body": "<b>invoice</b>"},
+        headers=auth_headers,
+    )
+
+    items = search(client, auth_headers, project, "invoice").json()["items"]
+    hits = {item["kind"]: item for item in items}
+
+    assert hits["task"]["title"] == (
+        "<mark>Invoice</mark> &lt;img src=x onerror=alert(1)&gt;"
+    )
+    assert "&lt;script&gt;" in hits["task"]["snippet"]
+    assert "<script>" not in hits["task"]["snippet"]
+    assert hits["comment"]["title"] == "Invoice &lt;img src=x onerror=alert(1)&gt;"
+    assert hits["comment"]["snippet"] == "&lt;b&gt;<mark>invoice</mark>&lt;/b&gt;"
+
+    plain = search(client, auth_headers, project, "invoice", highlight=False).json()
+    assert plain["items"][0]["title"] == "Invoice <img src=x onerror=alert(1)>"
+
+
+def test_stored_markers_cannot_open_tags():
+    """Test that escaping leaves only marker pairs as markup."""
+
+    marked = f"{HIGHLIGHT_START}a&b{HIGHLIGHT_STOP} <mark>"
+    assert to_html(marked) == "<mark>a&amp;b</mark> &lt;mark&gt;"
+    assert to_html(None) is None
+
+
+def test_postgres_search_uses_the_indexes_and_markers():
+    """Test the tsvector statement, Postgres is not needed to compile it."""
+
+    project_ids = select(Project.id).where(Project.workspace_id == uuid4())
+    page = select_page(select_postgres_hits(project_ids, "invoice"), None, 20)
+    stmt = with_headlines(page, "invoice", highlight=True).compile(
+        dialect=postgresql.dialect()
+    )
+    sql = str(stmt)
+
+    assert "tasks.search_vector @@ websearch_to_tsquery('english'::regconfig" in sql
+    assert "comments.search_vector @@ websearch_to_tsquery(" in sql
+    assert sql.count("ts_headline(") == 2
+    assert sql.count("ts_rank_cd(") == 2
+    assert "LIMIT" in sql
+    assert f'StartSel="{HIGHLIGHT_START}", StopSel="{HIGHLIGHT_STOP}"' in " ".join(
+        str(value) for value in stmt.params.values()
+    )
+
+    plain = str(
+        with_headlines(page, "invoice", highlight=False).compile(
+            dialect=postgresql.dialect()
+        )
+    )
+    assert "ts_headline" not in plain
@@ -0,0 +1,65 @@
+"""Security Tests."""
+
+import threading
+from uuid import uuid4
+
+import pytest
+
+from app.core.domain_errors import ServiceBusy
+from app.core.security import (
+    RESET_CODE_SCHEME,
+    HashingExecutor,
+    hash_reset_code,
+    pwd_context,
+    verify_reset_code,
+)
+
+
+def test_hashing_executor_rejects_when_queue_is_full():
+    """Test that a full hashing queue raises ServiceBusy instead of waiting."""
+
+    executor = HashingExecutor(kind="thread", max_workers=1, max_pending=1)
+    release = threading.Event()
+
+    try:
+        first = executor.submit(release.wait)
+
+        with pytest.raises(ServiceBusy):
+            executor.submit(release.wait)
+
+        release.set()
+        first.result(timeout=5)
+
+        assert executor.submit(len, "free slot").result(timeout=5) == 9
+    finally:
+        release.set()
+        executor.shutdown()
+
+
+def test_hashing_executor_rejects_unknown_kind():
+    """Test that only process and thread pools are accepted."""
+
+    with pytest.raises(ValueError):
+        HashingExecutor(kind="fiber", max_workers=1, max_pending=1)
+
+
+def test_reset_code_hash_is_keyed_and_bound_to_user():
+    """Test that reset code hashes use the keyed scheme and the user id."""
+
+    user_id, other_id = uuid4(), uuid4()
+    hashed = hash_reset_code("123456", user_id)
+
+    assert hashed.startswith(RESET_CODE_SCHEME)
+    assert verify_reset_code("123456", hashed, user_id)
+    assert not verify_reset_code("654321", hashed, user_id)
+    assert not verify_reset_code("123456", hashed, other_id)
+
+
+def test_legacy_argon2_reset_code_hash_still_verifies():
+    """Test that rows hashed before the keyed scheme keep working."""
+
+    user_id = uuid4()
+    legacy = pwd_context.hash("123456")
+
+    assert verify_reset_code("123456", legacy, user_id)
+    assert not verify_reset_code("654321", legacy, user_id)
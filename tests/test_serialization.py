@@ -0,0 +1,45 @@
+"""Response serialization Tests."""
+
+from app.core.responses import FastJSONResponse
+from app.main import app
+from app.models.task.task import Task
+from app.schemas.task import TaskOut
+
+# Schema tests
+
+
+def test_from_row_matches_attribute_validation(
+    client, auth_headers, project, db_session
+):
+    """Test that rows read from their dict, or expired, validate the same."""
+
+    client.post(
+        "/tasks",
+        json={"project_id": str(project.id), "title": "Task", "priority": 2},
+        headers=auth_headers,
+    )
+    task = db_session.query(Task).one()
+
+    assert TaskOut.from_row(task) == TaskOut.model_validate(task)
+
+    db_session.expire(task)
+    assert TaskOut.from_row(task, title="Other").title == "Other"
+    assert TaskOut.from_row(task) == TaskOut.model_validate(task)
+
+
+# Response tests
+
+
+def test_responses_render_with_orjson(client, auth_headers, project):
+    """Test that routes render through the fast response class."""
+
+    assert app.router.default_response_class is FastJSONResponse
+
+    res = client.post(
+        "/tasks",
+        json={"project_id": str(project.id), "title": "Ünïcode"},
+        headers=auth_headers,
+    )
+    assert res.headers["content-type"] == "application/json"
+    assert b'"title":"\xc3\x9cn\xc3\xafcode"' in res.content
+    assert res.json()["title"] == "Ünïcode"
@@ -0,0 +1,194 @@
+"""Task status count Tests."""
+
+import threading
+import time
+from uuid import UUID, uuid4
+
+from sqlalchemy import update
+
+from app.jobs.task_count_reconciler import reconcile
+from app.models.task.task import Task
+from app.models.task.task_status_count import TaskStatusCount
+from app.schemas.task import TaskBulkRequest, TaskUpdate
+from app.services import task_count_service, task_service
+from app.services.task_bulk_service import run_bulk_operations
+
+# Helpers
+
+
+def counts(client, headers, **params):
+    """Return the non zero status counts."""
+
+    res = client.get("/tasks/counts", params=params, headers=headers)
+    assert res.status_code == 200
+    return {status: count for status, count in res.json()["counts"].items() if count}
+
+
+def me(client, headers):
+    """Return the id of the logged in user."""
+
+    return client.get("/auth/me", headers=headers).json()["id"]
+
+
+# Counter tests
+
+
+def test_counts_follow_task_writes(client, auth_headers, project):
+    """Test that create, update, delete and bulk writes keep counts exact."""
+
+    user_id = me(client, auth_headers)
+    project_params = {"project_id": str(project.id)}
+
+    def create(**fields):
+        res = client.post(
+            "/tasks",
+            json={"project_id": str(project.id), "title": "Task", **fields},
+            headers=auth_headers,
+        )
+        return res.json()["id"]
+
+    first = create()
+    second = create(assignee_id=user_id)
+    create(status="blocked")
+    assert counts(client, auth_headers, **project_params) == {"to do": 2, "blocked": 1}
+    assert counts(client, auth_headers) == {"to do": 1}
+
+    client.patch(f"/tasks/{second}", json={"status": "done"}, headers=auth_headers)
+    client.patch(f"/tasks/{first}", json={"assignee_id": user_id}, headers=auth_headers)
+    client.delete(f"/tasks/{second}", headers=auth_headers)
+    assert counts(client, auth_headers, **project_params) == {"to do": 1, "blocked": 1}
+    assert counts(client, auth_headers) == {"to do": 1}
+
+    client.post(
+        "/tasks/bulk",
+        json={
+            "operations": [
+                {"op": "status", "id": first, "status": "in_progress"},
+                {"op": "create", "task": {"project_id": str(project.id), "title": "b"}},
+            ]
+        },
+        headers=auth_headers,
+    )
+    assert counts(client, auth_headers, **project_params) == {
+        "to do": 1,
+        "in_progress": 1,
+        "blocked": 1,
+    }
+    assert counts(client, auth_headers) == {"in_progress": 1}
+
+
+def test_counts_need_project_access(client, auth_headers, project):
+    """Test that the counts of unknown projects are not readable."""
+
+    res = client.get(
+        "/tasks/counts", params={"project_id": str(uuid4())}, headers=auth_headers
+    )
+    assert res.status_code == 404
+
+
+def test_reconcile_fixes_drift(
+    client, auth_headers, project, db_session, session_factory
+):
+    """Test that the reconciler repairs counters changed behind their back."""
+
+    client.post(
+        "/tasks",
+        json={"project_id": str(project.id), "title": "Task"},
+        headers=auth_headers,
+    )
+    db_session.add(
+        Task(
+            project_id=project.id,
+            created_by=project.workspace.owner_id,
+            title="Raw",
+            status="done",
+        )
+    )
+    db_session.execute(update(TaskStatusCount).values(task_count=7))
+    db_session.add(
+        TaskStatusCount(
+            scope="project", scope_id=uuid4(), status="blocked", task_count=3
+        )
+    )
+    db_session.commit()
+
+    assert reconcile(session_factory) == 3
+    assert counts(client, auth_headers, project_id=str(project.id)) == {
+        "to do": 1,
+        "done": 1,
+    }
+    assert db_session.query(TaskStatusCount).count() == 2
+    assert reconcile(session_factory) == 0
+
+
+def test_overlapping_reconcilers_correct_once(
+    client, auth_headers, project, db_session, session_factory, monkeypatch
+):
+    """Test that a reconciler started mid-run does not apply the drift again."""
+
+    client.post(
+        "/tasks",
+        json={"project_id": str(project.id), "title": "Task"},
+        headers=auth_headers,
+    )
+    db_session.execute(update(TaskStatusCount).values(task_count=5))
+    db_session.commit()
+
+    apply_count_deltas = task_count_service.apply_count_deltas
+    fixed = []
+    second = threading.Thread(target=lambda: fixed.append(reconcile(session_factory)))
+
+    def apply_while_overlapped(db, deltas):
+        if not second.is_alive():
+            second.start()
+            time.sleep(0.2)
+        apply_count_deltas(db, deltas)
+
+    monkeypatch.setattr(
+        task_count_service, "apply_count_deltas", apply_while_overlapped
+    )
+
+    fixed.append(reconcile(session_factory))
+    second.join()
+
+    assert sorted(fixed) == [0, 1]
+    assert counts(client, auth_headers, project_id=str(project.id)) == {"to do": 1}
+
+
+def test_concurrent_status_changes_keep_counts_exact(
+    client, auth_headers, project, session_factory, monkeypatch
+):
+    """Test that a write waits for the task another write is changing."""
+
+    task_id = client.post(
+        "/tasks",
+        json={"project_id": str(project.id), "title": "Task"},
+        headers=auth_headers,
+    ).json()["id"]
+    user_id = project.workspace.owner_id
+
+    def bulk_status():
+        payload = TaskBulkRequest.model_validate(
+            {"operations": [{"op": "status", "id": task_id, "status": "in_progress"}]}
+        )
+        with session_factory() as db:
+            run_bulk_operations(db, user_id, payload)
+
+    second = threading.Thread(target=bulk_status)
+    task_state = task_service.task_state
+
+    def state_while_overlapped(task):
+        if second.ident is None:
+            second.start()
+            time.sleep(0.2)
+        return task_state(task)
+
+    monkeypatch.setattr(task_service, "task_state", state_while_overlapped)
+
+    with session_factory() as db:
+        task_service.update_task(db, user_id, UUID(task_id), TaskUpdate(status="done"))
+    second.join()
+
+    assert counts(client, auth_headers, project_id=str(project.id)) == {
+        "in_progress": 1
+    }
@@ -0,0 +1,123 @@
+"""Soft deleted task purge Tests."""
+
+import asyncio
+from datetime import datetime, timedelta, timezone
+from uuid import UUID, uuid4
+
+from sqlalchemy import select, update
+
+from app.jobs.task_purger import purge_tasks
+from app.models.tag.tag import Tag
+from app.models.task.attachment import Attachment
+from app.models.task.comment import Comment
+from app.models.task.reminder import Reminder
+from app.models.task.task import Task
+from app.models.task.task_tag import TaskTag
+from app.services.task_service import select_tasks_for_user
+
+# Helpers
+
+
+def create_task(client, headers, project, **fields):
+    """Create a task in the project and return its id."""
+
+    res = client.post(
+        "/tasks",
+        json={"project_id": str(project.id), "title": "Task", **fields},
+        headers=headers,
+    )
+    return UUID(res.json()["id"])
+
+
+def query_plan(db_session, stmt) -> list[str]:
+    """Return the details of the SQLite query plan of a statement."""
+
+    compiled = stmt.compile(dialect=db_session.get_bind().dialect)
+    plan = (
+        db_session.connection()
+        .exec_driver_sql(
+            f"EXPLAIN QUERY PLAN {compiled}", (None,) * len(compiled.positiontup)
+        )
+        .all()
+    )
+    return [row[-1] for row in plan]
+
+
+# Partial index tests
+
+
+def test_live_task_lists_read_the_partial_indexes(db_session):
+    """Test that live task queries match the partial index predicate."""
+
+    stmt = (
+        select_tasks_for_user(uuid4())
+        .where(Task.project_id == uuid4())
+        .order_by(Task.created_at, Task.id)
+    )
+    details = [detail for detail in query_plan(db_session, stmt) if "tasks" in detail]
+
+    assert any("idx_tasks_project_id" in detail for detail in details)
+
+
+# Purge tests
+
+
+def test_purge_removes_old_deleted_tasks_and_their_rows(
+    client, auth_headers, project, db_session, session_factory
+):
+    """Test that the purge hard deletes old soft deleted tasks in batches."""
+
+    owner_id = project.workspace.owner_id
+    tag = Tag(workspace_id=project.workspace_id, name="tag", color="#000000")
+    db_session.add(tag)
+    db_session.commit()
+
+    old_ids = [create_task(client, auth_headers, project) for _ in range(3)]
+    recent_id = create_task(client, auth_headers, project)
+    live_id = create_task(client, auth_headers, project)
+    parent_id = create_task(client, auth_headers, project)
+    create_task(client, auth_headers, project, parent_task_id=str(parent_id))
+
+    for task_id in old_ids:
+        db_session.add_all(
+            [
+                Comment(task_id=task_id, author_id=owner_id, body="note"),
+                Attachment(
+                    task_id=task_id,
+                    uploader_id=owner_id,
+                    filename="a.txt",
+                    storage_key="ab/cd/abcd",
+                    content_type="text/plain",
+                    size_bytes=1,
+                ),
+                Reminder(
+                    task_id=task_id,
+                    remind_at=datetime.now(timezone.utc),
+                    channel="email",
+                ),
+                TaskTag(task_id=task_id, tag_id=tag.id),
+            ]
+        )
+    db_session.commit()
+
+    for task_id in [*old_ids, recent_id, parent_id]:
+        client.delete(f"/tasks/{task_id}", headers=auth_headers)
+
+    long_ago = datetime.now(timezone.utc) - timedelta(days=60)
+    db_session.execute(
+        update(Task)
+        .where(Task.id.in_([*old_ids, parent_id]))
+        .values(deleted_at=long_ago)
+    )
+    db_session.commit()
+
+    purged = asyncio.run(
+        purge_tasks(session_factory, retention_days=30, batch_size=2, pause_seconds=0)
+    )
+
+    assert purged == 3
+    remaining = set(db_session.scalars(select(Task.id)))
+    assert recent_id in remaining and live_id in remaining and parent_id in remaining
+    assert not remaining & set(old_ids)
+    for model in (Comment, Attachment, Reminder, TaskTag):
+        assert db_session.query(model).count() == 0
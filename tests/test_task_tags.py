@@ -0,0 +1,103 @@
+"""Task tag filter Tests."""
+
+from uuid import uuid4
+
+from sqlalchemy import select
+
+from app.models.tag.tag import Tag
+from app.models.task.task import Task
+from app.models.task.task_tag import TaskTag
+from app.services.task_service import filter_by_tags
+
+# Helpers
+
+
+def tag_tasks(db_session, project, tagging):
+    """Create tags and tasks, `tagging` maps task titles to tag names."""
+
+    names = {name for tag_names in tagging.values() for name in tag_names}
+    tags = {
+        name: Tag(workspace_id=project.workspace_id, name=name, color="#000000")
+        for name in names
+    }
+    tasks = {
+        title: Task(
+            project_id=project.id, created_by=project.workspace.owner_id, title=title
+        )
+        for title in tagging
+    }
+    db_session.add_all([*tags.values(), *tasks.values()])
+    db_session.flush()
+
+    db_session.add_all(
+        TaskTag(task_id=tasks[title].id, tag_id=tags[name].id)
+        for title, tag_names in tagging.items()
+        for name in tag_names
+    )
+    db_session.commit()
+
+    return {name: str(tag.id) for name, tag in tags.items()}
+
+
+def titles(client, headers, **params):
+    """List the titles of the tasks matching a tag filter."""
+
+    res = client.get("/tasks", params=params, headers=headers)
+    assert res.status_code == 200
+    return sorted(item["title"] for item in res.json()["items"])
+
+
+# Filter tests
+
+
+def test_tag_filters_combine_and_or_not(client, auth_headers, project, db_session):
+    """Test AND, OR and NOT tag filters and their combination."""
+
+    tags = tag_tasks(
+        db_session,
+        project,
+        {
+            "both": ["bug", "urgent"],
+            "bug": ["bug"],
+            "urgent": ["urgent"],
+            "docs": ["docs", "urgent"],
+            "untagged": [],
+        },
+    )
+
+    assert titles(client, auth_headers, tags_all=[tags["bug"], tags["urgent"]]) == [
+        "both"
+    ]
+    assert titles(client, auth_headers, tags_any=[tags["bug"], tags["docs"]]) == [
+        "both",
+        "bug",
+        "docs",
+    ]
+    assert titles(client, auth_headers, tags_none=[tags["bug"]]) == [
+        "docs",
+        "untagged",
+        "urgent",
+    ]
+    assert titles(
+        client, auth_headers, tags_all=[tags["urgent"]], tags_none=[tags["docs"]]
+    ) == ["both", "urgent"]
+    assert titles(client, auth_headers, tags_all=[str(uuid4())]) == []
+
+
+def test_tag_intersection_reads_the_reverse_index(db_session):
+    """Test that AND filters seek the tag_id index instead of scanning."""
+
+    stmt = filter_by_tags(select(Task.id), tags_all=[uuid4(), uuid4()])
+    compiled = stmt.compile(dialect=db_session.get_bind().dialect)
+
+    plan = (
+        db_session.connection()
+        .exec_driver_sql(
+            f"EXPLAIN QUERY PLAN {compiled}", (None,) * len(compiled.positiontup)
+        )
+        .all()
+    )
+    details = [row[-1] for row in plan if "task_tags" in row[-1]]
+
+    assert details
+    assert all("idx_task_tags_tag_id_task_id" in detail for detail in details)
@@ -0,0 +1,83 @@
+"""Task tree Tests."""
+
+from uuid import uuid4
+
+# Helpers
+
+
+def create_tree(client, headers, project):
+    """Create root -> (a -> (a1, a2), b) and return their ids."""
+
+    ids = {name: str(uuid4()) for name in ("root", "a", "a1", "a2", "b")}
+    parents = {"a": "root", "a1": "a", "a2": "a", "b": "root"}
+    operations = []
+
+    for name, task_id in ids.items():
+        task = {"project_id": str(project.id), "title": name, "estimate_minutes": 10}
+        if name in parents:
+            task["parent_task_id"] = ids[parents[name]]
+        if name == "a1":
+            task["status"] = "done"
+        operations.append({"op": "create", "id": task_id, "task": task})
+
+    res = client.post("/tasks/bulk", json={"operations": operations}, headers=headers)
+    assert res.json()["applied"] == len(ids)
+
+    return ids
+
+
+# Tree tests
+
+
+def test_tree_returns_nested_subtasks_with_rollup(client, auth_headers, project):
+    """Test that the whole subtree and its aggregates are returned."""
+
+    ids = create_tree(client, auth_headers, project)
+
+    res = client.get(
+        f"/tasks/{ids['root']}/tree", params={"rollup": True}, headers=auth_headers
+    )
+    assert res.status_code == 200
+
+    root = res.json()
+    assert root["rollup"] == {
+        "subtask_count": 4,
+        "done_count": 1,
+        "estimate_minutes": 40,
+    }
+
+    children = {child["title"]: child for child in root["children"]}
+    assert set(children) == {"a", "b"}
+    assert {child["title"] for child in children["a"]["children"]} == {"a1", "a2"}
+    assert children["a"]["children"][0]["depth"] == 2
+
+
+def test_tree_respects_depth_limit(client, auth_headers, project):
+    """Test that nodes below the depth limit are not returned."""
+
+    ids = create_tree(client, auth_headers, project)
+
+    res = client.get(
+        f"/tasks/{ids['root']}/tree", params={"depth": 1}, headers=auth_headers
+    )
+
+    children = res.json()["children"]
+    assert len(children) == 2
+    assert all(child["children"] == [] for child in children)
+
+
+def test_ancestors_are_returned_root_first(client, auth_headers, project):
+    """Test that the ancestors path goes from the root to the parent."""
+
+    ids = create_tree(client, auth_headers, project)
+
+    res = client.get(f"/tasks/{ids['a2']}/ancestors", headers=auth_headers)
+    assert res.status_code == 200
+    assert [task["title"] for task in res.json()] == ["root", "a"]
+
+
+def test_tree_of_unknown_task_is_not_found(client, auth_headers, project):
+    """Test that an invisible task has no tree."""
+
+    res = client.get(f"/tasks/{uuid4()}/tree", headers=auth_headers)
+    assert res.status_code == 404
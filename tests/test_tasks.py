@@ -0,0 +1,129 @@
+"""Task Tests."""
+
+from uuid import uuid4
+
+# Helpers
+
+
+def create_task(client, headers, project, **fields):
+    """Create a task in the test project."""
+
+    payload = {"project_id": str(project.id), "title": "Task", **fields}
+    return client.post("/tasks", json=payload, headers=headers)
+
+
+# Task tests
+
+
+def test_create_and_read_task(client, auth_headers, project):
+    """Test that a created task can be read back."""
+
+    res = create_task(client, auth_headers, project, title="Write tests")
+    assert res.status_code == 201
+
+    task = res.json()
+    assert task["status"] == "to do"
+
+    read = client.get(f"/tasks/{task['id']}", headers=auth_headers)
+    assert read.status_code == 200
+    assert read.json()["title"] == "Write tests"
+
+
+def test_create_task_fails_outside_user_projects(client, auth_headers):
+    """Test that tasks cannot be created in projects of other workspaces."""
+
+    res = client.post(
+        "/tasks",
+        json={"project_id": str(uuid4()), "title": "Task"},
+        headers=auth_headers,
+    )
+    assert res.status_code == 404
+
+
+def test_list_tasks_pages_with_cursor(client, auth_headers, project):
+    """Test that keyset pages cover every task exactly once."""
+
+    created = [
+        create_task(client, auth_headers, project, title=f"Task {index}").json()["id"]
+        for index in range(5)
+    ]
+
+    seen, cursor = [], None
+    while True:
+        params = {"project_id": str(project.id), "limit": 2}
+        if cursor:
+            params["cursor"] = cursor
+
+        res = client.get("/tasks", params=params, headers=auth_headers)
+        assert res.status_code == 200
+
+        page = res.json()
+        assert len(page["items"]) <= 2
+        seen.extend(item["id"] for item in page["items"])
+
+        cursor = page["next_cursor"]
+        if cursor is None:
+            break
+
+    assert sorted(seen) == sorted(created)
+    assert len(seen) == len(set(seen))
+
+
+def test_list_tasks_filters_by_status(client, auth_headers, project):
+    """Test that the status filter only returns matching tasks."""
+
+    create_task(client, auth_headers, project, status="blocked")
+    create_task(client, auth_headers, project)
+
+    res = client.get(
+        "/tasks",
+        params={"project_id": str(project.id), "status": "blocked"},
+        headers=auth_headers,
+    )
+    assert [item["status"] for item in res.json()["items"]] == ["blocked"]
+
+
+def test_list_tasks_rejects_bad_cursor(client, auth_headers, project):
+    """Test that a tampered cursor is rejected."""
+
+    res = client.get("/tasks", params={"cursor": "not-a-cursor"}, headers=auth_headers)
+    assert res.status_code == 400
+
+
+def test_update_task_sets_completed_at(client, auth_headers, project):
+    """Test that moving a task to done stamps its completion date."""
+
+    task = create_task(client, auth_headers, project).json()
+
+    res = client.patch(
+        f"/tasks/{task['id']}", json={"status": "done"}, headers=auth_headers
+    )
+    assert res.status_code == 200
+    assert res.json()["completed_at"] is not None
+
+
+def test_update_task_rejects_parent_cycle(client, auth_headers, project):
+    """Test that a task cannot become a subtask of its own subtask."""
+
+    parent = create_task(client, auth_headers, project).json()
+    child = create_task(
+        client, auth_headers, project, parent_task_id=parent["id"]
+    ).json()
+
+    res = client.patch(
+        f"/tasks/{parent['id']}",
+        json={"parent_task_id": child["id"]},
+        headers=auth_headers,
+    )
+    assert res.status_code == 400
+
+
+def test_delete_task_hides_it(client, auth_headers, project):
+    """Test that deleted tasks are no longer returned."""
+
+    task = create_task(client, auth_headers, project).json()
+
+    res = client.delete(f"/tasks/{task['id']}", headers=auth_headers)
+    assert res.status_code == 204
+
+    assert client.get(f"/tasks/{task['id']}", headers=auth_headers).status_code == 404
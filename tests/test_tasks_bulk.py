@@ -0,0 +1,169 @@
+"""Bulk task Tests."""
+
+from uuid import uuid4
+
+# Helpers
+
+
+def bulk(client, headers, operations):
+    """Send a batch of task operations."""
+
+    return client.post("/tasks/bulk", json={"operations": operations}, headers=headers)
+
+
+def list_tasks(client, headers, project):
+    """Return every task of the test project by id."""
+
+    res = client.get(
+        "/tasks", params={"project_id": str(project.id), "limit": 200}, headers=headers
+    )
+    return {item["id"]: item for item in res.json()["items"]}
+
+
+# Bulk tests
+
+
+def test_bulk_creates_tasks_with_parents_in_one_batch(client, auth_headers, project):
+    """Test that a batch can create a tree of tasks referencing each other."""
+
+    def create(task_id, parent_id=None):
+        task = {"project_id": str(project.id), "title": "Task"}
+        if parent_id:
+            task["parent_task_id"] = parent_id
+        return {"op": "create", "id": task_id, "task": task}
+
+    parent_id, child_id = str(uuid4()), str(uuid4())
+
+    res = bulk(client, auth_headers, [create(parent_id), create(child_id, parent_id)])
+    assert res.status_code == 200
+    assert res.json()["applied"] == 2
+
+    tasks = list_tasks(client, auth_headers, project)
+    assert tasks[child_id]["parent_task_id"] == parent_id
+
+
+def test_bulk_reports_invalid_items_and_applies_the_rest(client, auth_headers, project):
+    """Test that items are validated in order and failures are reported."""
+
+    parent_id, child_id = str(uuid4()), str(uuid4())
+    operations = [
+        {
+            "op": "create",
+            "id": child_id,
+            "task": {
+                "project_id": str(project.id),
+                "title": "Child",
+                "parent_task_id": parent_id,
+            },
+        },
+        {
+            "op": "create",
+            "id": parent_id,
+            "task": {"project_id": str(project.id), "title": "Parent"},
+        },
+        {
+            "op": "create",
+            "task": {"project_id": str(uuid4()), "title": "Elsewhere"},
+        },
+    ]
+
+    res = bulk(client, auth_headers, operations)
+    assert res.status_code == 200
+
+    body = res.json()
+    assert [item["ok"] for item in body["results"]] == [False, True, False]
+    assert body["applied"] == 1
+    assert body["failed"] == 2
+
+    tasks = list_tasks(client, auth_headers, project)
+    assert set(tasks) == {parent_id}
+
+
+def test_bulk_applies_updates_status_and_moves(client, auth_headers, project):
+    """Test that mixed operations are applied and reported per item."""
+
+    ids = [str(uuid4()) for _ in range(3)]
+    bulk(
+        client,
+        auth_headers,
+        [
+            {
+                "op": "create",
+                "id": task_id,
+                "task": {"project_id": str(project.id), "title": f"Task {index}"},
+            }
+            for index, task_id in enumerate(ids)
+        ],
+    )
+
+    res = bulk(
+        client,
+        auth_headers,
+        [
+            {"op": "update", "id": ids[0], "changes": {"title": "Renamed"}},
+            {"op": "status", "id": ids[1], "status": "done"},
+            {"op": "move", "id": ids[2], "parent_task_id": ids[0]},
+            {"op": "move", "id": ids[0], "parent_task_id": ids[2]},
+            {"op": "status", "id": str(uuid4()), "status": "done"},
+        ],
+    )
+    assert res.status_code == 200
+
+    body = res.json()
+    assert [item["ok"] for item in body["results"]] == [True, True, True, False, False]
+
+    tasks = list_tasks(client, auth_headers, project)
+    assert tasks[ids[0]]["title"] == "Renamed"
+    assert tasks[ids[0]]["parent_task_id"] is None
+    assert tasks[ids[1]]["status"] == "done"
+    assert tasks[ids[1]]["completed_at"] is not None
+    assert tasks[ids[2]]["parent_task_id"] == ids[0]
+
+
+def test_bulk_rejects_ids_of_deleted_tasks(client, auth_headers, project):
+    """Test that a create reusing a soft deleted id fails alone."""
+
+    deleted_id, new_id = str(uuid4()), str(uuid4())
+    task = {"project_id": str(project.id), "title": "Task"}
+    bulk(client, auth_headers, [{"op": "create", "id": deleted_id, "task": task}])
+    client.delete(f"/tasks/{deleted_id}", headers=auth_headers)
+
+    res = bulk(
+        client,
+        auth_headers,
+        [
+            {"op": "create", "id": deleted_id, "task": task},
+            {"op": "create", "id": new_id, "task": task},
+        ],
+    )
+    assert res.status_code == 200
+    assert [item["ok"] for item in res.json()["results"]] == [False, True]
+    assert set(list_tasks(client, auth_headers, project)) == {new_id}
+
+
+def test_bulk_detects_cycles_through_stored_ancestors(client, auth_headers, project):
+    """Test that moves are checked against the ancestors stored before."""
+
+    ids = [str(uuid4()) for _ in range(3)]
+    bulk(
+        client,
+        auth_headers,
+        [
+            {
+                "op": "create",
+                "id": task_id,
+                "task": {
+                    "project_id": str(project.id),
+                    "title": "Task",
+                    "parent_task_id": ids[index - 1] if index else None,
+                },
+            }
+            for index, task_id in enumerate(ids)
+        ],
+    )
+
+    res = bulk(
+        client, auth_headers, [{"op": "move", "id": ids[0], "parent_task_id": ids[2]}]
+    )
+
+    assert res.json()["results"][0]["error"] == "A task cannot be its own ancestor."
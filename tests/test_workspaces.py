@@ -0,0 +1,150 @@
+"""Workspace membership Tests."""
+
+from contextlib import contextmanager
+from uuid import uuid4
+
+from sqlalchemy import event
+
+from app.core.role_cache import role_cache
+from app.models.auth.user import User
+from app.services.workspace_service import check_workspace_roles
+
+# Helpers
+
+
+def register(client, username):
+    """Register and log in a user, return their id and auth headers."""
+
+    email = f"{username}@donee.com"
+    res = client.post(
+        "/auth/register",
+        json={"email": email, "username": username, "password": "12345678"},
+    )
+    token = client.post(
+        "/auth/login", json={"email": email, "password": "12345678"}
+    ).json()["access_token"]
+
+    return res.json()["id"], {"Authorization": f"Bearer {token}"}
+
+
+@contextmanager
+def recorded_queries(db_session):
+    """Record the statements run on the session engine."""
+
+    statements = []
+
+    def record(conn, cursor, statement, *args):
+        statements.append(statement)
+
+    engine = db_session.get_bind()
+    event.listen(engine, "before_cursor_execute", record)
+    try:
+        yield statements
+    finally:
+        event.remove(engine, "before_cursor_execute", record)
+
+
+# Membership tests
+
+
+def test_admins_manage_members_and_changes_apply_at_once(client, auth_headers, project):
+    """Test that role changes are enforced on the next request."""
+
+    url = f"/workspaces/{project.workspace_id}/members"
+    user_id, headers = register(client, "alice")
+
+    assert client.get(url, headers=headers).status_code == 404
+
+    res = client.put(f"{url}/{user_id}", json={"role": "member"}, headers=auth_headers)
+    assert res.status_code == 200
+    assert res.json()["role"] == "member"
+
+    assert client.get(url, headers=headers).status_code == 200
+    denied = client.put(f"{url}/{user_id}", json={"role": "admin"}, headers=headers)
+    assert denied.status_code == 403
+
+    client.put(f"{url}/{user_id}", json={"role": "admin"}, headers=auth_headers)
+    owners = client.get(url, headers=headers).json()
+    owner_id = next(item["user_id"] for item in owners if item["role"] == "owner")
+    assert client.delete(f"{url}/{owner_id}", headers=headers).status_code == 403
+
+    assert client.delete(f"{url}/{user_id}", headers=auth_headers).status_code == 204
+    assert client.get(url, headers=headers).status_code == 404
+
+
+def test_warm_role_checks_hit_the_cache(client, auth_headers, project, db_session):
+    """Test that repeated checks are served by the role cache."""
+
+    url = f"/workspaces/{project.workspace_id}/members"
+    client.get(url, headers=auth_headers)
+    hits = role_cache.hits
+
+    client.get(url, headers=auth_headers)
+    assert role_cache.hits == hits + 1
+
+
+def test_batch_role_check_uses_one_query(db_session, project):
+    """Test that many workspaces are checked with a single query."""
+
+    user_id = db_session.query(User.id).filter_by(email="test@donee.com").scalar()
+    workspace_ids = [project.workspace_id, uuid4()]
+    role_cache.clear()
+
+    with recorded_queries(db_session) as statements:
+        allowed = check_workspace_roles(db_session, user_id, workspace_ids, "admin")
+        assert allowed == dict(zip(workspace_ids, [True, False]))
+        assert len(statements) == 1
+
+        check_workspace_roles(db_session, user_id, workspace_ids, "admin")
+        assert len(statements) == 1
+
+
+def test_viewers_read_but_cannot_write_tasks(client, auth_headers, project):
+    """Test that task, comment and attachment writes need the member role."""
+
+    task = client.post(
+        "/tasks",
+        json={"project_id": str(project.id), "title": "Task"},
+        headers=auth_headers,
+    ).json()
+    comment = client.post(
+        f"/tasks/{task['id']}/comments", json={"body": "Hi"}, headers=auth_headers
+    ).json()
+    user_id, headers = register(client, "viewer")
+    client.put(
+        f"/workspaces/{project.workspace_id}/members/{user_id}",
+        json={"role": "viewer"},
+        headers=auth_headers,
+    )
+
+    assert client.get(f"/tasks/{task['id']}", headers=headers).status_code == 200
+    assert (
+        client.get(f"/tasks/{task['id']}/comments", headers=headers).status_code == 200
+    )
+
+    writes = [
+        client.post(
+            "/tasks",
+            json={"project_id": str(project.id), "title": "X"},
+            headers=headers,
+        ),
+        client.patch(f"/tasks/{task['id']}", json={"title": "X"}, headers=headers),
+        client.delete(f"/tasks/{task['id']}", headers=headers),
+        client.post(
+            f"/tasks/{task['id']}/comments", json={"body": "X"}, headers=headers
+        ),
+        client.patch(f"/comments/{comment['id']}", json={"body": "X"}, headers=headers),
+        client.post(
+            f"/tasks/{task['id']}/attachments?filename=a.txt",
+            content=b"data",
+            headers=headers,
+        ),
+    ]
+    assert [res.status_code for res in writes] == [403] * len(writes)
+
+    res = client.post(
+        "/tasks/bulk",
+        json={"operations": [{"op": "status", "id": task["id"], "status": "done"}]},
+        headers=headers,
+    )
+    assert res.json()["applied"] == 0